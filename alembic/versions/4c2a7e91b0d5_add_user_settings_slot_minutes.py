@@ -0,0 +1,31 @@
+"""add user settings slot minutes
+
+Revision ID: 4c2a7e91b0d5
+Revises: 1f6b2f8f9d3a
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2a7e91b0d5"
+down_revision: Union[str, Sequence[str], None] = "1f6b2f8f9d3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_settings",
+        sa.Column("slot_minutes", sa.Integer(), nullable=False, server_default="30"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_settings", "slot_minutes")
@@ -0,0 +1,44 @@
+"""default week planning horizon
+
+Revision ID: 5a8d2e6f9c14
+Revises: e3a9c5f17b28
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a8d2e6f9c14"
+down_revision: Union[str, Sequence[str], None] = "e3a9c5f17b28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 72 was the model default and nothing could change it, so every such row
+    # is a user who always had the fixed 7-day plan
+    op.execute("UPDATE user_settings SET default_planning_horizon_hours = 168 WHERE default_planning_horizon_hours = 72")
+    with op.batch_alter_table("user_settings") as batch_op:
+        batch_op.alter_column(
+            "default_planning_horizon_hours",
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            server_default="168",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("user_settings") as batch_op:
+        batch_op.alter_column(
+            "default_planning_horizon_hours",
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            server_default=None,
+        )
+    op.execute("UPDATE user_settings SET default_planning_horizon_hours = 72 WHERE default_planning_horizon_hours = 168")
@@ -0,0 +1,78 @@
+"""add feedback bias
+
+Revision ID: 8d3e5b1a7c42
+Revises: 4c2a7e91b0d5
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import math
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3e5b1a7c42"
+down_revision: Union[str, Sequence[str], None] = "4c2a7e91b0d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FEEDBACK_DECAY_DAYS = 14.0
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    feedback_bias = op.create_table(
+        "feedback_bias",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("weighted_sum", sa.Float(), nullable=False),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "key", name="uq_feedback_bias_user_key"),
+    )
+    op.create_index(op.f("ix_feedback_bias_user_id"), "feedback_bias", ["user_id"], unique=False)
+
+    # Backfill from the existing log, decayed to the migration time
+    now = datetime.utcnow()
+    rows = op.get_bind().execute(
+        sa.text(
+            "SELECT f.user_id, f.outcome, f.created_at, t.task_type, t.importance, t.preferred_time, t.energy "
+            "FROM feedback_logs f JOIN tasks t ON t.id = f.task_id"
+        )
+    )
+    totals: dict[tuple[int, str], list[float]] = {}
+    for user_id, outcome, created_at, task_type, importance, preferred_time, energy in rows:
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        age_days = max(0.0, (now - (created_at or now)).total_seconds() / 86400.0)
+        weight = math.exp(-age_days / FEEDBACK_DECAY_DAYS)
+        keys = (
+            "total",
+            f"type_importance:{task_type}:{importance}",
+            f"preferred_time:{preferred_time}",
+            f"energy:{energy}",
+        )
+        for key in keys:
+            entry = totals.setdefault((user_id, key), [0.0, 0.0])
+            entry[0] += outcome * weight
+            entry[1] += weight
+    if totals:
+        op.bulk_insert(
+            feedback_bias,
+            [
+                {"user_id": user_id, "key": key, "weighted_sum": total, "weight": weight, "updated_at": now}
+                for (user_id, key), (total, weight) in totals.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_feedback_bias_user_id"), table_name="feedback_bias")
+    op.drop_table("feedback_bias")
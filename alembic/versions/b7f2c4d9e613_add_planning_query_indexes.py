@@ -0,0 +1,35 @@
+"""add planning query indexes
+
+Revision ID: b7f2c4d9e613
+Revises: 8d3e5b1a7c42
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7f2c4d9e613"
+down_revision: Union[str, Sequence[str], None] = "8d3e5b1a7c42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pending/unscheduled tasks of a user in a deadline range
+    op.create_index("ix_tasks_user_status_deadline", "tasks", ["user_id", "status", "deadline"], unique=False)
+    # a user's feedback, newest first
+    op.create_index("ix_feedback_logs_user_created", "feedback_logs", ["user_id", "created_at"], unique=False)
+    # overlap check within one plan, ordered by start
+    op.create_index("ix_plan_items_plan_start", "plan_items", ["plan_id", "start_datetime"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_plan_items_plan_start", table_name="plan_items")
+    op.drop_index("ix_feedback_logs_user_created", table_name="feedback_logs")
+    op.drop_index("ix_tasks_user_status_deadline", table_name="tasks")
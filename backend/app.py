@@ -5,6 +5,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .config import settings
+from .dependencies import get_scheduler_pool, shutdown_job_queue, shutdown_scheduler_pool
+from .ml import get_table_priority_model
 from .routers import auth, tasks, planning, feedback, notes
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,22 @@ app.add_middleware(
 def log_database_url() -> None:
     logger.info("Database URL: %s", settings.database_url)
 
+@app.on_event("startup")
+def warm_table_model() -> None:
+    # build the table once here, so neither the first request nor each worker does
+    if settings.priority_model == "table":
+        get_table_priority_model()
+
+@app.on_event("startup")
+def start_scheduler_pool() -> None:
+    # start the workers before the first plan request rather than on it
+    get_scheduler_pool()
+
+@app.on_event("shutdown")
+def stop_job_queue() -> None:
+    shutdown_job_queue()
+    shutdown_scheduler_pool()
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled error")
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_minutes: int = 60 * 24 * 7
     refresh_cookie_secure: bool = Field(True, alias="REFRESH_COOKIE_SECURE")
+    local_search_budget_ms: float = Field(1000.0, alias="LOCAL_SEARCH_BUDGET_MS")
+    local_search_max_iterations: int = Field(500, alias="LOCAL_SEARCH_MAX_ITERATIONS")
+    exact_budget_ms: float = Field(70.0, alias="EXACT_BUDGET_MS")
+    plan_job_workers: int = Field(2, alias="PLAN_JOB_WORKERS")
+    plan_job_max_pending: int = Field(64, alias="PLAN_JOB_MAX_PENDING")
+    scheduler_processes: int = Field(0, alias="SCHEDULER_PROCESSES")
+    scheduler_max_pending: int = Field(8, alias="SCHEDULER_MAX_PENDING")
+    priority_model: Literal["tree", "table"] = Field("tree", alias="PRIORITY_MODEL")
 
     model_config = SettingsConfigDict(
         env_file=BASE_DIR / ".env",
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 import logging
+import threading
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
@@ -7,7 +8,10 @@ from sqlalchemy.orm import Session
 
 from .config import settings
 from .database import SessionLocal
+from .jobs import JobQueue, ThreadPoolJobQueue
 from .models import User
+from .scheduler_pool import SchedulerPool
+from .single_flight import SingleFlight
 
 security = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
@@ -31,6 +35,68 @@ def get_db():
         db.close()
 
 
+_job_queue: JobQueue | None = None
+# dependencies run on the threadpool, so two first requests can race to create the queue
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    global _job_queue
+    queue = _job_queue
+    if queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = ThreadPoolJobQueue(
+                    workers=settings.plan_job_workers,
+                    max_pending=settings.plan_job_max_pending,
+                )
+            queue = _job_queue
+    return queue
+
+
+def shutdown_job_queue() -> None:
+    global _job_queue
+    with _job_queue_lock:
+        queue, _job_queue = _job_queue, None
+    if queue is not None:
+        queue.shutdown()
+
+
+_scheduler_pool: SchedulerPool | None = None
+# a second pool would double the workers and split the admission count
+_scheduler_pool_lock = threading.Lock()
+
+
+def get_scheduler_pool() -> SchedulerPool:
+    global _scheduler_pool
+    pool = _scheduler_pool
+    if pool is None:
+        with _scheduler_pool_lock:
+            if _scheduler_pool is None:
+                _scheduler_pool = SchedulerPool(
+                    processes=settings.scheduler_processes,
+                    max_pending=settings.scheduler_max_pending,
+                    priority_model=settings.priority_model,
+                )
+            pool = _scheduler_pool
+    return pool
+
+
+def shutdown_scheduler_pool() -> None:
+    global _scheduler_pool
+    with _scheduler_pool_lock:
+        pool, _scheduler_pool = _scheduler_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+_plan_flight = SingleFlight()
+
+
+def get_plan_flight() -> SingleFlight:
+    return _plan_flight
+
+
 def _create_token(data: dict, expires_minutes: int) -> str:
     secret = _require_jwt_secret()
     to_encode = data.copy()
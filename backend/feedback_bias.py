@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import models
+from .ml.scheduler import _bias_from_totals, feedback_bias_keys, feedback_decay
+
+TOTAL_KEY = "total"
+
+
+def accumulate_feedback(
+    db: Session,
+    user_id: int,
+    task: Any,
+    outcome: int,
+    at: Optional[datetime] = None,
+) -> None:
+    """
+    Fold one feedback outcome into the user's decayed bias totals.
+
+    Rows are decayed to ``at`` before the outcome is added; an outcome older
+    than a row's timestamp is decayed instead. The caller commits.
+    """
+    accumulate_feedback_many(db, user_id, [(task, outcome)], at)
+
+
+def accumulate_feedback_many(
+    db: Session,
+    user_id: int,
+    outcomes: Sequence[Tuple[Any, int]],
+    at: Optional[datetime] = None,
+) -> None:
+    """
+    Fold several ``(task, outcome)`` pairs recorded at ``at`` into the bias
+    totals, loading every affected row in one query. Missing rows are
+    created first with an insert that skips keys a concurrent request has
+    just added, so two first posts for the same key both succeed. The
+    caller commits.
+    """
+    at = at or datetime.utcnow()
+    keyed = [(task, outcome, [TOTAL_KEY, *feedback_bias_keys(task)]) for task, outcome in outcomes]
+    all_keys = {key for _, _, keys in keyed for key in keys}
+    if not all_keys:
+        return
+    rows = _load_bias_rows(db, user_id, all_keys)
+    missing = all_keys - rows.keys()
+    if missing:
+        rows.update(_insert_missing_rows(db, user_id, missing, at))
+        if missing - rows.keys():
+            rows.update(_load_bias_rows(db, user_id, missing - rows.keys()))
+    for _, outcome, keys in keyed:
+        for key in keys:
+            row = rows[key]
+            if at >= row.updated_at:
+                decay = feedback_decay(at - row.updated_at)
+                row.weighted_sum = row.weighted_sum * decay + outcome
+                row.weight = row.weight * decay + 1.0
+                row.updated_at = at
+            else:
+                weight = feedback_decay(row.updated_at - at)
+                row.weighted_sum += outcome * weight
+                row.weight += weight
+
+
+def _load_bias_rows(db: Session, user_id: int, keys) -> Dict[str, models.FeedbackBias]:
+    query = (
+        db.query(models.FeedbackBias)
+        .filter(models.FeedbackBias.user_id == user_id, models.FeedbackBias.key.in_(keys))
+        .with_for_update()
+    )
+    return {row.key: row for row in query}
+
+
+def _insert_missing_rows(db: Session, user_id: int, keys, at: datetime) -> Dict[str, models.FeedbackBias]:
+    """
+    Create empty rows for ``keys`` and return the ones this call inserted;
+    keys a concurrent request created first are skipped, not an error.
+    """
+    values = [dict(user_id=user_id, key=key, weighted_sum=0.0, weight=0.0, updated_at=at) for key in sorted(keys)]
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        upsert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        inserted = db.scalars(
+            upsert(models.FeedbackBias)
+            .on_conflict_do_nothing(index_elements=["user_id", "key"])
+            .returning(models.FeedbackBias),
+            values,
+        )
+        return {row.key: row for row in inserted}
+    for row in values:
+        try:
+            with db.begin_nested():
+                db.execute(insert(models.FeedbackBias), [row])
+        except IntegrityError:
+            # another request created the key first; its row is loaded next
+            pass
+    return {}
+
+
+def load_feedback_bias(db: Session, user_id: int, now: Optional[datetime] = None) -> Tuple[Dict[str, float], float]:
+    """
+    Bias map and strength for a user, decaying the stored totals to ``now``.
+    """
+    now = now or datetime.utcnow()
+    totals: Dict[str, float] = {}
+    weights: Dict[str, float] = {}
+    total_weight = 0.0
+    for row in db.query(models.FeedbackBias).filter(models.FeedbackBias.user_id == user_id):
+        decay = feedback_decay(now - row.updated_at)
+        if row.key == TOTAL_KEY:
+            total_weight = row.weight * decay
+            continue
+        totals[row.key] = row.weighted_sum * decay
+        weights[row.key] = row.weight * decay
+    return _bias_from_totals(totals, weights, total_weight)
@@ -0,0 +1,167 @@
+import abc
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Optional
+
+JOB_WORKERS = 2
+JOB_MAX_PENDING = 64
+JOB_RETENTION = 1000
+_LATENCY_SAMPLES = 256
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class Job:
+    """
+    State of one background job. Mutated only by its queue, under its lock.
+    """
+
+    def __init__(self, owner_id: int):
+        self.id = uuid.uuid4().hex
+        self.owner_id = owner_id
+        self.status = "queued"
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.error_status: Optional[int] = None
+        self._queued_at = time.perf_counter()
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+
+class JobQueue(abc.ABC):
+    """
+    Bookkeeping shared by all job queues: job records, completion waits and
+    metrics. Subclasses only decide where ``_execute`` runs.
+    """
+
+    def __init__(self, max_pending: int = JOB_MAX_PENDING, retention: int = JOB_RETENTION):
+        self.max_pending = max_pending
+        self.retention = retention
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._counts = {"succeeded": 0, "failed": 0, "rejected": 0}
+        self._wait_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._run_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def submit(self, owner_id: int, fn: Callable[[], Any]) -> Job:
+        job = Job(owner_id)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._counts["rejected"] += 1
+                raise JobQueueFull(f"{self._pending} jobs already queued")
+            self._pending += 1
+            self._jobs[job.id] = job
+            self._prune()
+        self._dispatch(job, fn)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """
+        Block until the job finishes or ``timeout`` seconds pass; returns the job either way.
+        """
+        job = self.get(job_id)
+        if job is not None:
+            job._done.wait(timeout)
+        return job
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_depth": self._pending,
+                "running": self._running,
+                **self._counts,
+                "wait_ms": _latency_summary(self._wait_ms),
+                "run_ms": _latency_summary(self._run_ms),
+            }
+
+    def shutdown(self) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _dispatch(self, job: Job, fn: Callable[[], Any]) -> None:
+        """Arrange for ``self._execute(job, fn)`` to run."""
+
+    def _execute(self, job: Job, fn: Callable[[], Any]) -> None:
+        started = time.perf_counter()
+        with self._lock:
+            self._pending -= 1
+            self._running += 1
+            self._wait_ms.append((started - job._queued_at) * 1000.0)
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        try:
+            job.result = fn()
+            job.status = "succeeded"
+        except Exception as exc:
+            job.error = str(getattr(exc, "detail", None) or exc)
+            job.error_status = getattr(exc, "status_code", None)
+            job.status = "failed"
+        job.finished_at = datetime.utcnow()
+        with self._lock:
+            self._running -= 1
+            self._counts[job.status] += 1
+            self._run_ms.append((time.perf_counter() - started) * 1000.0)
+        job._done.set()
+
+    def _prune(self) -> None:
+        # drop the oldest finished jobs once more than ``retention`` are held
+        excess = len(self._jobs) - self.retention
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done][:excess]:
+            del self._jobs[job_id]
+
+
+class ThreadPoolJobQueue(JobQueue):
+    """
+    Runs jobs on a bounded pool of worker threads in this process.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, max_pending: int = JOB_MAX_PENDING, retention: int = JOB_RETENTION):
+        super().__init__(max_pending=max_pending, retention=retention)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="plan-job")
+
+    def _dispatch(self, job: Job, fn: Callable[[], Any]) -> None:
+        self._executor.submit(self._execute, job, fn)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class InlineJobQueue(JobQueue):
+    """
+    Runs each job to completion inside ``submit``; a stand-in for tests and scripts.
+    """
+
+    def _dispatch(self, job: Job, fn: Callable[[], Any]) -> None:
+        self._execute(job, fn)
+
+
+def _latency_summary(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    if not samples:
+        return {"count": 0, "mean": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 2),
+        "max": round(ordered[-1], 2),
+    }
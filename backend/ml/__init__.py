@@ -3,17 +3,24 @@ from __future__ import annotations
 from .priority_model import (
     FEATURE_ORDER,
     MODEL_PATH,
+    encode_feature_columns,
     encode_features,
     get_feature_importances,
     load_model,
     predict,
 )
+from .horizon import schedule_horizon
+from .table_model import TablePriorityModel
 from .scheduler import SLOT_MINUTES, schedule_day
 from .service import (
     encode_task_features,
+    generate_horizon_schedule,
     generate_schedule,
     get_priority_model,
+    get_table_priority_model,
+    predict_priorities,
     predict_priority,
+    predict_priority_columns,
     prioritize_tasks,
     train_priority_model,
 )
@@ -22,15 +29,22 @@ __all__ = [
     "FEATURE_ORDER",
     "MODEL_PATH",
     "SLOT_MINUTES",
+    "TablePriorityModel",
+    "encode_feature_columns",
     "encode_features",
     "encode_task_features",
+    "generate_horizon_schedule",
     "generate_schedule",
     "get_feature_importances",
     "get_priority_model",
+    "get_table_priority_model",
     "load_model",
     "predict",
+    "predict_priorities",
     "predict_priority",
+    "predict_priority_columns",
     "prioritize_tasks",
     "schedule_day",
+    "schedule_horizon",
     "train_priority_model",
 ]
@@ -1,12 +1,22 @@
-﻿import random
+﻿import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta, datetime
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+
+import numpy as np
 
 USER_TYPES = ["student", "worker", "entrepreneur"]
 TASK_TYPES = ["study", "work", "meeting", "personal", "social", "admin"]
 IMPORTANCE = ["low", "medium", "high"]
 PREF_TIMES = ["morning", "afternoon", "evening", "anytime"]
 ENERGY = ["low", "medium", "high"]
+DURATIONS = [30, 60, 90, 120, 150, 180]
+IMPORTANCE_WEIGHTS = [0.3, 0.4, 0.3]
+ENERGY_WEIGHTS = [0.3, 0.5, 0.2]
+
+# rows per independently seeded chunk in generate_synthetic_columns_parallel
+PARALLEL_CHUNK_ROWS = 250_000
 
 
 def expert_priority_score(
@@ -71,17 +81,63 @@ def expert_priority_score(
     return max(0.0, min(100.0, score))
 
 
+def expert_priority_scores(
+    *,
+    user_type: Any,
+    duration_minutes: Any,
+    hours_until_deadline: Any,
+    importance: Any,
+    task_type: Any,
+    preferred_time: Any,
+    energy: Any,
+    plan_day_of_week: Any,
+    is_weekend: Any,
+) -> np.ndarray:
+    """
+    ``expert_priority_score`` over column arrays: every branch becomes a
+    boolean mask, so each row gets exactly the score the scalar rules give.
+    """
+    user_type = np.asarray(user_type)
+    task_type = np.asarray(task_type)
+    importance = np.asarray(importance)
+    hours = np.asarray(hours_until_deadline, dtype=float)
+    day = np.asarray(plan_day_of_week)
+    preferred_time = np.asarray(preferred_time)
+
+    score = np.select([importance == "high", importance == "medium"], [70.0, 45.0], 20.0)
+    score += np.select([hours <= 4, hours <= 24, hours <= 72], [25.0, 15.0, 5.0], 0.0)
+
+    work_or_meeting = np.isin(task_type, ["work", "meeting"])
+    affinity = (
+        ((user_type == "student") & (task_type == "study"))
+        | ((user_type == "worker") & work_or_meeting)
+        | ((user_type == "entrepreneur") & np.isin(task_type, ["work", "admin"]))
+    )
+    score += np.where(affinity, 10.0, 0.0)
+    score -= np.where(np.asarray(duration_minutes) > 120, 5.0, 0.0)
+    score += np.where(np.asarray(energy) == "high", 5.0, 0.0)
+
+    weekend_shift = np.where(np.isin(task_type, ["social", "personal"]), 8.0, 0.0) - np.where(
+        np.isin(task_type, ["work", "study"]), 5.0, 0.0
+    )
+    score += np.where(np.asarray(is_weekend).astype(bool), weekend_shift, np.where(work_or_meeting, 6.0, 0.0))
+
+    score += np.where((preferred_time == "morning") & (day <= 2), 3.0, 0.0)
+    score += np.where((preferred_time == "evening") & (day >= 3), 2.0, 0.0)
+    return np.clip(score, 0.0, 100.0)
+
+
 def generate_synthetic_dataset(n: int = 6000) -> List[Dict]:
     now = datetime.utcnow()
     data = []
     for _ in range(n):
         user_type = random.choice(USER_TYPES)
-        duration = random.choice([30, 60, 90, 120, 150, 180])
+        duration = random.choice(DURATIONS)
         hours_until_deadline = random.uniform(1, 120)
-        importance = random.choices(IMPORTANCE, weights=[0.3, 0.4, 0.3])[0]
+        importance = random.choices(IMPORTANCE, weights=IMPORTANCE_WEIGHTS)[0]
         task_type = random.choice(TASK_TYPES)
         preferred_time = random.choice(PREF_TIMES)
-        energy = random.choices(ENERGY, weights=[0.3, 0.5, 0.2])[0]
+        energy = random.choices(ENERGY, weights=ENERGY_WEIGHTS)[0]
 
         plan_day_of_week = random.randint(0, 6)
         is_weekend = 1 if plan_day_of_week >= 5 else 0
@@ -115,3 +171,70 @@ def generate_synthetic_dataset(n: int = 6000) -> List[Dict]:
             )
         )
     return data
+
+
+def generate_synthetic_columns(
+    n: int = 6000, *, seed: Any = None, now: Optional[datetime] = None
+) -> Dict[str, np.ndarray]:
+    """
+    ``generate_synthetic_dataset`` as column arrays: the same fields drawn
+    from the same distributions, keyed by field name, with ``deadline`` as
+    ``datetime64`` and ``priority`` from ``expert_priority_scores``.
+    ``seed`` is anything ``np.random.default_rng`` accepts; a fixed seed
+    gives the same rows and labels every time.
+    """
+    rng = np.random.default_rng(seed)
+    now = now or datetime.utcnow()
+    plan_day_of_week = rng.integers(0, 7, n)
+    columns = {
+        "user_type": np.array(USER_TYPES)[rng.integers(0, len(USER_TYPES), n)],
+        "duration_minutes": np.array(DURATIONS)[rng.integers(0, len(DURATIONS), n)],
+        "hours_until_deadline": rng.uniform(1, 120, n),
+        "importance": np.array(IMPORTANCE)[rng.choice(len(IMPORTANCE), n, p=IMPORTANCE_WEIGHTS)],
+        "task_type": np.array(TASK_TYPES)[rng.integers(0, len(TASK_TYPES), n)],
+        "preferred_time": np.array(PREF_TIMES)[rng.integers(0, len(PREF_TIMES), n)],
+        "energy": np.array(ENERGY)[rng.choice(len(ENERGY), n, p=ENERGY_WEIGHTS)],
+        "plan_day_of_week": plan_day_of_week,
+        "is_weekend": (plan_day_of_week >= 5).astype(np.int64),
+    }
+    columns["deadline"] = np.datetime64(now, "us") + (columns["hours_until_deadline"] * 3.6e9).astype("timedelta64[us]")
+    columns["priority"] = expert_priority_scores(
+        **{field: columns[field] for field in columns if field != "deadline"}
+    )
+    return columns
+
+
+def _columns_chunk(rows: int, seed: np.random.SeedSequence, now: datetime) -> Dict[str, np.ndarray]:
+    return generate_synthetic_columns(rows, seed=seed, now=now)
+
+
+def generate_synthetic_columns_parallel(
+    n: int,
+    *,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_rows: int = PARALLEL_CHUNK_ROWS,
+) -> Dict[str, np.ndarray]:
+    """
+    ``generate_synthetic_columns`` for large ``n``, cut into chunks of
+    ``chunk_rows`` that are generated in up to ``workers`` processes
+    (``None`` for one per CPU, 1 to stay in this process). Every chunk
+    draws from its own child of ``np.random.SeedSequence(seed)``, so a
+    fixed seed and chunk size give the same rows whatever the worker count.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    sizes = [chunk_rows] * (n // chunk_rows)
+    if n % chunk_rows or not sizes:
+        sizes.append(n % chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    now = datetime.utcnow()
+    if workers == 1 or len(sizes) == 1:
+        chunks = [_columns_chunk(rows, chunk_seed, now) for rows, chunk_seed in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers or multiprocessing.cpu_count(), len(sizes)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            chunks = list(executor.map(_columns_chunk, sizes, seeds, [now] * len(sizes)))
+    return {field: np.concatenate([chunk[field] for chunk in chunks]) for field in chunks[0]}
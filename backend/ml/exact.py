@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .scheduler import DayCostModel, OccupancyIndex
+
+EXACT_MAX_TASKS = 15
+EXACT_BUDGET_MS = 70.0
+EXACT_NODE_LIMIT = 200_000
+_SLIVER_PENALTY = 2.0
+_EPS = 1e-9
+
+_EDGE, _BUSY, _TASK = 0, 1, 2
+
+
+class _SearchLimit(Exception):
+    pass
+
+
+def _plan_cost(assignments: Dict[int, Dict[str, Any]], occupied: "OccupancyIndex", cost_model: "DayCostModel") -> float:
+    return sum(
+        cost_model.placement_cost(
+            occupied=occupied,
+            start_idx=info["start_idx"],
+            required_slots=info["required_slots"],
+            latest_end_minute=info["latest_end_minute"],
+            preferred_window=info["preferred_window"],
+            task_energy=info["energy"],
+            duration_minutes=info["duration_minutes"],
+            hours_until_deadline=info["hours_until_deadline"],
+        )
+        for info in assignments.values()
+    )
+
+
+def _solve_day(
+    task_ids: List[int],
+    assignments: Dict[int, Dict[str, Any]],
+    occupied: "OccupancyIndex",
+    cost_model: "DayCostModel",
+    lo: int,
+    hi: int,
+    incumbent: float,
+    deadline: float,
+    node_limit: int,
+) -> Tuple[Optional[Dict[int, int]], int, Optional[str]]:
+    """Search slots ``lo:hi`` (one day) for a cheaper placement of ``task_ids``."""
+    sliver_slots = cost_model.sliver_slots
+    # next busy slot at or after each position, and the end of the busy run starting there
+    next_busy = [hi] * (hi + 1)
+    busy_end = [0] * (hi + 1)
+    for idx in range(hi - 1, lo - 1, -1):
+        if occupied.owners[idx] is None:
+            next_busy[idx] = next_busy[idx + 1]
+        else:
+            next_busy[idx] = idx
+            follows = idx + 1 < hi and occupied.owners[idx + 1] is not None
+            busy_end[idx] = busy_end[idx + 1] if follows else idx + 1
+
+    required: List[int] = []
+    base_costs: List[List[float]] = []
+    floors: List[List[float]] = []
+    for task_id in task_ids:
+        info = assignments[task_id]
+        starts = cost_model.candidate_starts(occupied, info["required_slots"], info["latest_end_minute"])
+        starts = starts[(starts >= lo) & (starts < hi)]
+        costs = (
+            cost_model.static_costs(info["preferred_window"], info["energy"])[starts]
+            + cost_model.urgency_costs(starts, info["latest_end_minute"], info["duration_minutes"], info["hours_until_deadline"])
+        )
+        base = [math.inf] * (hi + 1)
+        for start, cost in zip(starts.tolist(), costs.tolist()):
+            base[start] = cost
+        floor = base[:]
+        for idx in range(hi - 1, lo - 1, -1):
+            floor[idx] = min(floor[idx], floor[idx + 1])
+        required.append(info["required_slots"])
+        base_costs.append(base)
+        floors.append(floor)
+
+    full_mask = (1 << len(task_ids)) - 1
+    memo: Dict[Tuple[int, int, int], float] = {}
+    current: Dict[int, int] = {}
+    best: Dict[str, Any] = {"cost": incumbent, "starts": None}
+    nodes = 0
+
+    def search(position: int, mask: int, left: int, cost: float) -> None:
+        nonlocal nodes
+        nodes += 1
+        if nodes > node_limit:
+            raise _SearchLimit("nodes")
+        if not nodes & 255 and time.perf_counter() >= deadline:
+            raise _SearchLimit("time")
+
+        busy_at = next_busy[position]
+        if mask == full_mask:
+            gap = busy_at - position
+            if left == _TASK and busy_at < hi and 0 < gap <= sliver_slots:
+                cost += _SLIVER_PENALTY
+            if cost < best["cost"] - _EPS:
+                best["cost"] = cost
+                best["starts"] = dict(current)
+            return
+
+        key = (position, mask, left)
+        seen = memo.get(key)
+        if seen is not None and cost >= seen - _EPS:
+            return
+        memo[key] = cost
+
+        floor_sum = 0.0
+        for i in range(len(task_ids)):
+            if not mask >> i & 1:
+                floor_sum += floors[i][position]
+        if cost + floor_sum >= best["cost"] - _EPS:
+            return
+
+        options = []
+        for i in range(len(task_ids)):
+            if mask >> i & 1:
+                continue
+            base = base_costs[i]
+            # the other unplaced tasks still cost at least their floor after this one
+            ceiling = best["cost"] - _EPS - cost - (floor_sum - floors[i][position])
+            for start in range(position, busy_at - required[i] + 1):
+                cost_here = base[start]
+                if cost_here >= ceiling:
+                    continue
+                gap = start - position
+                if gap and gap <= sliver_slots and left != _EDGE:
+                    cost_here += _SLIVER_PENALTY * (2 if left == _TASK else 1)
+                    if cost_here >= ceiling:
+                        continue
+                options.append((cost_here, i, start))
+        if busy_at < hi:
+            gap = busy_at - position
+            penalty = _SLIVER_PENALTY if left == _TASK and 0 < gap <= sliver_slots else 0.0
+            options.append((penalty, -1, busy_at))
+
+        options.sort()
+        for cost_here, i, start in options:
+            if i < 0:
+                search(busy_end[start], mask, _BUSY, cost + cost_here)
+            else:
+                current[task_ids[i]] = start
+                search(start + required[i], mask | 1 << i, _TASK, cost + cost_here)
+                del current[task_ids[i]]
+
+    try:
+        search(lo, 0, _EDGE, 0.0)
+    except _SearchLimit as exc:
+        return best["starts"], nodes, str(exc)
+    return best["starts"], nodes, None
+
+
+def solve_day_exact(
+    assignments: Dict[int, Dict[str, Any]],
+    occupied: "OccupancyIndex",
+    cost_model: "DayCostModel",
+    budget_ms: float = EXACT_BUDGET_MS,
+    node_limit: int = EXACT_NODE_LIMIT,
+    max_tasks: int = EXACT_MAX_TASKS,
+) -> Dict[str, Any]:
+    """
+    Re-place a day's tasks at the minimum total ``_placement_cost``.
+
+    Branch and bound builds the day left to right: from the end of the last
+    occupied block it either starts an unplaced task or skips to the next
+    busy block, charging the fragmentation term as soon as the gap in front
+    of a block is known. Branches are cut by a lower bound (each unplaced
+    task's cheapest remaining start) and by memoized dominance on
+    ``(position, placed set, left neighbour kind)``.
+
+    The plan passed in is the incumbent, so when the node or time limit is
+    hit the best plan found so far (at worst the greedy one) is kept and the
+    report says it is not proven optimal. Days with more than ``max_tasks``
+    tasks are left untouched. On a multi-day index each day is solved on its
+    own with the tasks already placed on it.
+    """
+    started = time.perf_counter()
+    report: Dict[str, Any] = {
+        "attempted": False,
+        "optimal": False,
+        "nodes": 0,
+        "initial_cost": 0.0,
+        "final_cost": 0.0,
+        "cost_improvement": 0.0,
+        "elapsed_ms": 0.0,
+        "limit": None,
+    }
+    initial_cost = _plan_cost(assignments, occupied, cost_model)
+    report.update(initial_cost=initial_cost, final_cost=initial_cost)
+
+    day_slots = cost_model.day_slots
+    tasks_by_day: Dict[int, List[int]] = {}
+    for task_id, info in assignments.items():
+        tasks_by_day.setdefault(info["start_idx"] // day_slots, []).append(task_id)
+    deadline = started + max(0.0, budget_ms) / 1000.0
+    nodes = 0
+    solved_days = 0
+
+    for day, task_ids in sorted(tasks_by_day.items()):
+        if len(task_ids) > max_tasks:
+            report["limit"] = "max_tasks"
+            continue
+        report["attempted"] = True
+        day_assignments = {task_id: assignments[task_id] for task_id in task_ids}
+        incumbent = _plan_cost(day_assignments, occupied, cost_model)
+        for info in day_assignments.values():
+            occupied.release(info["start_idx"], info["end_idx"])
+        lo = day * day_slots
+        chosen, day_nodes, limit = _solve_day(
+            task_ids,
+            assignments,
+            occupied,
+            cost_model,
+            lo,
+            min(lo + day_slots, cost_model.n_slots),
+            incumbent,
+            deadline,
+            node_limit - nodes,
+        )
+        nodes += day_nodes
+        for task_id, info in day_assignments.items():
+            if chosen is not None:
+                info["start_idx"] = chosen[task_id]
+                info["end_idx"] = chosen[task_id] + info["required_slots"]
+            occupied.occupy(info["start_idx"], info["end_idx"], task_id)
+        if limit is not None:
+            report["limit"] = limit
+            break
+        solved_days += 1
+
+    if not assignments:
+        report["attempted"] = True
+    report["optimal"] = solved_days == len(tasks_by_day)
+    final_cost = _plan_cost(assignments, occupied, cost_model)
+    report.update(
+        nodes=nodes,
+        final_cost=final_cost,
+        cost_improvement=initial_cost - final_cost,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+    return report
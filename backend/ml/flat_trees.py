@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+# padding every tree to a perfect binary tree stays cheap up to this depth
+FLAT_MAX_DEPTH = 6
+# rows scored at once; larger batches are scored in chunks of this size so the
+# per-split comparison matrix stays cache-sized
+FLAT_MAX_ROWS = 128
+# trees up to this depth are scored from a table over every outcome of their
+# splits; a tree has 2**depth - 1 splits, so the table doubles per split
+FLAT_TABLE_DEPTH = 3
+
+
+class FlatTreeEnsemble:
+    """
+    A fitted ``GradientBoostingRegressor`` exported into flat NumPy arrays.
+
+    Each tree is padded to a perfect binary tree of the ensemble's depth and
+    stored in heap order, so the children of node ``h`` are ``2h + 1`` and
+    ``2h + 2`` and need no arrays of their own. ``feature`` and
+    ``threshold`` hold one row of internal nodes per tree, ``value`` one
+    row of leaves, pre-scaled by the learning rate. A leaf that sits above
+    the full depth is copied to every padded leaf below it, and the padded
+    splits under it always go left.
+
+    ``predict`` compares a batch against every split at once and then walks
+    all trees one level per step. Up to ``FLAT_TABLE_DEPTH`` there is no
+    walk: each distinct split is compared once, a matrix product with
+    powers of two turns the outcomes into one code per tree, and the code
+    indexes a table of that tree's leaf values. Features are rounded to
+    float32 before comparing, as sklearn's trees do, so predictions match
+    to float tolerance. Batches larger than ``FLAT_MAX_ROWS`` are scored in
+    chunks of that many rows. The original estimator is kept as
+    ``estimator``.
+
+    It exposes ``predict``, ``feature_importances_`` and ``n_features_in_``
+    so it stands in for the estimator wherever ``load_model()`` results are
+    used.
+    """
+
+    def __init__(self, estimator: Any):
+        trees = [est.tree_ for est in estimator.estimators_[:, 0]]
+        self.depth = max(1, max(tree.max_depth for tree in trees))
+        internal, leaves = 2**self.depth - 1, 2**self.depth
+        self.feature = np.zeros((len(trees), internal), dtype=np.intp)
+        self.threshold = np.full((len(trees), internal), np.inf)
+        self.value = np.zeros((len(trees), leaves))
+        for idx, tree in enumerate(trees):
+            self._fill(idx, tree, estimator.learning_rate)
+        self.baseline = _baseline(estimator)
+        self.n_features_in_ = estimator.n_features_in_
+        self.feature_importances_ = np.asarray(estimator.feature_importances_, dtype=float)
+        self.estimator = estimator
+        self._split_features = self.feature.ravel()
+        self._split_thresholds = self.threshold.ravel()
+        self._tree_offsets = np.arange(len(trees), dtype=np.intp) * internal
+        self._leaf_offsets = np.arange(len(trees), dtype=np.intp) * leaves - internal
+        self._code_weights = None
+        if self.depth <= FLAT_TABLE_DEPTH:
+            self._build_outcome_table()
+
+    def _build_outcome_table(self) -> None:
+        internal = 2**self.depth - 1
+        n_trees = len(self.value)
+        # padded splits never go right, so they add nothing to a code
+        nodes = np.flatnonzero(np.isfinite(self._split_thresholds))
+        splits = np.column_stack([self._split_features[nodes], self._split_thresholds[nodes]])
+        unique, split_ids = np.unique(splits, axis=0, return_inverse=True)
+        self._unique_features = unique[:, 0].astype(np.intp)
+        self._unique_thresholds = unique[:, 1]
+        # bit h of a tree's code is set when its split h goes right
+        self._code_weights = np.zeros((len(unique), n_trees), dtype=np.float32)
+        np.add.at(self._code_weights, (np.ravel(split_ids), nodes // internal), 2.0 ** (nodes % internal))
+        codes = np.arange(2**internal, dtype=np.intp)
+        heap = np.zeros_like(codes)
+        for _ in range(self.depth):
+            heap = 2 * heap + 1 + ((codes >> heap) & 1)
+        self._outcome_values = self.value[:, heap - internal].ravel()
+        self._code_offsets = np.arange(n_trees, dtype=np.intp) * len(codes)
+
+    def _fill(self, idx: int, tree: Any, scale: float) -> None:
+        internal = 2**self.depth - 1
+        stack = [(0, 0, 0)]
+        while stack:
+            node, heap, level = stack.pop()
+            if tree.children_left[node] < 0:
+                # the leaf's first padded descendant at full depth, and how many there are
+                first = heap
+                for _ in range(self.depth - level):
+                    first = 2 * first + 1
+                width = 2 ** (self.depth - level)
+                self.value[idx, first - internal : first - internal + width] = tree.value[node, 0, 0] * scale
+                continue
+            self.feature[idx, heap] = tree.feature[node]
+            self.threshold[idx, heap] = tree.threshold[node]
+            stack.append((tree.children_left[node], 2 * heap + 1, level + 1))
+            stack.append((tree.children_right[node], 2 * heap + 2, level + 1))
+
+    def predict(self, X: Any) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected a 2D array with {self.n_features_in_} features, got shape {X.shape}")
+        if len(X) <= FLAT_MAX_ROWS:
+            return self._predict_chunk(X)
+        return np.concatenate(
+            [self._predict_chunk(X[start : start + FLAT_MAX_ROWS]) for start in range(0, len(X), FLAT_MAX_ROWS)]
+        )
+
+    def _predict_chunk(self, X: np.ndarray) -> np.ndarray:
+        if self._code_weights is not None:
+            outcomes = (X[:, self._unique_features] > self._unique_thresholds).astype(np.float32)
+            codes = (outcomes @ self._code_weights).astype(np.intp)
+            return self.baseline + self._outcome_values[self._code_offsets + codes].sum(axis=1)
+        goes_right = (X[:, self._split_features] > self._split_thresholds).ravel()
+        row_offsets = (np.arange(len(X), dtype=np.intp) * self._split_features.size)[:, None] + self._tree_offsets
+        heap = np.zeros((len(X), len(self._tree_offsets)), dtype=np.intp)
+        for _ in range(self.depth):
+            heap = 2 * heap + 1 + goes_right[row_offsets + heap]
+        return self.baseline + self.value.ravel()[self._leaf_offsets + heap].sum(axis=1)
+
+
+def _baseline(estimator: Any) -> float:
+    init = estimator.init_
+    if isinstance(init, str):
+        return 0.0
+    return float(np.ravel(init.constant_)[0])
+
+
+def flatten_ensemble(estimator: Any) -> Optional[FlatTreeEnsemble]:
+    """
+    Export ``estimator`` when it is a fitted single-output gradient boosted
+    regressor with a constant initial prediction and trees no deeper than
+    ``FLAT_MAX_DEPTH``; None otherwise.
+    """
+    from sklearn.dummy import DummyRegressor
+    from sklearn.ensemble import GradientBoostingRegressor
+
+    if not isinstance(estimator, GradientBoostingRegressor) or not hasattr(estimator, "estimators_"):
+        return None
+    init = getattr(estimator, "init_", None)
+    if not (isinstance(init, str) and init == "zero") and not isinstance(init, DummyRegressor):
+        return None
+    if any(est.tree_.max_depth > FLAT_MAX_DEPTH for est in estimator.estimators_[:, 0]):
+        return None
+    return FlatTreeEnsemble(estimator)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .exact import EXACT_BUDGET_MS, EXACT_NODE_LIMIT, solve_day_exact
+from .local_search import LOCAL_SEARCH_BUDGET_MS, LOCAL_SEARCH_MAX_ITERATIONS, optimize_day
+from .priority_model import get_feature_importances, load_model
+from .scheduler import (
+    SLOT_MINUTES,
+    DayCostModel,
+    OccupancyIndex,
+    _apply_occupied_intervals,
+    _best_start_slot,
+    _bias_from_feedback,
+    _minutes_since,
+    _score_tasks,
+    _scheduled_entry,
+    _stable_seed,
+    _time_window_indices,
+    build_slot_offsets,
+)
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def day_choice_penalty(
+    day: date,
+    deadline_date: date,
+    plan_start_date: date,
+    day_load_minutes: float,
+    day_capacity_minutes: float,
+) -> float:
+    """
+    Cost of putting a task on ``day``: busy days, days far ahead of the
+    deadline and, for far deadlines, the first two horizon days cost more.
+    """
+    load_penalty = (day_load_minutes / day_capacity_minutes) ** 2 * 8.0
+
+    days_until_deadline = max(0, (deadline_date - day).days)
+    if days_until_deadline <= 1:
+        deadline_penalty = 0.0
+    else:
+        deadline_penalty = min(6.0, days_until_deadline * 0.6)
+
+    far_deadline = (deadline_date - plan_start_date).days >= 4
+    horizon_offset = (day - plan_start_date).days
+    early_if_far_penalty = 2.5 if far_deadline and horizon_offset <= 1 else 0.0
+
+    return load_penalty + deadline_penalty + early_if_far_penalty
+
+
+def day_choice_penalties(
+    day_numbers: np.ndarray,
+    deadline_day: int,
+    day_loads: np.ndarray,
+    day_capacity_minutes: float,
+) -> np.ndarray:
+    """
+    ``day_choice_penalty`` for every horizon day at once. ``day_numbers``
+    and ``deadline_day`` count days from the plan start.
+    """
+    load_penalty = (day_loads / day_capacity_minutes) ** 2 * 8.0
+    days_until_deadline = np.maximum(0, deadline_day - day_numbers)
+    deadline_penalty = np.where(days_until_deadline <= 1, 0.0, np.minimum(6.0, days_until_deadline * 0.6))
+    if deadline_day >= 4:
+        early_if_far_penalty = np.where(day_numbers <= 1, 2.5, 0.0)
+    else:
+        early_if_far_penalty = np.zeros(len(day_numbers))
+    return load_penalty + deadline_penalty + early_if_far_penalty
+
+
+def build_horizon_offsets(
+    plan_dates: Sequence[date],
+    start_hour: int = 8,
+    end_hour: int = 22,
+    slot_minutes: int = SLOT_MINUTES,
+) -> List[int]:
+    """
+    Slot starts of every horizon day as minutes since the first day's midnight.
+    """
+    day_offsets = build_slot_offsets(start_hour=start_hour, end_hour=end_hour, slot_minutes=slot_minutes)
+    origin = plan_dates[0]
+    return [
+        (plan_date - origin).days * MINUTES_PER_DAY + offset
+        for plan_date in plan_dates
+        for offset in day_offsets
+    ]
+
+
+def schedule_horizon(
+    tasks: List[Dict[str, Any]],
+    user_profile: str,
+    plan_dates: Sequence[date],
+    feedback: Optional[List[Any]] = None,
+    start_hour: int = 8,
+    end_hour: int = 22,
+    occupied_intervals_by_day: Optional[Mapping[date, Sequence[Tuple[datetime, datetime]]]] = None,
+    existing_minutes_by_day: Optional[Mapping[date, float]] = None,
+    model=None,
+    slot_minutes: int = SLOT_MINUTES,
+    search_budget_ms: float = LOCAL_SEARCH_BUDGET_MS,
+    search_max_iterations: int = LOCAL_SEARCH_MAX_ITERATIONS,
+    search_stats: Optional[Dict[str, Any]] = None,
+    exact: bool = False,
+    exact_budget_ms: float = EXACT_BUDGET_MS,
+    exact_node_limit: int = EXACT_NODE_LIMIT,
+    feedback_bias: Optional[Tuple[Dict[str, float], float]] = None,
+) -> Tuple[Dict[date, List[Dict[str, Any]]], List[Dict[str, Any]], Optional[float]]:
+    """
+    Place tasks across all ``plan_dates`` in one priority-ordered pass.
+
+    One occupancy index spans the horizon (day boundaries act as day edges),
+    so a task only goes to a day where a contiguous slot is actually free.
+    Each candidate start costs its ``_placement_cost`` plus the
+    ``day_choice_penalty`` of its day, with day loads updated as tasks are
+    placed. The largest free run of every day is kept alongside, so only
+    days that can hold a task contiguously are searched for a start. The
+    model scores every task once, relative to the first day. Local search
+    and the optional exact mode then refine each day.
+    """
+    model = model or load_model()
+    feature_importances = get_feature_importances(model)
+    top_features = list(np.argsort(feature_importances)[::-1][:3]) if feature_importances else []
+    model_confidence = float(np.sum(feature_importances[:3])) if feature_importances else None
+
+    plan_dates = sorted(plan_dates)
+    scheduled_by_day: Dict[date, List[Dict[str, Any]]] = {plan_date: [] for plan_date in plan_dates}
+    day_offsets = build_slot_offsets(start_hour=start_hour, end_hour=end_hour, slot_minutes=slot_minutes)
+    if not plan_dates or not day_offsets:
+        return scheduled_by_day, [{**t, "reason": "No working hours configured for this day"} for t in tasks], model_confidence
+
+    day_slots = len(day_offsets)
+    origin = datetime.combine(plan_dates[0], time.min)
+    slot_offsets = build_horizon_offsets(plan_dates, start_hour, end_hour, slot_minutes)
+    occupied = OccupancyIndex(len(slot_offsets), day_slots)
+    busy = [
+        interval
+        for plan_date in plan_dates
+        for interval in (occupied_intervals_by_day or {}).get(plan_date) or ()
+    ]
+    _apply_occupied_intervals(occupied, slot_offsets, origin, busy, slot_minutes)
+    cost_model = DayCostModel(slot_offsets, slot_minutes, day_slots)
+    horizon_end_minute = slot_offsets[-1] + slot_minutes
+
+    day_capacity_minutes = max(1, (end_hour - start_hour) * 60)
+    day_loads = np.array([float((existing_minutes_by_day or {}).get(d, 0)) for d in plan_dates])
+    day_numbers = np.array([(d - plan_dates[0]).days for d in plan_dates])
+    day_runs = np.array([max(occupied.free_run[i : i + day_slots]) for i in range(0, len(slot_offsets), day_slots)])
+
+    plan_start = origin + timedelta(minutes=day_offsets[0])
+    assignments: Dict[int, Dict[str, Any]] = {}
+    placed_items: List[Dict[str, Any]] = []
+    unscheduled = []
+
+    bias_map, feedback_strength = feedback_bias if feedback_bias is not None else _bias_from_feedback(feedback)
+    rng = random.Random(_stable_seed(plan_dates[0], user_profile))
+
+    scored_tasks = _score_tasks(
+        tasks,
+        user_profile=user_profile,
+        plan_date=plan_dates[0],
+        plan_start=plan_start,
+        bias_map=bias_map,
+        model=model,
+    )
+    scored_tasks.sort(key=lambda x: x["priority"], reverse=True)
+
+    for item in scored_tasks:
+        t = item["task"]
+        required_slots = (t["duration_minutes"] + slot_minutes - 1) // slot_minutes
+        deadline_date = t["deadline"].date()
+
+        if required_slots > day_slots:
+            unscheduled.append({**t, "reason": "Duration exceeds available day length"})
+            continue
+        if deadline_date < plan_dates[0]:
+            unscheduled.append({**t, "reason": "Deadline outside horizon"})
+            continue
+
+        # days up to the deadline whose largest free run can hold the task
+        fitting_days = np.flatnonzero(day_runs[: bisect_right(plan_dates, deadline_date)] >= required_slots)
+        if not fitting_days.size:
+            unscheduled.append({**t, "reason": "No available slot before deadline/preference"})
+            continue
+
+        latest_end_minute = min(horizon_end_minute, _minutes_since(t["deadline"], origin))
+        preferred_window = _time_window_indices(t["preferred_time"], day_slots, start_hour, end_hour, slot_minutes)
+        day_costs = day_choice_penalties(
+            day_numbers, (deadline_date - plan_dates[0]).days, day_loads, day_capacity_minutes
+        )
+        best_start = _best_start_slot(
+            occupied=occupied,
+            slot_offsets=slot_offsets,
+            required_slots=required_slots,
+            latest_end_minute=latest_end_minute,
+            preferred_window=preferred_window,
+            task_energy=t["energy"],
+            duration_minutes=t["duration_minutes"],
+            hours_until_deadline=item["hours_until_deadline"],
+            feedback_strength=feedback_strength,
+            rng=rng,
+            cost_model=cost_model,
+            day_costs=day_costs,
+            days=fitting_days,
+        )
+
+        if best_start is None:
+            unscheduled.append({**t, "reason": "No available slot before deadline/preference"})
+            continue
+
+        occupied.occupy(best_start, best_start + required_slots, t["id"])
+        day_idx = best_start // day_slots
+        day_loads[day_idx] += t["duration_minutes"]
+        day_runs[day_idx] = max(occupied.free_run[day_idx * day_slots : (day_idx + 1) * day_slots])
+        placed_items.append(item)
+        assignments[t["id"]] = {
+            "start_idx": best_start,
+            "end_idx": best_start + required_slots,
+            "latest_end_minute": latest_end_minute,
+            "required_slots": required_slots,
+            "preferred_window": preferred_window,
+            "energy": t["energy"],
+            "duration_minutes": t["duration_minutes"],
+            "hours_until_deadline": item["hours_until_deadline"],
+        }
+
+    # Local improvement within each day, then the optional exact pass
+    report = optimize_day(
+        assignments, occupied, cost_model, budget_ms=search_budget_ms, max_iterations=search_max_iterations
+    )
+    if exact:
+        report["exact"] = solve_day_exact(
+            assignments, occupied, cost_model, budget_ms=exact_budget_ms, node_limit=exact_node_limit
+        )
+    if search_stats is not None:
+        search_stats.update(report)
+
+    for item in placed_items:
+        info = assignments[item["task"]["id"]]
+        start_idx = info["start_idx"]
+        start_dt = origin + timedelta(minutes=slot_offsets[start_idx])
+        entry = _scheduled_entry(
+            item,
+            start_dt=start_dt,
+            in_preferred_window=info["preferred_window"][0] <= start_idx % day_slots < info["preferred_window"][1],
+            user_profile=user_profile,
+            top_features=top_features,
+        )
+        end_dt = origin + timedelta(minutes=slot_offsets[info["end_idx"] - 1] + slot_minutes)
+        entry["end"] = end_dt.isoformat()
+        scheduled_by_day[plan_dates[start_idx // day_slots]].append(entry)
+
+    return scheduled_by_day, unscheduled, model_confidence
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .scheduler import DayCostModel, OccupancyIndex
+
+# attempted moves per day; the deterministic limit on the search
+LOCAL_SEARCH_MAX_ITERATIONS = 500
+# wall-clock safety limit, far above what the iteration cap takes on a week
+LOCAL_SEARCH_BUDGET_MS = 1000.0
+MAX_RELOCATE_CANDIDATES = 4
+_EPS = 1e-9
+
+
+class _DaySearch:
+    """
+    Mutable view over one day's assignments for delta-cost local search.
+
+    A task's cost is its ``_placement_cost`` at its current start. The plan
+    cost is the sum over tasks. A move only changes the cost of the moved
+    tasks and of the tasks directly beside their old and new blocks, so
+    moves are scored on that neighbourhood alone.
+
+    On a multi-day index tasks only move within their own day; choosing the
+    day is left to the horizon pass.
+    """
+
+    def __init__(self, assignments: Dict[int, Dict[str, Any]], occupied: "OccupancyIndex", cost_model: "DayCostModel"):
+        self.assignments = assignments
+        self.occupied = occupied
+        self.cost_model = cost_model
+        self.stops = {
+            task_id: cost_model.start_stop(info["required_slots"], info["latest_end_minute"])
+            for task_id, info in assignments.items()
+        }
+
+    def task_cost(self, task_id: int) -> float:
+        info = self.assignments[task_id]
+        return self.cost_model.placement_cost(
+            occupied=self.occupied,
+            start_idx=info["start_idx"],
+            **self._cost_kwargs(info),
+        )
+
+    def _cost_kwargs(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(
+            required_slots=info["required_slots"],
+            latest_end_minute=info["latest_end_minute"],
+            preferred_window=info["preferred_window"],
+            task_energy=info["energy"],
+            duration_minutes=info["duration_minutes"],
+            hours_until_deadline=info["hours_until_deadline"],
+        )
+
+    def total_cost(self) -> float:
+        return sum(self.task_cost(task_id) for task_id in self.assignments)
+
+    def _neighbors(self, task_id: int) -> Iterable[int]:
+        info = self.assignments[task_id]
+        for owner in self.occupied.neighbors(info["start_idx"], info["end_idx"]):
+            if owner is not None and owner in self.assignments:
+                yield owner
+
+    def _place(self, placements: Dict[int, int]) -> bool:
+        previous = {task_id: self.assignments[task_id]["start_idx"] for task_id in placements}
+        for task_id in placements:
+            info = self.assignments[task_id]
+            self.occupied.release(info["start_idx"], info["end_idx"])
+        placed: List[int] = []
+        for task_id, start_idx in placements.items():
+            required_slots = self.assignments[task_id]["required_slots"]
+            if start_idx < 0 or start_idx >= self.stops[task_id] or not self.occupied.fits(start_idx, required_slots):
+                for done in placed:
+                    info = self.assignments[done]
+                    self.occupied.release(info["start_idx"], info["end_idx"])
+                self._occupy_at(previous)
+                return False
+            self._occupy_at({task_id: start_idx})
+            placed.append(task_id)
+        return True
+
+    def _occupy_at(self, placements: Dict[int, int]) -> None:
+        for task_id, start_idx in placements.items():
+            info = self.assignments[task_id]
+            info["start_idx"] = start_idx
+            info["end_idx"] = start_idx + info["required_slots"]
+            self.occupied.occupy(info["start_idx"], info["end_idx"], task_id)
+
+    def attempt(self, placements: Dict[int, int]) -> Optional[float]:
+        """Apply ``placements`` if they lower the plan cost; returns the (negative) delta."""
+        previous = {task_id: self.assignments[task_id]["start_idx"] for task_id in placements}
+        if previous == placements:
+            return None
+        touched: Set[int] = set(placements)
+        for task_id in placements:
+            touched.update(self._neighbors(task_id))
+        if not self._place(placements):
+            return None
+        for task_id in placements:
+            touched.update(self._neighbors(task_id))
+        after = sum(self.task_cost(task_id) for task_id in touched)
+        self._place(previous)
+        before = sum(self.task_cost(task_id) for task_id in touched)
+        if after < before - _EPS:
+            self._place(placements)
+            return after - before
+        return None
+
+    def relocation_candidates(self, task_id: int) -> List[int]:
+        """Best starts by the task's own cost, plus starts flush against each free gap."""
+        info = self.assignments[task_id]
+        required_slots = info["required_slots"]
+        self.occupied.release(info["start_idx"], info["end_idx"])
+        try:
+            day = info["start_idx"] // self.cost_model.day_slots
+            starts = self.cost_model.candidate_starts(
+                self.occupied, required_slots, info["latest_end_minute"], days=np.array([day])
+            )
+            if not starts.size:
+                return []
+            costs = self.cost_model.placement_costs(occupied=self.occupied, starts=starts, **self._cost_kwargs(info))
+            best = starts[np.argsort(costs, kind="stable")[:MAX_RELOCATE_CANDIDATES]].tolist()
+            free_run = self.occupied.free_run
+            free_back = self.occupied.free_back
+            # relocate-into-gap: starts that sit flush against the left or right edge of a gap
+            flush = [
+                int(start)
+                for start in starts.tolist()
+                if (start == 0 or free_back[start - 1] == 0) or free_run[start] == required_slots
+            ]
+        finally:
+            self.occupied.occupy(info["start_idx"], info["end_idx"], task_id)
+        seen = {info["start_idx"]}
+        ordered = []
+        for start in best + flush:
+            if start not in seen:
+                seen.add(start)
+                ordered.append(start)
+        return ordered
+
+    def swap_candidates(self, first: int, second: int) -> List[Dict[int, int]]:
+        a = self.assignments[first]
+        b = self.assignments[second]
+        options = [{first: b["start_idx"], second: a["start_idx"]}]
+        if a["required_slots"] != b["required_slots"]:
+            # keep the pair's outer edges: the later task ends where the earlier block ended
+            early, late = (first, second) if a["start_idx"] < b["start_idx"] else (second, first)
+            early_info = self.assignments[early]
+            late_info = self.assignments[late]
+            options.append(
+                {
+                    late: early_info["start_idx"],
+                    early: late_info["end_idx"] - early_info["required_slots"],
+                }
+            )
+        return options
+
+
+def _search_day(
+    search: _DaySearch, task_ids: List[int], max_iterations: int, deadline: float, max_passes: int
+) -> Tuple[int, int, Optional[str]]:
+    """
+    First-improvement passes over one day's tasks. Returns (iterations,
+    improvements, limit), with ``limit`` None at a local optimum, else
+    ``"iterations"``, ``"passes"`` or ``"time"``.
+    """
+    iterations = 0
+    improvements = 0
+    for _ in range(max_passes):
+        improved = False
+        for position, task_id in enumerate(task_ids):
+            moves: List[Dict[int, int]] = [{task_id: start} for start in search.relocation_candidates(task_id)]
+            for other in task_ids[position + 1 :]:
+                moves.extend(search.swap_candidates(task_id, other))
+            for move in moves:
+                if iterations >= max_iterations:
+                    return iterations, improvements, "iterations"
+                if time.perf_counter() >= deadline:
+                    return iterations, improvements, "time"
+                iterations += 1
+                if search.attempt(move) is not None:
+                    improvements += 1
+                    improved = True
+                    break
+        if not improved:
+            return iterations, improvements, None
+    return iterations, improvements, "passes"
+
+
+def optimize_day(
+    assignments: Dict[int, Dict[str, Any]],
+    occupied: "OccupancyIndex",
+    cost_model: "DayCostModel",
+    budget_ms: float = LOCAL_SEARCH_BUDGET_MS,
+    max_passes: int = 50,
+    max_iterations: int = LOCAL_SEARCH_MAX_ITERATIONS,
+) -> Dict[str, Any]:
+    """
+    Improve a greedy day plan in place with a local search.
+
+    Each pass tries, for every task, relocations (best own-cost starts and
+    starts flush against a gap) and pairwise swaps, accepting the first move
+    that strictly lowers the total ``_placement_cost``. The search stops at a
+    local optimum, after ``max_passes`` or after ``max_iterations`` attempted
+    moves, so the result is never worse than the plan it started from and
+    depends only on the inputs. ``budget_ms`` is a safety limit on wall-clock
+    time set well above what the iteration cap needs; when it cuts the
+    search short the report says so in ``timed_out`` and the plan depends
+    on host load. A budget of 0 skips the search.
+
+    On a multi-day index each day is searched on its own, in date order, and
+    swaps are only generated between tasks of the same day. Every day is
+    allowed ``max_iterations`` moves plus whatever the days before it left
+    unused.
+    """
+    started = time.perf_counter()
+    report: Dict[str, Any] = {
+        "iterations": 0,
+        "improvements": 0,
+        "initial_cost": 0.0,
+        "final_cost": 0.0,
+        "cost_improvement": 0.0,
+        "elapsed_ms": 0.0,
+        "converged": True,
+        "timed_out": False,
+    }
+    if not assignments:
+        return report
+
+    search = _DaySearch(assignments, occupied, cost_model)
+    initial_cost = search.total_cost()
+    report["initial_cost"] = initial_cost
+    deadline = started + max(0.0, budget_ms) / 1000.0
+    day_slots = cost_model.day_slots
+    tasks_by_day: Dict[int, List[int]] = {}
+    for task_id, info in assignments.items():
+        tasks_by_day.setdefault(info["start_idx"] // day_slots, []).append(task_id)
+    iterations = 0
+    improvements = 0
+    converged = budget_ms > 0
+    timed_out = False
+
+    if converged:
+        allowance = 0
+        for _, task_ids in sorted(tasks_by_day.items()):
+            allowance += max(0, max_iterations)
+            day_iterations, day_improvements, limit = _search_day(search, task_ids, allowance, deadline, max_passes)
+            allowance -= day_iterations
+            iterations += day_iterations
+            improvements += day_improvements
+            converged = converged and limit is None
+            if limit == "time":
+                timed_out = True
+                break
+
+    final_cost = search.total_cost()
+    report.update(
+        iterations=iterations,
+        improvements=improvements,
+        final_cost=final_cost,
+        cost_improvement=initial_cost - final_cost,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+        converged=converged,
+        timed_out=timed_out,
+    )
+    return report
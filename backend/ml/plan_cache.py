@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+PLAN_CACHE_MAX_ENTRIES = 256
+PLAN_CACHE_MAX_TASKS = 20_000
+# bias decays continuously with feedback age; three decimals keeps the digest stable for minutes
+_BIAS_DIGITS = 3
+
+_MODEL_FINGERPRINTS: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Cannot fingerprint {type(value).__name__}")
+
+
+def model_fingerprint(model) -> str:
+    """
+    Digest of the model's pickled state, computed once per model object.
+    """
+    try:
+        return _MODEL_FINGERPRINTS[model]
+    except (KeyError, TypeError):
+        pass
+    try:
+        digest = hashlib.sha256(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+    except Exception:
+        digest = f"{type(model).__module__}.{type(model).__qualname__}:{id(model)}"
+    try:
+        _MODEL_FINGERPRINTS[model] = digest
+    except TypeError:
+        pass
+    return digest
+
+
+def feedback_digest(feedback_bias: Tuple[Dict[str, float], float]) -> Dict[str, float]:
+    bias_map, strength = feedback_bias
+    digest = {key: round(value, _BIAS_DIGITS) for key, value in bias_map.items()}
+    digest["strength"] = round(strength, _BIAS_DIGITS)
+    return digest
+
+
+def plan_fingerprint(
+    *,
+    kind: str,
+    tasks: Sequence[Dict[str, Any]],
+    feedback_bias: Tuple[Dict[str, float], float],
+    model,
+    **inputs: Any,
+) -> str:
+    """
+    Stable digest of everything a plan depends on.
+
+    Tasks keep their order (it breaks priority ties), keyword inputs such as
+    plan dates, occupied intervals and working hours are included verbatim,
+    feedback enters as its rounded bias map and the model as its state digest.
+    """
+    payload = {
+        "kind": kind,
+        "tasks": [sorted(task.items()) for task in tasks],
+        "feedback": sorted(feedback_digest(feedback_bias).items()),
+        "model": model_fingerprint(model),
+        "inputs": inputs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_json_default, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """
+    Thread-safe LRU of plan results keyed by ``plan_fingerprint``.
+
+    Bounded both by entry count and by the total number of tasks held, so a
+    few huge plans cannot pin unbounded memory. Results are deep-copied on
+    the way in and out; callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = PLAN_CACHE_MAX_ENTRIES, max_tasks: int = PLAN_CACHE_MAX_TASKS):
+        self.max_entries = max_entries
+        self.max_tasks = max_tasks
+        self._entries: "OrderedDict[str, tuple[Any, int]]" = OrderedDict()
+        self._tasks = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[0]
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any, size: int = 1) -> None:
+        if self.max_entries <= 0 or size > self.max_tasks:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._tasks -= previous[1]
+            self._entries[key] = (value, size)
+            self._tasks += size
+            while len(self._entries) > self.max_entries or self._tasks > self.max_tasks:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._tasks -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tasks = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "tasks": self._tasks,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import weakref
 from pathlib import Path
-from typing import List, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
 
 import joblib
 import numpy as np
 
+from .flat_trees import flatten_ensemble
+
 MODEL_PATH = Path(__file__).resolve().parent / "priority_model.pkl"
 
 USER_TYPE_MAP = {"student": 0, "worker": 1, "entrepreneur": 2}
@@ -58,11 +61,71 @@ def encode_features(
     ]
 
 
+def _category_table(mapping: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    names = sorted(mapping)
+    return np.array(names), np.array([mapping[name] for name in names], dtype=np.float64)
+
+
+# (sorted names, their codes) for the vectorised lookups in encode_feature_columns
+_USER_TYPE_CODES = _category_table(USER_TYPE_MAP)
+_IMPORTANCE_CODES = _category_table(IMPORTANCE_MAP)
+_TASK_TYPE_CODES = _category_table(TASK_TYPE_MAP)
+_PREF_TIME_CODES = _category_table(PREF_TIME_MAP)
+_ENERGY_CODES = _category_table(ENERGY_MAP)
+
+
+def _category_codes(values: Any, table: Tuple[np.ndarray, np.ndarray], default: int) -> np.ndarray:
+    # binary search in the sorted names; unknown values get ``default`` like the dict lookups above
+    names, codes = table
+    values = np.asarray(values, dtype=str)
+    pos = np.minimum(np.searchsorted(names, values), len(names) - 1)
+    return np.where(names[pos] == values, codes[pos], float(default))
+
+
+def encode_feature_columns(
+    *,
+    user_type: Any,
+    duration_minutes: Any,
+    hours_until_deadline: Any,
+    importance: Any,
+    task_type: Any,
+    preferred_time: Any,
+    energy: Any,
+    plan_day_of_week: Any,
+    is_weekend: Any,
+) -> np.ndarray:
+    """
+    Columnar ``encode_features``: each field is a sequence or array with one
+    entry per row, or a scalar shared by every row. Returns a C-contiguous
+    float64 matrix with one row per entry and columns in ``FEATURE_ORDER``.
+    """
+    columns = [
+        _category_codes(user_type, _USER_TYPE_CODES, 0),
+        np.asarray(duration_minutes, dtype=np.float64),
+        np.asarray(hours_until_deadline, dtype=np.float64),
+        _category_codes(importance, _IMPORTANCE_CODES, 1),
+        _category_codes(task_type, _TASK_TYPE_CODES, 0),
+        _category_codes(preferred_time, _PREF_TIME_CODES, 3),
+        _category_codes(energy, _ENERGY_CODES, 1),
+        np.asarray(plan_day_of_week, dtype=np.float64),
+        np.asarray(is_weekend, dtype=np.float64),
+    ]
+    shape = np.broadcast_shapes(*(column.shape for column in columns))
+    if len(shape) > 1:
+        raise ValueError(f"Feature columns must be one-dimensional, got shape {shape}")
+    features = np.empty((shape[0] if shape else 1, len(FEATURE_ORDER)), dtype=np.float64)
+    for idx, column in enumerate(columns):
+        features[:, idx] = column
+    return features
+
+
 def load_model(path: str | Path = MODEL_PATH):
     model_path = Path(path)
     if not model_path.exists():
         raise FileNotFoundError(f"Priority model artifact not found at {model_path}")
-    return joblib.load(model_path)
+    estimator = joblib.load(model_path)
+    # score with the flat-array export when the ensemble supports it
+    return flatten_ensemble(estimator) or estimator
 
 
 def predict(features: Sequence[float], *, model=None, path: str | Path = MODEL_PATH) -> float:
@@ -71,7 +134,19 @@ def predict(features: Sequence[float], *, model=None, path: str | Path = MODEL_P
     return float(estimator.predict(payload)[0])
 
 
+_FEATURE_IMPORTANCES: "weakref.WeakKeyDictionary[Any, List[float]]" = weakref.WeakKeyDictionary()
+
+
 def get_feature_importances(model) -> List[float]:
-    if hasattr(model, "feature_importances_"):
-        return list(model.feature_importances_)
-    return []
+    # sklearn recomputes feature_importances_ from every tree on each access; fitted models don't change
+    try:
+        return list(_FEATURE_IMPORTANCES[model])
+    except (KeyError, TypeError):
+        pass
+    importances = getattr(model, "feature_importances_", None)
+    importances = list(importances) if importances is not None else []
+    try:
+        _FEATURE_IMPORTANCES[model] = importances
+    except TypeError:
+        pass
+    return list(importances)
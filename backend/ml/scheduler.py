@@ -1,53 +1,74 @@
-﻿import random
-from datetime import datetime, timedelta, date
+﻿import hashlib
+import random
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, date, time
 from typing import List, Dict, Any, Tuple, Optional, Sequence
 
 import numpy as np
 
-from .priority_model import encode_features, load_model, get_feature_importances
+from .priority_model import encode_feature_columns, load_model, get_feature_importances
 from .explainer import generate_explanation
+from .exact import EXACT_BUDGET_MS, EXACT_NODE_LIMIT, solve_day_exact
+from .local_search import LOCAL_SEARCH_BUDGET_MS, LOCAL_SEARCH_MAX_ITERATIONS, optimize_day
 
 SLOT_MINUTES = 30
 
 
+def build_slot_offsets(
+    start_hour: int = 8,
+    end_hour: int = 22,
+    slot_minutes: int = SLOT_MINUTES,
+) -> List[int]:
+    """Slot start times as integer minutes from midnight of the plan date."""
+    return list(range(start_hour * 60, end_hour * 60, slot_minutes))
+
+
 def build_day_slots(
     day_date: date,
     start_hour: int = 8,
     end_hour: int = 22,
+    slot_minutes: int = SLOT_MINUTES,
 ) -> List[datetime]:
-    start = datetime.combine(day_date, datetime.min.time()).replace(hour=start_hour)
-    end = datetime.combine(day_date, datetime.min.time()).replace(hour=end_hour)
-    slots = []
-    current = start
-    while current < end:
-        slots.append(current)
-        current += timedelta(minutes=SLOT_MINUTES)
-    return slots
+    day_start = datetime.combine(day_date, time.min)
+    return [
+        day_start + timedelta(minutes=offset)
+        for offset in build_slot_offsets(start_hour, end_hour, slot_minutes)
+    ]
 
 
-def _bias_from_feedback(feedback: Optional[List[Any]]) -> Tuple[Dict[str, float], float]:
-    if not feedback:
-        return {}, 0.0
-    now = datetime.utcnow()
-    totals: Dict[str, float] = {}
-    weights: Dict[str, float] = {}
-    total_weight = 0.0
-    for fb in feedback:
-        task = getattr(fb, "task", None)
-        if not task or fb.outcome is None:
-            continue
-        created_at = getattr(fb, "created_at", None) or now
-        age_days = max(0.0, (now - created_at).total_seconds() / 86400.0)
-        weight = float(np.exp(-age_days / 14.0))
-        total_weight += weight
-        keys = (
-            f"type_importance:{task.task_type}:{task.importance}",
-            f"preferred_time:{task.preferred_time}",
-            f"energy:{task.energy}",
-        )
-        for key in keys:
-            totals[key] = totals.get(key, 0.0) + fb.outcome * weight
-            weights[key] = weights.get(key, 0.0) + weight
+def _stable_seed(plan_date: date, user_profile: str) -> int:
+    # hash() of a str is salted per process; the plan must not depend on which worker ran it
+    digest = hashlib.sha256(f"{plan_date.isoformat()}|{user_profile}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big")
+
+
+def _minutes_since(value: datetime, day_start: datetime) -> float:
+    return (value - day_start) / timedelta(minutes=1)
+
+
+FEEDBACK_DECAY_DAYS = 14.0
+
+
+def feedback_bias_keys(task: Any) -> Tuple[str, str, str]:
+    return (
+        f"type_importance:{task.task_type}:{task.importance}",
+        f"preferred_time:{task.preferred_time}",
+        f"energy:{task.energy}",
+    )
+
+
+def feedback_decay(age: timedelta) -> float:
+    return float(np.exp(-max(0.0, age.total_seconds() / 86400.0) / FEEDBACK_DECAY_DAYS))
+
+
+def _bias_from_totals(
+    totals: Dict[str, float],
+    weights: Dict[str, float],
+    total_weight: float,
+) -> Tuple[Dict[str, float], float]:
+    """
+    Turn decayed per-key outcome sums and weights into the bias map and its strength.
+    """
     bias = {}
     for key, total in totals.items():
         weight = weights.get(key, 0.0)
@@ -64,13 +85,42 @@ def _bias_from_feedback(feedback: Optional[List[Any]]) -> Tuple[Dict[str, float]
     return bias, strength
 
 
-def _time_window_indices(pref: str, n_slots: int, start_hour: int, end_hour: int) -> Tuple[int, int]:
+def _bias_from_feedback(
+    feedback: Optional[List[Any]],
+    now: Optional[datetime] = None,
+) -> Tuple[Dict[str, float], float]:
+    if not feedback:
+        return {}, 0.0
+    now = now or datetime.utcnow()
+    totals: Dict[str, float] = {}
+    weights: Dict[str, float] = {}
+    total_weight = 0.0
+    for fb in feedback:
+        task = getattr(fb, "task", None)
+        if not task or fb.outcome is None:
+            continue
+        created_at = getattr(fb, "created_at", None) or now
+        weight = feedback_decay(now - created_at)
+        total_weight += weight
+        for key in feedback_bias_keys(task):
+            totals[key] = totals.get(key, 0.0) + fb.outcome * weight
+            weights[key] = weights.get(key, 0.0) + weight
+    return _bias_from_totals(totals, weights, total_weight)
+
+
+def _time_window_indices(
+    pref: str,
+    n_slots: int,
+    start_hour: int,
+    end_hour: int,
+    slot_minutes: int = SLOT_MINUTES,
+) -> Tuple[int, int]:
     """
     Map preferred time windows to slot ranges based on configured working hours.
     """
 
     def hour_to_idx(hour: int) -> int:
-        return max(0, int(((hour - start_hour) * 60) / SLOT_MINUTES))
+        return max(0, int(((hour - start_hour) * 60) / slot_minutes))
 
     morning_end = min(end_hour, 12)
     afternoon_start = max(start_hour, 12)
@@ -87,80 +137,161 @@ def _time_window_indices(pref: str, n_slots: int, start_hour: int, end_hour: int
         return 0, n_slots
 
 
-def _attempt_place(
-    occupied: List[Optional[int]],
-    day_slots: List[datetime],
-    required_slots: int,
-    latest_end: datetime,
-    preferred_window: Tuple[int, int],
-) -> Optional[int]:
-    n_slots = len(day_slots)
-    pref_start, pref_end = preferred_window
+class OccupancyIndex:
+    """
+    Slot owners plus the length of the free runs around every slot.
 
-    def _can_place(start_idx: int) -> bool:
-        end_idx = start_idx + required_slots
-        if end_idx > n_slots:
-            return False
-        if day_slots[end_idx - 1] >= latest_end:
-            return False
-        return all(occupied[i] is None for i in range(start_idx, end_idx))
+    ``free_run[i]`` is the number of consecutive free slots beginning at ``i``
+    and ``free_back[i]`` the number ending at ``i`` (both 0 when the slot is
+    taken), so a task of ``required_slots`` fits at ``i`` exactly when
+    ``free_run[i] >= required_slots``. Occupying or releasing a range only
+    rewrites that range and the free runs directly beside it.
 
-    for start_idx in range(pref_start, min(pref_end, n_slots - required_slots + 1)):
-        if _can_place(start_idx):
-            return start_idx
+    With ``day_slots`` the index spans several days of ``day_slots`` slots
+    each: free runs, gaps and neighbours stop at day boundaries, which count
+    as day edges.
+    """
 
-    for start_idx in range(0, n_slots - required_slots + 1):
-        if _can_place(start_idx):
-            return start_idx
+    __slots__ = ("owners", "free_run", "free_back", "day_slots")
+
+    def __init__(self, n_slots: int, day_slots: Optional[int] = None):
+        self.day_slots = max(1, day_slots or n_slots)
+        day_slots = self.day_slots
+        self.owners: List[Optional[int]] = [None] * n_slots
+        self.free_run: List[int] = [day_slots - idx % day_slots for idx in range(n_slots)]
+        self.free_back: List[int] = [idx % day_slots + 1 for idx in range(n_slots)]
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+    def __getitem__(self, idx: int) -> Optional[int]:
+        return self.owners[idx]
+
+    def fits(self, start_idx: int, required_slots: int) -> bool:
+        return 0 <= start_idx < len(self.owners) and self.free_run[start_idx] >= required_slots
+
+    def fitting_starts(self, required_slots: int, stop: Optional[int] = None) -> List[int]:
+        """Every start index below ``stop`` whose free run can hold ``required_slots``."""
+        last = len(self.owners) - required_slots + 1
+        if stop is not None:
+            last = min(last, stop)
+        free_run = self.free_run
+        return [idx for idx in range(0, last) if free_run[idx] >= required_slots]
+
+    def _refresh_left(self, idx: int) -> None:
+        owners = self.owners
+        free_run = self.free_run
+        day_slots = self.day_slots
+        run = free_run[idx + 1] if idx + 1 < len(owners) and (idx + 1) % day_slots else 0
+        while idx >= 0 and owners[idx] is None:
+            run += 1
+            free_run[idx] = run
+            if idx % day_slots == 0:
+                break
+            idx -= 1
+
+    def _refresh_right(self, idx: int) -> None:
+        owners = self.owners
+        free_back = self.free_back
+        day_slots = self.day_slots
+        run = free_back[idx - 1] if idx > 0 and idx % day_slots else 0
+        while idx < len(owners) and owners[idx] is None:
+            run += 1
+            free_back[idx] = run
+            idx += 1
+            if idx % day_slots == 0:
+                break
 
-    return None
+    def occupy(self, start_idx: int, end_idx: int, owner: int) -> None:
+        for i in range(start_idx, end_idx):
+            self.owners[i] = owner
+            self.free_run[i] = 0
+            self.free_back[i] = 0
+        self._refresh_left(start_idx - 1)
+        self._refresh_right(end_idx)
+
+    def release(self, start_idx: int, end_idx: int) -> None:
+        for i in range(start_idx, end_idx):
+            self.owners[i] = None
+        self._refresh_left(end_idx - 1)
+        self._refresh_right(start_idx)
+
+    def left_gap(self, start_idx: int) -> int:
+        """Free slots between ``start_idx`` and the previous occupied slot (0 if it touches the day start)."""
+        gap = self.free_back[start_idx - 1] if start_idx % self.day_slots else 0
+        return gap if (start_idx - gap) % self.day_slots else 0
+
+    def right_gap(self, end_idx: int) -> int:
+        """Free slots between ``end_idx`` and the next occupied slot (0 if it touches the day end)."""
+        gap = self.free_run[end_idx] if end_idx < len(self.owners) and end_idx % self.day_slots else 0
+        return gap if (end_idx + gap) % self.day_slots else 0
+
+    def neighbors(self, start_idx: int, end_idx: int) -> Tuple[Optional[int], Optional[int]]:
+        """Owners of the nearest occupied slots before ``start_idx`` and from ``end_idx`` on, within the day."""
+        left_owner = right_owner = None
+        if start_idx % self.day_slots:
+            left = start_idx - 1
+            if self.owners[left] is None:
+                left -= self.free_back[left]
+            if left >= start_idx - start_idx % self.day_slots:
+                left_owner = self.owners[left]
+        if end_idx < len(self.owners) and end_idx % self.day_slots:
+            right = end_idx
+            if self.owners[right] is None:
+                right += self.free_run[right]
+            if right < min(len(self.owners), end_idx - end_idx % self.day_slots + self.day_slots):
+                right_owner = self.owners[right]
+        return left_owner, right_owner
+
+
+def _sliver_slots(slot_minutes: int) -> int:
+    # Gaps shorter than two default slots (an hour) are too short to be useful.
+    return max(1, (2 * SLOT_MINUTES + slot_minutes - 1) // slot_minutes - 1)
+
+
+def _latest_fitting_stop(
+    slot_offsets: Sequence[int],
+    required_slots: int,
+    latest_end_minute: float,
+) -> int:
+    """
+    One past the latest start index whose last slot begins before ``latest_end_minute``.
+    """
+    usable_slots = bisect_left(slot_offsets, latest_end_minute)
+    return max(0, usable_slots - required_slots + 1)
 
 
 def _fragmentation_penalty(
-    occupied: List[Optional[int]],
+    occupied: OccupancyIndex,
     start_idx: int,
     required_slots: int,
+    sliver_slots: int = 1,
 ) -> float:
-    n_slots = len(occupied)
-    end_idx = start_idx + required_slots
     penalty = 0.0
-
-    left_gap = 0
-    i = start_idx - 1
-    while i >= 0 and occupied[i] is None:
-        left_gap += 1
-        i -= 1
-    if 0 < left_gap < 2 and i >= 0 and occupied[i] is not None:
+    if 0 < occupied.left_gap(start_idx) <= sliver_slots:
         penalty += 1.0
-
-    right_gap = 0
-    i = end_idx
-    while i < n_slots and occupied[i] is None:
-        right_gap += 1
-        i += 1
-    if 0 < right_gap < 2 and i < n_slots and occupied[i] is not None:
+    if 0 < occupied.right_gap(start_idx + required_slots) <= sliver_slots:
         penalty += 1.0
-
     return penalty * 2.0
 
 
 def _placement_cost(
     *,
-    occupied: List[Optional[int]],
-    day_slots: List[datetime],
+    occupied: OccupancyIndex,
+    slot_offsets: Sequence[int],
     start_idx: int,
     required_slots: int,
-    latest_end: datetime,
+    latest_end_minute: float,
     preferred_window: Tuple[int, int],
     task_energy: str,
     duration_minutes: int,
     hours_until_deadline: float,
+    sliver_slots: int = 1,
 ) -> float:
     pref_start, pref_end = preferred_window
     preferred_penalty = 0.0 if pref_start <= start_idx < pref_end else 4.0
 
-    end_dt = day_slots[start_idx] + timedelta(minutes=duration_minutes)
-    slack_minutes = max(0.0, (latest_end - end_dt).total_seconds() / 60.0)
+    slack_minutes = max(0.0, latest_end_minute - (slot_offsets[start_idx] + duration_minutes))
     urgency_penalty = 0.0
     if hours_until_deadline < 48.0:
         urgency_weight = (48.0 - hours_until_deadline) / 48.0
@@ -168,147 +299,315 @@ def _placement_cost(
             urgency_penalty = ((240.0 - slack_minutes) / 240.0) * 6.0 * urgency_weight
 
     energy_mismatch_penalty = 0.0
-    start_hour = day_slots[start_idx].hour
+    start_hour = slot_offsets[start_idx] // 60 % 24
     if task_energy == "high" and start_hour >= 17:
         energy_mismatch_penalty = 2.0
     elif task_energy == "low" and start_hour < 12:
         energy_mismatch_penalty = 2.0
 
-    fragmentation_penalty = _fragmentation_penalty(occupied, start_idx, required_slots)
+    fragmentation_penalty = _fragmentation_penalty(occupied, start_idx, required_slots, sliver_slots)
 
-    return preferred_penalty + urgency_penalty + energy_mismatch_penalty + fragmentation_penalty
+    # Summed in the same order as DayCostModel.placement_costs so both agree bit for bit.
+    return (preferred_penalty + energy_mismatch_penalty) + urgency_penalty + fragmentation_penalty
 
 
-def _best_start_slot(
-    occupied: List[Optional[int]],
-    day_slots: List[datetime],
-    required_slots: int,
-    latest_end: datetime,
-    preferred_window: Tuple[int, int],
-    task_energy: str,
-    duration_minutes: int,
-    hours_until_deadline: float,
-    feedback_strength: float,
-    rng: random.Random,
-) -> Optional[int]:
-    n_slots = len(day_slots)
+class DayCostModel:
+    """
+    Vectorized ``_placement_cost`` for one day of slots.
 
-    def _can_place(start_idx: int) -> bool:
-        end_idx = start_idx + required_slots
-        if end_idx > n_slots:
-            return False
-        if day_slots[end_idx - 1] >= latest_end:
-            return False
-        return all(occupied[i] is None for i in range(start_idx, end_idx))
+    The preferred-window and energy-mismatch terms only depend on the slot, so
+    they are precomputed once per (preferred window, energy) combination. The
+    urgency and fragmentation terms are evaluated for all candidate starts at
+    once.
 
-    pref_start, pref_end = preferred_window
-    if pref_end > pref_start:
-        pref_center = (pref_start + pref_end - 1) / 2.0
-    else:
-        pref_center = max(0.0, (n_slots - 1) / 2.0)
+    A multi-day horizon passes minute offsets from the first day's midnight
+    and ``day_slots``; preferred windows are then day-relative slot ranges.
+    """
 
-    candidates: List[Tuple[float, float, int, int]] = []
-    candidates_by_cost: List[Tuple[float, int]] = []
+    def __init__(self, slot_offsets: Sequence[int], slot_minutes: int = SLOT_MINUTES, day_slots: Optional[int] = None):
+        self.slot_offsets = list(slot_offsets)
+        self.n_slots = len(self.slot_offsets)
+        self.day_slots = max(1, day_slots or self.n_slots)
+        self.slot_minutes = slot_minutes
+        self.sliver_slots = _sliver_slots(slot_minutes)
+        self._offsets = np.array(self.slot_offsets, dtype=np.int64)
+        self.slot_hours = self._offsets // 60 % 24
+        self._static: Dict[Tuple[Tuple[int, int], str], np.ndarray] = {}
+
+    def static_costs(self, preferred_window: Tuple[int, int], task_energy: str) -> np.ndarray:
+        key = (preferred_window, task_energy)
+        cached = self._static.get(key)
+        if cached is None:
+            pref_start, pref_end = preferred_window
+            idx = np.arange(self.n_slots) % self.day_slots
+            preferred_penalty = np.where((idx >= pref_start) & (idx < pref_end), 0.0, 4.0)
+            if task_energy == "high":
+                energy_penalty = np.where(self.slot_hours >= 17, 2.0, 0.0)
+            elif task_energy == "low":
+                energy_penalty = np.where(self.slot_hours < 12, 2.0, 0.0)
+            else:
+                energy_penalty = np.zeros(self.n_slots)
+            cached = preferred_penalty + energy_penalty
+            self._static[key] = cached
+        return cached
+
+    def urgency_costs(
+        self,
+        starts: np.ndarray,
+        latest_end_minute: float,
+        duration_minutes: int,
+        hours_until_deadline: float,
+    ) -> np.ndarray:
+        if hours_until_deadline >= 48.0:
+            return np.zeros(len(starts))
+        urgency_weight = (48.0 - hours_until_deadline) / 48.0
+        slack_minutes = np.maximum(0.0, latest_end_minute - (self._offsets[starts] + duration_minutes))
+        return np.where(
+            slack_minutes < 240.0,
+            ((240.0 - slack_minutes) / 240.0) * 6.0 * urgency_weight,
+            0.0,
+        )
 
-    for start_idx in range(0, n_slots - required_slots + 1):
-        if not _can_place(start_idx):
-            continue
-        cost = _placement_cost(
+    def fragmentation_costs(
+        self,
+        occupied: OccupancyIndex,
+        starts: np.ndarray,
+        required_slots: int,
+    ) -> np.ndarray:
+        n_slots = self.n_slots
+        day_slots = self.day_slots
+        sliver_slots = self.sliver_slots
+        # only the slots from just before the first candidate to just past the last can matter
+        base = max(int(starts.min()) - 1, 0) if len(starts) else 0
+        limit = min(n_slots, int(starts.max()) + required_slots + 1) if len(starts) else 0
+        free_run = np.asarray(occupied.free_run[base:limit])
+        free_back = np.asarray(occupied.free_back[base:limit])
+
+        # gaps that reach a day edge are not slivers
+        left_gap = np.where(starts % day_slots > 0, free_back[np.maximum(starts - 1, 0) - base], 0)
+        left = (left_gap > 0) & (left_gap <= sliver_slots) & ((starts - left_gap) % day_slots > 0)
+        ends = starts + required_slots
+        right_gap = np.where((ends < n_slots) & (ends % day_slots > 0), free_run[np.minimum(ends, n_slots - 1) - base], 0)
+        right = (right_gap > 0) & (right_gap <= sliver_slots) & ((ends + right_gap) % day_slots > 0)
+        return (left.astype(float) + right.astype(float)) * 2.0
+
+    def start_stop(self, required_slots: int, latest_end_minute: float) -> int:
+        return min(_latest_fitting_stop(self.slot_offsets, required_slots, latest_end_minute), self.n_slots)
+
+    def candidate_starts(
+        self,
+        occupied: OccupancyIndex,
+        required_slots: int,
+        latest_end_minute: float,
+        days: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Fitting start slots before the deadline, optionally only within the
+        ascending day indices ``days``.
+        """
+        stop = self.start_stop(required_slots, latest_end_minute)
+        if stop <= 0:
+            return np.empty(0, dtype=np.int64)
+        if days is None:
+            return np.flatnonzero(np.asarray(occupied.free_run[:stop]) >= required_slots)
+        # one slice per stretch of consecutive days
+        breaks = np.flatnonzero(np.diff(days) != 1) + 1
+        free_run = occupied.free_run
+        found = []
+        for first, last in zip(np.r_[days[:1], days[breaks]].tolist(), np.r_[days[breaks - 1], days[-1:]].tolist()):
+            lo, hi = first * self.day_slots, min(stop, (last + 1) * self.day_slots)
+            if lo >= hi:
+                break
+            found.append(lo + np.flatnonzero(np.asarray(free_run[lo:hi]) >= required_slots))
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+
+    def placement_cost(
+        self,
+        *,
+        occupied: OccupancyIndex,
+        start_idx: int,
+        required_slots: int,
+        latest_end_minute: float,
+        preferred_window: Tuple[int, int],
+        task_energy: str,
+        duration_minutes: int,
+        hours_until_deadline: float,
+    ) -> float:
+        return _placement_cost(
             occupied=occupied,
-            day_slots=day_slots,
+            slot_offsets=self.slot_offsets,
             start_idx=start_idx,
             required_slots=required_slots,
-            latest_end=latest_end,
+            latest_end_minute=latest_end_minute,
             preferred_window=preferred_window,
             task_energy=task_energy,
             duration_minutes=duration_minutes,
             hours_until_deadline=hours_until_deadline,
+            sliver_slots=self.sliver_slots,
+        )
+
+    def placement_costs(
+        self,
+        *,
+        occupied: OccupancyIndex,
+        starts: np.ndarray,
+        required_slots: int,
+        latest_end_minute: float,
+        preferred_window: Tuple[int, int],
+        task_energy: str,
+        duration_minutes: int,
+        hours_until_deadline: float,
+    ) -> np.ndarray:
+        return (
+            self.static_costs(preferred_window, task_energy)[starts]
+            + self.urgency_costs(starts, latest_end_minute, duration_minutes, hours_until_deadline)
+            + self.fragmentation_costs(occupied, starts, required_slots)
         )
-        center_distance = abs(start_idx - pref_center)
-        early_start_penalty = 1 if start_idx == 0 else 0
-        candidates.append((cost, center_distance, early_start_penalty, start_idx))
-        candidates_by_cost.append((cost, start_idx))
 
-    if not candidates:
+
+def _best_start_slot(
+    occupied: OccupancyIndex,
+    slot_offsets: Sequence[int],
+    required_slots: int,
+    latest_end_minute: float,
+    preferred_window: Tuple[int, int],
+    task_energy: str,
+    duration_minutes: int,
+    hours_until_deadline: float,
+    feedback_strength: float,
+    rng: random.Random,
+    cost_model: Optional[DayCostModel] = None,
+    day_costs: Optional[np.ndarray] = None,
+    days: Optional[np.ndarray] = None,
+) -> Optional[int]:
+    cost_model = cost_model or DayCostModel(slot_offsets)
+    n_slots = cost_model.day_slots
+
+    starts = cost_model.candidate_starts(occupied, required_slots, latest_end_minute, days)
+    if not starts.size:
         return None
+    costs = cost_model.placement_costs(
+        occupied=occupied,
+        starts=starts,
+        required_slots=required_slots,
+        latest_end_minute=latest_end_minute,
+        preferred_window=preferred_window,
+        task_energy=task_energy,
+        duration_minutes=duration_minutes,
+        hours_until_deadline=hours_until_deadline,
+    )
+    if day_costs is not None:
+        # horizon mode: per-day load/deadline cost of the day each start falls on
+        costs = costs + day_costs[starts // n_slots]
 
     if feedback_strength < 0.4 and rng.random() < 0.10:
-        candidates_by_cost.sort(key=lambda item: item[0])
-        top = candidates_by_cost[:3]
-        return rng.choice(top)[1]
+        top = starts[np.argsort(costs, kind="stable")[:3]]
+        return int(rng.choice(top.tolist()))
 
-    candidates.sort(key=lambda item: (item[0], item[1], item[2], item[3]))
-    return candidates[0][3]
+    pref_start, pref_end = preferred_window
+    if pref_end > pref_start:
+        pref_center = (pref_start + pref_end - 1) / 2.0
+    else:
+        pref_center = max(0.0, (n_slots - 1) / 2.0)
+    day_starts = starts % n_slots
+    center_distance = np.abs(day_starts - pref_center)
+    early_start_penalty = (day_starts == 0).astype(np.int64)
+    # lexsort keys run from least to most significant
+    order = np.lexsort((starts, early_start_penalty, center_distance, costs))
+    return int(starts[order[0]])
 
 
 def _apply_occupied_intervals(
-    occupied: List[Optional[int]],
-    day_slots: List[datetime],
+    occupied: OccupancyIndex,
+    slot_offsets: Sequence[int],
+    day_start: datetime,
     intervals: Optional[Sequence[Tuple[datetime, datetime]]],
+    slot_minutes: int = SLOT_MINUTES,
 ) -> None:
-    if not intervals or not day_slots:
+    if not intervals or not slot_offsets:
         return
-    day_start = day_slots[0]
-    day_end = day_slots[-1] + timedelta(minutes=SLOT_MINUTES)
     for start, end in intervals:
-        if end <= day_start or start >= day_end:
-            continue
-        for idx, slot_start in enumerate(day_slots):
-            slot_end = slot_start + timedelta(minutes=SLOT_MINUTES)
-            if slot_start < end and slot_end > start:
-                occupied[idx] = -1
-
-
-def _shift_earlier(assignments, occupied, day_slots):
-    # Try to move tasks earlier if the placement cost improves.
-    n_slots = len(day_slots)
-    for task_id, info in assignments.items():
-        required_slots = info["required_slots"]
-        current_start = info["start_idx"]
-        latest_end = info["latest_end"]
-        preferred_window = info.get("preferred_window", (0, n_slots))
-        task_energy = info.get("energy", "medium")
-        duration_minutes = info.get("duration_minutes", required_slots * SLOT_MINUTES)
-        hours_until_deadline = info.get("hours_until_deadline", 0.0)
-        temp_occupied = [None if slot == task_id else slot for slot in occupied]
-        current_cost = _placement_cost(
-            occupied=temp_occupied,
-            day_slots=day_slots,
-            start_idx=current_start,
-            required_slots=required_slots,
-            latest_end=latest_end,
-            preferred_window=preferred_window,
-            task_energy=task_energy,
-            duration_minutes=duration_minutes,
-            hours_until_deadline=hours_until_deadline,
-        )
-        for start_idx in range(0, current_start):
-            end_idx = start_idx + required_slots
-            if end_idx > n_slots or day_slots[end_idx - 1] >= latest_end:
-                break
-            if all(temp_occupied[i] is None for i in range(start_idx, end_idx)):
-                candidate_cost = _placement_cost(
-                    occupied=temp_occupied,
-                    day_slots=day_slots,
-                    start_idx=start_idx,
-                    required_slots=required_slots,
-                    latest_end=latest_end,
-                    preferred_window=preferred_window,
-                    task_energy=task_energy,
-                    duration_minutes=duration_minutes,
-                    hours_until_deadline=hours_until_deadline,
-                )
-                if candidate_cost >= current_cost:
-                    continue
-                # free current slots
-                for i in range(info["start_idx"], info["end_idx"]):
-                    occupied[i] = None
-                # place earlier
-                for i in range(start_idx, end_idx):
-                    occupied[i] = task_id
-                info["start_idx"] = start_idx
-                info["end_idx"] = end_idx
-                break
+        # slot i overlaps [start, end) when start - slot_minutes < offset_i < end
+        first = bisect_right(slot_offsets, _minutes_since(start, day_start) - slot_minutes)
+        last = bisect_left(slot_offsets, _minutes_since(end, day_start))
+        if first < last:
+            occupied.occupy(first, last, -1)
+
+
+def _bias_reasons(task: Dict[str, Any], bias_map: Dict[str, float]) -> List[str]:
+    reasons = []
+    if f"type_importance:{task['task_type']}:{task['importance']}" in bias_map:
+        reasons.append(f"{task['task_type']} {task['importance']}")
+    if f"preferred_time:{task['preferred_time']}" in bias_map:
+        if task["preferred_time"] != "anytime":
+            reasons.append(f"{task['preferred_time']} time")
+        else:
+            reasons.append("time preference")
+    if f"energy:{task['energy']}" in bias_map:
+        reasons.append(f"{task['energy']} energy")
+    return reasons
+
+
+def _score_tasks(
+    tasks: List[Dict[str, Any]],
+    *,
+    user_profile: str,
+    plan_date: date,
+    plan_start: datetime,
+    bias_map: Dict[str, float],
+    model,
+) -> List[Dict[str, Any]]:
+    """
+    Score every task with a single model call and fold in the runtime boosts.
+
+    Feedback bias, urgency and importance boosts are applied column-wise so the
+    resulting priorities match scoring each task on its own.
+    """
+    if not tasks:
+        return []
+    plan_day_of_week = plan_date.weekday()
+    is_weekend = 1 if plan_day_of_week >= 5 else 0
+
+    hours_until_deadline = np.array(
+        [max(0.0, (t["deadline"] - plan_start).total_seconds() / 3600.0) for t in tasks],
+        dtype=float,
+    )
+    features = encode_feature_columns(
+        user_type=user_profile,
+        duration_minutes=[t["duration_minutes"] for t in tasks],
+        hours_until_deadline=hours_until_deadline,
+        importance=[t["importance"] for t in tasks],
+        task_type=[t["task_type"] for t in tasks],
+        preferred_time=[t["preferred_time"] for t in tasks],
+        energy=[t["energy"] for t in tasks],
+        plan_day_of_week=plan_day_of_week,
+        is_weekend=is_weekend,
+    )
+    base_priority = np.asarray(model.predict(features), dtype=float)
+
+    bias = (
+        0.0
+        + np.array([bias_map.get(f"type_importance:{t['task_type']}:{t['importance']}", 0.0) for t in tasks])
+        + np.array([bias_map.get(f"preferred_time:{t['preferred_time']}", 0.0) for t in tasks])
+        + np.array([bias_map.get(f"energy:{t['energy']}", 0.0) for t in tasks])
+    )
+    urgency_boost = np.where(
+        hours_until_deadline < 48.0, (48.0 - hours_until_deadline) / 48.0 * 1.5, 0.0
+    ) + np.where(hours_until_deadline < 24.0, (24.0 - hours_until_deadline) / 24.0 * 1.5, 0.0)
+    importance_boost = np.where([t["importance"] == "high" for t in tasks], 0.4, 0.0)
+    priority = base_priority + bias + urgency_boost + importance_boost
+
+    return [
+        {
+            "task": t,
+            "priority": float(priority[idx]),
+            "base_priority": float(base_priority[idx]),
+            "hours_until_deadline": float(hours_until_deadline[idx]),
+            "bias": float(bias[idx]),
+            "bias_reasons": _bias_reasons(t, bias_map) if bias_map else [],
+        }
+        for idx, t in enumerate(tasks)
+    ]
 
 
 def _llm_style_explanation(task, start_dt, user_profile, priority, bias_text):
@@ -318,6 +617,52 @@ def _llm_style_explanation(task, start_dt, user_profile, priority, bias_text):
     )
 
 
+def _scheduled_entry(
+    item: Dict[str, Any],
+    *,
+    start_dt: datetime,
+    in_preferred_window: bool,
+    user_profile: str,
+    top_features: List[int],
+) -> Dict[str, Any]:
+    t = item["task"]
+    end_dt = start_dt + timedelta(minutes=t["duration_minutes"])
+    active_constraints = {
+        "preferred_window": in_preferred_window,
+        "deadline_binding": end_dt >= t["deadline"] - timedelta(hours=1),
+        "low_conflicts": True,
+    }
+
+    bias_text = ""
+    if abs(item["bias"]) > 0 and item["bias_reasons"]:
+        direction = "earlier" if item["bias"] > 0 else "later"
+        reasons = ", ".join(item["bias_reasons"])
+        bias_text = f"Personalization: adjusted {direction} based on your feedback for {reasons}."
+
+    explanation = generate_explanation(
+        task=t,
+        user_profile=user_profile,
+        priority=item["priority"],
+        start_dt=start_dt,
+        end_dt=end_dt,
+        hours_until_deadline=item["hours_until_deadline"],
+        active_constraints=active_constraints,
+        top_features=top_features,
+        bias_reason=bias_text,
+    )
+    llm_exp = _llm_style_explanation(t, start_dt, user_profile, item["priority"], bias_text)
+
+    return {
+        "task_id": t["id"],
+        "title": t["title"],
+        "start": start_dt.isoformat(),
+        "end": end_dt.isoformat(),
+        "explanation": explanation,
+        "priority": item["priority"],
+        "llm_explanation": llm_exp,
+    }
+
+
 def schedule_day(
     tasks: List[Dict[str, Any]],
     user_profile: str,
@@ -327,165 +672,95 @@ def schedule_day(
     end_hour: int = 22,
     occupied_intervals: Optional[Sequence[Tuple[datetime, datetime]]] = None,
     model=None,
+    slot_minutes: int = SLOT_MINUTES,
+    search_budget_ms: float = LOCAL_SEARCH_BUDGET_MS,
+    search_max_iterations: int = LOCAL_SEARCH_MAX_ITERATIONS,
+    search_stats: Optional[Dict[str, Any]] = None,
+    exact: bool = False,
+    exact_budget_ms: float = EXACT_BUDGET_MS,
+    exact_node_limit: int = EXACT_NODE_LIMIT,
+    feedback_bias: Optional[Tuple[Dict[str, float], float]] = None,
 ):
     model = model or load_model()
     feature_importances = get_feature_importances(model)
     top_features = list(np.argsort(feature_importances)[::-1][:3]) if feature_importances else []
     model_confidence = float(np.sum(feature_importances[:3])) if feature_importances else None
 
-    day_slots = build_day_slots(plan_date, start_hour=start_hour, end_hour=end_hour)
-    if not day_slots:
+    slot_offsets = build_slot_offsets(start_hour=start_hour, end_hour=end_hour, slot_minutes=slot_minutes)
+    if not slot_offsets:
         return [], [{**t, "reason": "No working hours configured for this day"} for t in tasks], model_confidence
-    n_slots = len(day_slots)
-    occupied: List[Optional[int]] = [None] * n_slots
-    _apply_occupied_intervals(occupied, day_slots, occupied_intervals)
+    n_slots = len(slot_offsets)
+    day_start = datetime.combine(plan_date, time.min)
+    occupied = OccupancyIndex(n_slots)
+    _apply_occupied_intervals(occupied, slot_offsets, day_start, occupied_intervals, slot_minutes)
+    cost_model = DayCostModel(slot_offsets, slot_minutes)
 
-    plan_start = day_slots[0]
+    plan_start = day_start + timedelta(minutes=slot_offsets[0])
     scheduled = []
     assignments = {}
     unscheduled = []
 
-    bias_map, feedback_strength = _bias_from_feedback(feedback)
-    seed = hash((plan_date.isoformat(), user_profile)) & 0xFFFFFFFF
-    rng = random.Random(seed)
-    plan_day_of_week = plan_date.weekday()
-    is_weekend = 1 if plan_day_of_week >= 5 else 0
-
-    scored_tasks = []
-    for t in tasks:
-        hours_until_deadline = max(
-            0.0, (t["deadline"] - plan_start).total_seconds() / 3600.0
-        )
-        features = encode_features(
-            user_type=user_profile,
-            duration_minutes=t["duration_minutes"],
-            hours_until_deadline=hours_until_deadline,
-            importance=t["importance"],
-            task_type=t["task_type"],
-            preferred_time=t["preferred_time"],
-            energy=t["energy"],
-            plan_day_of_week=plan_day_of_week,
-            is_weekend=is_weekend,
-        )
-        base_priority = float(model.predict([features])[0])
-        bias = 0.0
-        bias_reasons = []
-        type_key = f"type_importance:{t['task_type']}:{t['importance']}"
-        if type_key in bias_map:
-            bias += bias_map[type_key]
-            bias_reasons.append(f"{t['task_type']} {t['importance']}")
-        pref_key = f"preferred_time:{t['preferred_time']}"
-        if pref_key in bias_map:
-            bias += bias_map[pref_key]
-            if t["preferred_time"] != "anytime":
-                bias_reasons.append(f"{t['preferred_time']} time")
-            else:
-                bias_reasons.append("time preference")
-        energy_key = f"energy:{t['energy']}"
-        if energy_key in bias_map:
-            bias += bias_map[energy_key]
-            bias_reasons.append(f"{t['energy']} energy")
-
-        urgency_boost = 0.0
-        if hours_until_deadline < 48.0:
-            urgency_boost = (48.0 - hours_until_deadline) / 48.0 * 1.5
-            if hours_until_deadline < 24.0:
-                urgency_boost += (24.0 - hours_until_deadline) / 24.0 * 1.5
-
-        importance_boost = 0.4 if t["importance"] == "high" else 0.0
-
-        priority = base_priority + bias + urgency_boost + importance_boost
-        scored_tasks.append(
-            {
-                "task": t,
-                "priority": priority,
-                "base_priority": base_priority,
-                "hours_until_deadline": hours_until_deadline,
-                "bias": bias,
-                "bias_reasons": bias_reasons,
-            }
-        )
+    bias_map, feedback_strength = feedback_bias if feedback_bias is not None else _bias_from_feedback(feedback)
+    rng = random.Random(_stable_seed(plan_date, user_profile))
 
+    scored_tasks = _score_tasks(
+        tasks,
+        user_profile=user_profile,
+        plan_date=plan_date,
+        plan_start=plan_start,
+        bias_map=bias_map,
+        model=model,
+    )
     scored_tasks.sort(key=lambda x: x["priority"], reverse=True)
 
     for item in scored_tasks:
         t = item["task"]
-        required_slots = (t["duration_minutes"] + SLOT_MINUTES - 1) // SLOT_MINUTES
+        required_slots = (t["duration_minutes"] + slot_minutes - 1) // slot_minutes
 
         if required_slots > n_slots:
             unscheduled.append({**t, "reason": "Duration exceeds available day length"})
             continue
 
-        latest_end = min(
-            datetime.combine(plan_date, datetime.min.time()).replace(hour=end_hour),
-            t["deadline"],
-        )
+        latest_end_minute = min(end_hour * 60.0, _minutes_since(t["deadline"], day_start))
 
-        preferred_window = _time_window_indices(t["preferred_time"], n_slots, start_hour, end_hour)
+        preferred_window = _time_window_indices(
+            t["preferred_time"], n_slots, start_hour, end_hour, slot_minutes
+        )
         best_start = _best_start_slot(
             occupied=occupied,
-            day_slots=day_slots,
+            slot_offsets=slot_offsets,
             required_slots=required_slots,
-            latest_end=latest_end,
+            latest_end_minute=latest_end_minute,
             preferred_window=preferred_window,
             task_energy=t["energy"],
             duration_minutes=t["duration_minutes"],
             hours_until_deadline=item["hours_until_deadline"],
             feedback_strength=feedback_strength,
             rng=rng,
+            cost_model=cost_model,
         )
 
         if best_start is None:
             unscheduled.append({**t, "reason": "No available slot before deadline/preference"})
             continue
 
-        for i in range(best_start, best_start + required_slots):
-            occupied[i] = t["id"]
-
-        start_dt = day_slots[best_start]
-        end_dt = start_dt + timedelta(minutes=t["duration_minutes"])
-
-        active_constraints = {
-            "preferred_window": best_start >= preferred_window[0] and best_start < preferred_window[1],
-            "deadline_binding": end_dt >= t["deadline"] - timedelta(hours=1),
-            "low_conflicts": True,
-        }
-
-        bias_text = ""
-        if abs(item["bias"]) > 0 and item["bias_reasons"]:
-            direction = "earlier" if item["bias"] > 0 else "later"
-            reasons = ", ".join(item["bias_reasons"])
-            bias_text = f"Personalization: adjusted {direction} based on your feedback for {reasons}."
-
-        explanation = generate_explanation(
-            task=t,
-            user_profile=user_profile,
-            priority=item["priority"],
-            start_dt=start_dt,
-            end_dt=end_dt,
-            hours_until_deadline=item["hours_until_deadline"],
-            active_constraints=active_constraints,
-            top_features=top_features,
-            bias_reason=bias_text,
-        )
-        llm_exp = _llm_style_explanation(t, start_dt, user_profile, item["priority"], bias_text)
+        occupied.occupy(best_start, best_start + required_slots, t["id"])
 
+        start_dt = day_start + timedelta(minutes=slot_offsets[best_start])
         scheduled.append(
-            {
-                "task_id": t["id"],
-                "title": t["title"],
-                "start": start_dt.isoformat(),
-                "end": end_dt.isoformat(),
-                "explanation": explanation,
-                "priority": item["priority"],
-                "llm_explanation": llm_exp,
-            }
+            _scheduled_entry(
+                item,
+                start_dt=start_dt,
+                in_preferred_window=preferred_window[0] <= best_start < preferred_window[1],
+                user_profile=user_profile,
+                top_features=top_features,
+            )
         )
 
         assignments[t["id"]] = {
             "start_idx": best_start,
             "end_idx": best_start + required_slots,
-            "latest_end": latest_end,
+            "latest_end_minute": latest_end_minute,
             "required_slots": required_slots,
             "preferred_window": preferred_window,
             "energy": t["energy"],
@@ -493,15 +768,24 @@ def schedule_day(
             "hours_until_deadline": item["hours_until_deadline"],
         }
 
-    # Local improvement: move tasks earlier when possible
-    _shift_earlier(assignments, occupied, day_slots)
+    # Local improvement: moves, swaps and gap relocations up to the iteration cap
+    report = optimize_day(
+        assignments, occupied, cost_model, budget_ms=search_budget_ms, max_iterations=search_max_iterations
+    )
+    # Best-quality mode: prove (or approach) the minimum-cost placement for small days
+    if exact:
+        report["exact"] = solve_day_exact(
+            assignments, occupied, cost_model, budget_ms=exact_budget_ms, node_limit=exact_node_limit
+        )
+    if search_stats is not None:
+        search_stats.update(report)
 
     # Recompute scheduled outputs to reflect shifts
     for s in scheduled:
         info = assignments.get(s["task_id"])
         if info:
-            start_dt = day_slots[info["start_idx"]]
-            end_dt = day_slots[info["end_idx"] - 1] + timedelta(minutes=SLOT_MINUTES)
+            start_dt = day_start + timedelta(minutes=slot_offsets[info["start_idx"]])
+            end_dt = day_start + timedelta(minutes=slot_offsets[info["end_idx"] - 1] + slot_minutes)
             s["start"] = start_dt.isoformat()
             s["end"] = end_dt.isoformat()
 
@@ -4,22 +4,31 @@ import logging
 import sys
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .priority_model import (
     MODEL_PATH,
+    encode_feature_columns,
     encode_features,
     get_feature_importances,
     load_model,
-    predict,
 )
-from .scheduler import SLOT_MINUTES, schedule_day
+from .exact import EXACT_BUDGET_MS
+from .horizon import schedule_horizon
+from .plan_cache import PlanCache, plan_fingerprint
+from .local_search import LOCAL_SEARCH_BUDGET_MS, LOCAL_SEARCH_MAX_ITERATIONS
+from .scheduler import SLOT_MINUTES, _bias_from_feedback, schedule_day
+from .table_model import TABLE_MODEL_PATH, TablePriorityModel, load_table_model
 from .train_priority_model import train_and_save_model
 
 logger = logging.getLogger(__name__)
 
 TaskDict = Dict[str, Any]
 _PRIORITY_MODEL_CACHE = None
+_TABLE_MODEL_CACHE = None
+_PLAN_CACHE = PlanCache()
 
 
 def _get_package():
@@ -51,12 +60,6 @@ def encode_task_features(
     )
 
 
-def _hours_until_deadline(deadline: Optional[datetime], reference: datetime) -> float:
-    if not deadline:
-        return 0.0
-    return max(0.0, (deadline - reference).total_seconds() / 3600.0)
-
-
 def get_priority_model(force_reload: bool = False):
     global _PRIORITY_MODEL_CACHE
     if force_reload or _PRIORITY_MODEL_CACHE is None:
@@ -80,39 +83,128 @@ def get_priority_model(force_reload: bool = False):
     return _PRIORITY_MODEL_CACHE
 
 
+def get_table_priority_model(force_reload: bool = False):
+    """
+    The lookup-table model for the current artifact, loaded from
+    ``TABLE_MODEL_PATH`` or built from the tree model and saved there when
+    the file is missing or older than the artifact.
+    """
+    global _TABLE_MODEL_CACHE
+    if force_reload or _TABLE_MODEL_CACHE is None:
+        source = get_priority_model()
+        try:
+            if MODEL_PATH.exists() and TABLE_MODEL_PATH.stat().st_mtime < MODEL_PATH.stat().st_mtime:
+                raise FileNotFoundError(f"Table priority model at {TABLE_MODEL_PATH} is older than {MODEL_PATH}")
+            table_model = load_table_model(TABLE_MODEL_PATH)
+        except FileNotFoundError:
+            logger.info("Building the lookup-table priority model at %s.", TABLE_MODEL_PATH)
+            table_model = TablePriorityModel.from_model(source)
+            table_model.save(TABLE_MODEL_PATH)
+        logger.info(
+            "Table priority model error against the tree model: max %.3f, mean %.4f",
+            table_model.max_error,
+            table_model.mean_abs_error,
+        )
+        _TABLE_MODEL_CACHE = table_model
+    return _TABLE_MODEL_CACHE
+
+
+def _scoring_model(priority_model: str):
+    return get_table_priority_model() if priority_model == "table" else get_priority_model()
+
+
 def train_priority_model(path: Path | str = MODEL_PATH, force_retrain: bool = False):
+    global _TABLE_MODEL_CACHE
     artifact_path = Path(path)
     if force_retrain or not artifact_path.exists():
         train_and_save_model(path=artifact_path)
+        _TABLE_MODEL_CACHE = None
         return get_priority_model(force_reload=True)
     return get_priority_model()
 
 
-def predict_priority(
-    task: TaskDict,
+def predict_priorities(
+    tasks: Sequence[TaskDict],
     *,
     user_profile: str,
     plan_date: date,
     reference_start_hour: int = 8,
-) -> float:
+    model=None,
+) -> List[float]:
+    """
+    Model priority for each task, encoded into one feature matrix and scored
+    with a single ``predict`` call. Deadlines count from
+    ``reference_start_hour`` on ``plan_date``.
+    """
+    if not tasks:
+        return []
+    return predict_priority_columns(
+        duration_minutes=[int(task.get("duration_minutes", SLOT_MINUTES)) for task in tasks],
+        deadline=[task.get("deadline") for task in tasks],
+        importance=[task.get("importance", "medium") for task in tasks],
+        task_type=[task.get("task_type", "work") for task in tasks],
+        preferred_time=[task.get("preferred_time", "anytime") for task in tasks],
+        energy=[task.get("energy", "medium") for task in tasks],
+        user_profile=user_profile,
+        plan_date=plan_date,
+        reference_start_hour=reference_start_hour,
+        model=model,
+    ).tolist()
+
+
+def predict_priority_columns(
+    *,
+    duration_minutes: Sequence[int],
+    deadline: Sequence[Optional[datetime]],
+    importance: Sequence[str],
+    task_type: Sequence[str],
+    preferred_time: Sequence[str],
+    energy: Sequence[str],
+    user_profile: str,
+    plan_date: date,
+    reference_start_hour: int = 8,
+    model=None,
+) -> np.ndarray:
+    """
+    Columnar ``predict_priorities``: one sequence per task field, such as
+    the columns of a query result, and an array of priorities back. Missing
+    deadlines count as due now.
+    """
     plan_start = datetime.combine(plan_date, datetime.min.time()).replace(hour=reference_start_hour)
-    hours_until_deadline = _hours_until_deadline(task.get("deadline"), plan_start)
+    # timedelta arithmetic; converting to datetime64 first is several times slower
+    until_deadline = np.array([(due - plan_start).total_seconds() if due is not None else 0.0 for due in deadline])
     plan_day_of_week = plan_date.weekday()
-    features = encode_task_features(
+    features = encode_feature_columns(
         user_type=user_profile,
-        duration_minutes=int(task.get("duration_minutes", SLOT_MINUTES)),
-        hours_until_deadline=hours_until_deadline,
-        importance=task.get("importance", "medium"),
-        task_type=task.get("task_type", "work"),
-        preferred_time=task.get("preferred_time", "anytime"),
-        energy=task.get("energy", "medium"),
+        duration_minutes=duration_minutes,
+        hours_until_deadline=np.maximum(until_deadline / 3600.0, 0.0),
+        importance=importance,
+        task_type=task_type,
+        preferred_time=preferred_time,
+        energy=energy,
         plan_day_of_week=plan_day_of_week,
         is_weekend=1 if plan_day_of_week >= 5 else 0,
     )
-    pkg = _get_package()
-    model_provider = getattr(pkg, "get_priority_model", get_priority_model) if pkg else get_priority_model
-    model = model_provider()
-    return predict(features, model=model)
+    if model is None:
+        pkg = _get_package()
+        model_provider = getattr(pkg, "get_priority_model", get_priority_model) if pkg else get_priority_model
+        model = model_provider()
+    return np.asarray(model.predict(features), dtype=float)
+
+
+def predict_priority(
+    task: TaskDict,
+    *,
+    user_profile: str,
+    plan_date: date,
+    reference_start_hour: int = 8,
+) -> float:
+    return predict_priorities(
+        [task],
+        user_profile=user_profile,
+        plan_date=plan_date,
+        reference_start_hour=reference_start_hour,
+    )[0]
 
 
 def prioritize_tasks(
@@ -121,18 +213,21 @@ def prioritize_tasks(
     user_profile: str,
     plan_date: date,
 ) -> List[TaskDict]:
-    prioritized: List[TaskDict] = []
+    tasks = list(tasks)
     pkg = _get_package()
-    predict_fn = getattr(pkg, "predict_priority", predict_priority) if pkg else predict_priority
-    for task in tasks:
-        score = predict_fn(task, user_profile=user_profile, plan_date=plan_date)
-        annotated = dict(task)
-        annotated["priority"] = score
-        prioritized.append(annotated)
+    predict_fn = getattr(pkg, "predict_priorities", predict_priorities) if pkg else predict_priorities
+    scores = predict_fn(tasks, user_profile=user_profile, plan_date=plan_date)
+    prioritized = [{**task, "priority": score} for task, score in zip(tasks, scores)]
     prioritized.sort(key=lambda t: t.get("priority", 0.0), reverse=True)
     return prioritized
 
 
+def _stopped_by_clock(search_stats: Dict[str, Any]) -> bool:
+    # only plans that follow from the fingerprinted inputs alone may be cached
+    exact_report = search_stats.get("exact") or {}
+    return bool(search_stats.get("timed_out")) or exact_report.get("limit") == "time"
+
+
 def generate_schedule(
     tasks: Iterable[TaskDict],
     *,
@@ -142,10 +237,41 @@ def generate_schedule(
     start_hour: int = 8,
     end_hour: int = 22,
     occupied: Optional[Sequence[Tuple[datetime, datetime]]] = None,
+    slot_minutes: int = SLOT_MINUTES,
+    search_budget_ms: float = LOCAL_SEARCH_BUDGET_MS,
+    search_max_iterations: int = LOCAL_SEARCH_MAX_ITERATIONS,
+    exact: bool = False,
+    exact_budget_ms: float = EXACT_BUDGET_MS,
+    feedback_bias: Optional[Tuple[Dict[str, float], float]] = None,
+    priority_model: str = "tree",
 ) -> Tuple[List[Dict[str, Any]], List[TaskDict], Optional[float]]:
-    model = get_priority_model()
+    tasks = list(tasks)
+    model = _scoring_model(priority_model)
+    if feedback_bias is None:
+        feedback_bias = _bias_from_feedback(list(feedback) if feedback else None)
+    cache_key = plan_fingerprint(
+        kind="day",
+        tasks=tasks,
+        feedback_bias=feedback_bias,
+        model=model,
+        user_profile=user_profile,
+        plan_date=plan_date,
+        start_hour=start_hour,
+        end_hour=end_hour,
+        occupied=sorted(occupied or ()),
+        slot_minutes=slot_minutes,
+        search_budget_ms=search_budget_ms,
+        search_max_iterations=search_max_iterations,
+        exact=exact,
+        exact_budget_ms=exact_budget_ms,
+    )
+    cached = _PLAN_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    search_stats: Dict[str, Any] = {}
     scheduled, unscheduled, model_confidence = schedule_day(
-        tasks=list(tasks),
+        tasks=tasks,
         user_profile=user_profile,
         plan_date=plan_date,
         feedback=feedback,
@@ -153,8 +279,93 @@ def generate_schedule(
         end_hour=end_hour,
         occupied_intervals=occupied,
         model=model,
+        slot_minutes=slot_minutes,
+        search_budget_ms=search_budget_ms,
+        search_max_iterations=search_max_iterations,
+        exact=exact,
+        exact_budget_ms=exact_budget_ms,
+        feedback_bias=feedback_bias,
+        search_stats=search_stats,
+    )
+    feature_importances = get_feature_importances(model)
+    if feature_importances and model_confidence is None:
+        model_confidence = float(sum(feature_importances[:3]))
+    result = (scheduled, unscheduled, model_confidence)
+    if not _stopped_by_clock(search_stats):
+        _PLAN_CACHE.put(cache_key, result, size=len(tasks))
+    return result
+
+
+def generate_horizon_schedule(
+    tasks: Iterable[TaskDict],
+    *,
+    user_profile: str,
+    plan_dates: Sequence[date],
+    feedback: Optional[Sequence[Any]] = None,
+    start_hour: int = 8,
+    end_hour: int = 22,
+    occupied_by_day: Optional[Mapping[date, Sequence[Tuple[datetime, datetime]]]] = None,
+    existing_minutes_by_day: Optional[Mapping[date, float]] = None,
+    slot_minutes: int = SLOT_MINUTES,
+    search_budget_ms: float = LOCAL_SEARCH_BUDGET_MS,
+    search_max_iterations: int = LOCAL_SEARCH_MAX_ITERATIONS,
+    exact: bool = False,
+    exact_budget_ms: float = EXACT_BUDGET_MS,
+    feedback_bias: Optional[Tuple[Dict[str, float], float]] = None,
+    priority_model: str = "tree",
+) -> Tuple[Dict[date, List[Dict[str, Any]]], List[TaskDict], Optional[float]]:
+    tasks = list(tasks)
+    model = _scoring_model(priority_model)
+    if feedback_bias is None:
+        feedback_bias = _bias_from_feedback(list(feedback) if feedback else None)
+    cache_key = plan_fingerprint(
+        kind="horizon",
+        tasks=tasks,
+        feedback_bias=feedback_bias,
+        model=model,
+        user_profile=user_profile,
+        plan_dates=sorted(plan_dates),
+        start_hour=start_hour,
+        end_hour=end_hour,
+        occupied=sorted(
+            (plan_date.isoformat(), sorted(intervals)) for plan_date, intervals in (occupied_by_day or {}).items()
+        ),
+        existing_minutes=sorted(
+            (plan_date.isoformat(), minutes) for plan_date, minutes in (existing_minutes_by_day or {}).items()
+        ),
+        slot_minutes=slot_minutes,
+        search_budget_ms=search_budget_ms,
+        search_max_iterations=search_max_iterations,
+        exact=exact,
+        exact_budget_ms=exact_budget_ms,
+    )
+    cached = _PLAN_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    search_stats: Dict[str, Any] = {}
+    scheduled_by_day, unscheduled, model_confidence = schedule_horizon(
+        tasks=tasks,
+        user_profile=user_profile,
+        plan_dates=plan_dates,
+        feedback=feedback,
+        start_hour=start_hour,
+        end_hour=end_hour,
+        occupied_intervals_by_day=occupied_by_day,
+        existing_minutes_by_day=existing_minutes_by_day,
+        model=model,
+        slot_minutes=slot_minutes,
+        search_budget_ms=search_budget_ms,
+        search_max_iterations=search_max_iterations,
+        exact=exact,
+        exact_budget_ms=exact_budget_ms,
+        feedback_bias=feedback_bias,
+        search_stats=search_stats,
     )
     feature_importances = get_feature_importances(model)
     if feature_importances and model_confidence is None:
         model_confidence = float(sum(feature_importances[:3]))
-    return scheduled, unscheduled, model_confidence
+    result = (scheduled_by_day, unscheduled, model_confidence)
+    if not _stopped_by_clock(search_stats):
+        _PLAN_CACHE.put(cache_key, result, size=len(tasks))
+    return result
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Sequence, Tuple
+
+import joblib
+import numpy as np
+
+if __package__ is None:
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+    from backend.ml.priority_model import (
+        ENERGY_MAP,
+        FEATURE_ORDER,
+        IMPORTANCE_MAP,
+        MODEL_PATH,
+        PREF_TIME_MAP,
+        TASK_TYPE_MAP,
+        USER_TYPE_MAP,
+        get_feature_importances,
+        load_model,
+    )
+else:
+    from .priority_model import (
+        ENERGY_MAP,
+        FEATURE_ORDER,
+        IMPORTANCE_MAP,
+        MODEL_PATH,
+        PREF_TIME_MAP,
+        TASK_TYPE_MAP,
+        USER_TYPE_MAP,
+        get_feature_importances,
+        load_model,
+    )
+
+TABLE_MODEL_PATH = MODEL_PATH.with_name("priority_model.table.pkl")
+
+# hourly where deadline pressure changes fastest, coarser out to a 90-day horizon
+DEADLINE_KNOTS = (
+    tuple(range(0, 25))
+    + tuple(range(26, 73, 2))
+    + tuple(range(76, 121, 4))
+    + (144, 168, 240, 336, 720, 2160)
+)
+DURATION_KNOTS = (15, 30, 60, 90, 120, 150, 180, 240)
+
+# (column in FEATURE_ORDER, number of values) for the categorical axes
+_CATEGORICAL_AXES = (
+    (0, len(USER_TYPE_MAP)),
+    (3, len(IMPORTANCE_MAP)),
+    (4, len(TASK_TYPE_MAP)),
+    (5, len(PREF_TIME_MAP)),
+    (6, len(ENERGY_MAP)),
+    (7, 7),
+)
+_DURATION_COLUMN = 1
+_DEADLINE_COLUMN = 2
+_WEEKEND_COLUMN = 8
+_BUILD_CHUNK_ROWS = 65536
+# the source model's strongest deadline splits get a knot pair each
+SPLIT_KNOTS = 16
+_SPLIT_WIDTH_HOURS = 0.01
+
+
+def split_thresholds(model: Any, column: int) -> list[float]:
+    """
+    Split thresholds on ``column`` across a tree ensemble, strongest first
+    by total impurity decrease; empty for models without trees.
+    """
+    estimator = getattr(model, "estimator", model)
+    gains: dict[float, float] = {}
+    for tree_model in np.ravel(getattr(estimator, "estimators_", [])):
+        tree = getattr(tree_model, "tree_", None)
+        if tree is None:
+            continue
+        weight = tree.weighted_n_node_samples * tree.impurity
+        for node in np.flatnonzero(tree.feature == column):
+            gain = weight[node] - weight[tree.children_left[node]] - weight[tree.children_right[node]]
+            gains[float(tree.threshold[node])] = gains.get(float(tree.threshold[node]), 0.0) + gain
+    return sorted(gains, key=gains.get, reverse=True)
+
+
+def grid_knots(model: Any, split_knots: int = SPLIT_KNOTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Duration and deadline knots for ``model``: the defaults plus a knot on
+    each side of the model's splits, so a step between two knots is not
+    smeared across a whole bin. Duration splits fall between whole minutes
+    and all of them are used, which makes whole-minute durations exact;
+    only the ``split_knots`` strongest deadline splits are, each bracketed
+    by a 36-second bin.
+    """
+    duration_splits = [
+        threshold
+        for threshold in split_thresholds(model, _DURATION_COLUMN)
+        if DURATION_KNOTS[0] <= threshold < DURATION_KNOTS[-1]
+    ]
+    # between split pairs the model is flat, so the end knots are all that is left to add
+    durations = {DURATION_KNOTS[0], DURATION_KNOTS[-1]} if duration_splits else set(DURATION_KNOTS)
+    for threshold in duration_splits:
+        durations.update((np.floor(threshold), np.floor(threshold) + 1))
+    deadlines = set(DEADLINE_KNOTS)
+    for threshold in split_thresholds(model, _DEADLINE_COLUMN)[:split_knots]:
+        if DEADLINE_KNOTS[0] <= threshold < DEADLINE_KNOTS[-1]:
+            deadlines.update((threshold, threshold + _SPLIT_WIDTH_HOURS))
+    return np.array(sorted(durations)), np.array(sorted(deadlines))
+
+
+def _bracket(knots: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # lower knot index and interpolation weight, clamped to the axis ends
+    values = np.clip(values, knots[0], knots[-1])
+    lo = np.clip(np.searchsorted(knots, values, side="right") - 1, 0, len(knots) - 2)
+    return lo, (values - knots[lo]) / (knots[lo + 1] - knots[lo])
+
+
+class TablePriorityModel:
+    """
+    Priority model precomputed over the full categorical feature grid.
+
+    ``table`` holds the source model's prediction for every combination of
+    user type, importance, task type, preferred time, energy and weekday,
+    at each ``duration_knots`` x ``deadline_knots`` point. ``predict`` is a
+    constant-time lookup per row with bilinear interpolation between the
+    duration and deadline knots; values outside the knots are clamped to the
+    ends. ``is_weekend`` is taken from the weekday, as every encoder in this
+    package sets it.
+
+    ``max_error`` and ``mean_abs_error`` record how far the table strays
+    from the source model on a random sample, measured when it is built.
+    It exposes ``predict``, ``feature_importances_`` and ``n_features_in_``,
+    so it can replace a loaded model anywhere.
+    """
+
+    def __init__(
+        self,
+        table: np.ndarray,
+        duration_knots: Sequence[float] = DURATION_KNOTS,
+        deadline_knots: Sequence[float] = DEADLINE_KNOTS,
+        feature_importances: Optional[Sequence[float]] = None,
+    ):
+        self.duration_knots = np.asarray(duration_knots, dtype=float)
+        self.deadline_knots = np.asarray(deadline_knots, dtype=float)
+        self.sizes = np.array([size for _, size in _CATEGORICAL_AXES], dtype=np.intp)
+        expected = (*self.sizes, len(self.duration_knots), len(self.deadline_knots))
+        if table.shape != expected:
+            raise ValueError(f"Table shape {table.shape} does not match the feature grid {expected}")
+        self.table = np.ascontiguousarray(table, dtype=np.float32)
+        self.feature_importances_ = np.asarray(feature_importances if feature_importances is not None else [], dtype=float)
+        self.n_features_in_ = len(FEATURE_ORDER)
+        self.max_error: Optional[float] = None
+        self.mean_abs_error: Optional[float] = None
+        cell = len(self.duration_knots) * len(self.deadline_knots)
+        self._strides = np.array([int(np.prod(self.sizes[i + 1 :])) * cell for i in range(len(self.sizes))], dtype=np.intp)
+        self._columns = [column for column, _ in _CATEGORICAL_AXES]
+
+    @classmethod
+    def from_model(
+        cls,
+        model: Any,
+        duration_knots: Optional[Sequence[float]] = None,
+        deadline_knots: Optional[Sequence[float]] = None,
+        check_rows: int = 20000,
+        seed: int = 0,
+    ) -> "TablePriorityModel":
+        """
+        Evaluate ``model`` (anything with ``predict``) over the grid, then
+        measure the table's error against it on ``check_rows`` random rows.
+        Knots not given come from ``grid_knots``.
+        """
+        sizes = [size for _, size in _CATEGORICAL_AXES]
+        default_durations, default_deadlines = grid_knots(model)
+        durations = np.asarray(duration_knots if duration_knots is not None else default_durations, dtype=float)
+        deadlines = np.asarray(deadline_knots if deadline_knots is not None else default_deadlines, dtype=float)
+        cell = len(durations) * len(deadlines)
+        n_combos = int(np.prod(sizes))
+        cell_durations = np.repeat(durations, len(deadlines))
+        cell_deadlines = np.tile(deadlines, len(durations))
+
+        values = np.empty(n_combos * cell, dtype=np.float32)
+        combos_per_chunk = max(1, _BUILD_CHUNK_ROWS // cell)
+        for first in range(0, n_combos, combos_per_chunk):
+            combos = np.arange(first, min(n_combos, first + combos_per_chunk))
+            categorical = np.stack(np.unravel_index(combos, sizes), axis=1)
+            rows = np.empty((len(combos) * cell, len(FEATURE_ORDER)))
+            for axis, (column, _) in enumerate(_CATEGORICAL_AXES):
+                rows[:, column] = np.repeat(categorical[:, axis], cell)
+            rows[:, _DURATION_COLUMN] = np.tile(cell_durations, len(combos))
+            rows[:, _DEADLINE_COLUMN] = np.tile(cell_deadlines, len(combos))
+            rows[:, _WEEKEND_COLUMN] = rows[:, 7] >= 5
+            values[first * cell : first * cell + len(rows)] = model.predict(rows)
+
+        table_model = cls(
+            values.reshape(*sizes, len(durations), len(deadlines)),
+            durations,
+            deadlines,
+            feature_importances=get_feature_importances(model),
+        )
+        table_model.max_error, table_model.mean_abs_error = table_model.error_against(model, check_rows, seed)
+        return table_model
+
+    def error_against(self, model: Any, rows: int = 20000, seed: int = 0) -> Tuple[float, float]:
+        """
+        Max and mean absolute difference from ``model`` on random rows, most
+        of them due within a week where the deadline splits are.
+        """
+        rng = np.random.default_rng(seed)
+        X = np.empty((rows, len(FEATURE_ORDER)))
+        for column, size in _CATEGORICAL_AXES:
+            X[:, column] = rng.integers(0, size, rows)
+        X[:, _DURATION_COLUMN] = rng.integers(int(self.duration_knots[0]), int(self.duration_knots[-1]) + 1, rows)
+        near = rng.random(rows) < 0.8
+        X[:, _DEADLINE_COLUMN] = np.where(
+            near,
+            rng.uniform(self.deadline_knots[0], min(168.0, self.deadline_knots[-1]), rows),
+            rng.uniform(self.deadline_knots[0], self.deadline_knots[-1], rows),
+        )
+        X[:, _WEEKEND_COLUMN] = X[:, 7] >= 5
+        source = np.concatenate([np.asarray(model.predict(chunk), dtype=float) for chunk in np.array_split(X, max(1, rows // _BUILD_CHUNK_ROWS))])
+        errors = np.abs(self.predict(X) - source)
+        return float(errors.max()), float(errors.mean())
+
+    def predict(self, X: Any) -> np.ndarray:
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected a 2D array with {self.n_features_in_} features, got shape {X.shape}")
+        categorical = np.clip(np.rint(X[:, self._columns]).astype(np.intp), 0, self.sizes - 1)
+        duration_lo, duration_w = _bracket(self.duration_knots, X[:, _DURATION_COLUMN])
+        deadline_lo, deadline_w = _bracket(self.deadline_knots, X[:, _DEADLINE_COLUMN])
+        n_deadlines = len(self.deadline_knots)
+        corner = categorical @ self._strides + duration_lo * n_deadlines + deadline_lo
+        flat = self.table.reshape(-1)
+        shorter = (1.0 - deadline_w) * flat[corner] + deadline_w * flat[corner + 1]
+        longer = (1.0 - deadline_w) * flat[corner + n_deadlines] + deadline_w * flat[corner + n_deadlines + 1]
+        return (1.0 - duration_w) * shorter + duration_w * longer
+
+    def save(self, path: str | Path = TABLE_MODEL_PATH) -> Path:
+        """
+        Write to a temporary file beside ``path`` and rename it into place,
+        so a process loading the table never reads a partial file.
+        """
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f"{output_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                joblib.dump(self, tmp_file)
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return output_path
+
+
+def load_table_model(path: str | Path = TABLE_MODEL_PATH) -> TablePriorityModel:
+    model_path = Path(path)
+    if not model_path.exists():
+        raise FileNotFoundError(f"Table priority model not found at {model_path}")
+    return joblib.load(model_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the lookup-table priority model from a trained artifact.")
+    parser.add_argument("--source", type=Path, default=MODEL_PATH, help="Trained model artifact to tabulate.")
+    parser.add_argument("--output", type=Path, default=TABLE_MODEL_PATH, help="Where to write the table model.")
+    args = parser.parse_args()
+
+    # pickle the class under its package path, not __main__
+    from backend.ml.table_model import TablePriorityModel
+
+    table_model = TablePriorityModel.from_model(load_model(args.source))
+    output_path = table_model.save(args.output)
+    print(f"Table model max error {table_model.max_error:.4f}, mean {table_model.mean_abs_error:.4f} against the source model")
+    print(f"Table model ({table_model.table.nbytes / 2**20:.1f} MiB) saved to {output_path}")
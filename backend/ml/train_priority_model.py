@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Mapping, Optional, Tuple
 
 import joblib
 import numpy as np
@@ -12,35 +12,27 @@ from sklearn.model_selection import train_test_split
 
 if __package__ is None:
     sys.path.append(str(Path(__file__).resolve().parents[2]))
-    from backend.ml.data_gen import generate_synthetic_dataset
-    from backend.ml.priority_model import MODEL_PATH, encode_features
+    from backend.ml.data_gen import generate_synthetic_columns_parallel
+    from backend.ml.priority_model import FEATURE_ORDER, MODEL_PATH, encode_feature_columns
 else:
-    from .data_gen import generate_synthetic_dataset
-    from .priority_model import MODEL_PATH, encode_features
+    from .data_gen import generate_synthetic_columns_parallel
+    from .priority_model import FEATURE_ORDER, MODEL_PATH, encode_feature_columns
 
 
-def _build_training_matrix(samples: Iterable[dict]) -> Tuple[np.ndarray, np.ndarray]:
-    X: List[List[float]] = []
-    y: List[float] = []
-    for row in samples:
-        features = encode_features(
-            user_type=row["user_type"],
-            duration_minutes=row["duration_minutes"],
-            hours_until_deadline=row["hours_until_deadline"],
-            importance=row["importance"],
-            task_type=row["task_type"],
-            preferred_time=row["preferred_time"],
-            energy=row["energy"],
-            plan_day_of_week=row["plan_day_of_week"],
-            is_weekend=row["is_weekend"],
-        )
-        X.append(features)
-        y.append(row["priority"])
-    return np.array(X, dtype=float), np.array(y, dtype=float)
+def _build_training_matrix(columns: Mapping[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    X = encode_feature_columns(**{field: columns[field] for field in FEATURE_ORDER})
+    y = np.asarray(columns["priority"], dtype=float)
+    return X, y
 
 
-def train_and_save_model(path: Path | str = MODEL_PATH, samples: int = 8000) -> Path:
-    dataset = generate_synthetic_dataset(samples)
+def train_and_save_model(
+    path: Path | str = MODEL_PATH,
+    samples: int = 8000,
+    *,
+    seed: Optional[int] = None,
+    workers: Optional[int] = 1,
+) -> Path:
+    dataset = generate_synthetic_columns_parallel(samples, seed=seed, workers=workers)
     X, y = _build_training_matrix(dataset)
 
     X_train, X_test, y_train, y_test = train_test_split(
@@ -74,6 +66,18 @@ if __name__ == "__main__":
         default=8000,
         help="How many synthetic samples to generate for training.",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for reproducible synthetic data.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes generating synthetic data for multi-million-row runs (0 for one per CPU).",
+    )
     args = parser.parse_args()
 
-    train_and_save_model(path=args.output, samples=args.samples)
+    train_and_save_model(path=args.output, samples=args.samples, seed=args.seed, workers=args.workers or None)
@@ -11,6 +11,7 @@ from sqlalchemy import (
     Text,
     Float,
     Boolean,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
@@ -61,6 +62,7 @@ class User(Base):
     feedback = relationship("FeedbackLog", back_populates="user", cascade="all, delete-orphan")
     settings = relationship("UserSettings", back_populates="user", uselist=False, cascade="all, delete-orphan")
     plans = relationship("Plan", back_populates="user", cascade="all, delete-orphan")
+    feedback_bias = relationship("FeedbackBias", back_populates="user", cascade="all, delete-orphan")
 
 
 class UserSettings(Base):
@@ -71,7 +73,8 @@ class UserSettings(Base):
     working_hours_start = Column(String, default="08:00", nullable=False)
     working_hours_end = Column(String, default="18:00", nullable=False)
     work_days_mask = Column(String, default="1111111", nullable=False)  # Mon-Sun
-    default_planning_horizon_hours = Column(Integer, default=72, nullable=False)
+    default_planning_horizon_hours = Column(Integer, default=168, nullable=False)
+    slot_minutes = Column(Integer, default=30, nullable=False)
     notifications_enabled = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -81,6 +84,7 @@ class UserSettings(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_user_status_deadline", "user_id", "status", "deadline"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -115,13 +119,18 @@ class Plan(Base):
     model_version = Column(String, default="priority_model_v1")
     status = Column(Enum(PlanStatus), default=PlanStatus.generated, nullable=False)
     summary = Column(String, nullable=True)
+    # bumped on every write; an UPDATE from a stale read matches no row
+    version = Column(Integer, nullable=False, default=1)
 
     user = relationship("User", back_populates="plans")
     items = relationship("PlanItem", back_populates="plan", cascade="all, delete-orphan")
 
+    __mapper_args__ = {"version_id_col": version}
+
 
 class PlanItem(Base):
     __tablename__ = "plan_items"
+    __table_args__ = (Index("ix_plan_items_plan_start", "plan_id", "start_datetime"),)
 
     id = Column(Integer, primary_key=True)
     plan_id = Column(Integer, ForeignKey("plans.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -138,6 +147,7 @@ class PlanItem(Base):
 
 class FeedbackLog(Base):
     __tablename__ = "feedback_logs"
+    __table_args__ = (Index("ix_feedback_logs_user_created", "user_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -153,6 +163,28 @@ class FeedbackLog(Base):
     task = relationship("Task", back_populates="feedback")
 
 
+class FeedbackBias(Base):
+    """
+    Decayed feedback totals per bias key, as of ``updated_at``.
+
+    ``weighted_sum`` and ``weight`` decay together, so they are only brought
+    forward to the current time when a row is read or written. The ``total``
+    key carries the overall feedback weight behind the bias strength.
+    """
+
+    __tablename__ = "feedback_bias"
+    __table_args__ = (UniqueConstraint("user_id", "key", name="uq_feedback_bias_user_key"),)
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    key = Column(String, nullable=False)
+    weighted_sum = Column(Float, default=0.0, nullable=False)
+    weight = Column(Float, default=0.0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    user = relationship("User", back_populates="feedback_bias")
+
+
 class Note(Base):
     __tablename__ = "notes"
 
@@ -1,21 +1,34 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..dependencies import get_current_user, get_db
+from ..feedback_bias import accumulate_feedback
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
 
 
 @router.post("/", response_model=schemas.FeedbackOut)
 def create_feedback(fb_in: schemas.FeedbackCreate, db: Session = Depends(get_db), user=Depends(get_current_user)):
+    now = datetime.utcnow()
     fb = models.FeedbackLog(
         user_id=user.id,
         task_id=fb_in.task_id,
         outcome=fb_in.outcome,
         note=fb_in.note,
+        created_at=now,
     )
     db.add(fb)
+    if fb_in.task_id is not None:
+        task = (
+            db.query(models.Task)
+            .filter(models.Task.id == fb_in.task_id, models.Task.user_id == user.id)
+            .first()
+        )
+        if task:
+            accumulate_feedback(db, user.id, task, fb_in.outcome, now)
     db.commit()
     db.refresh(fb)
     return fb
@@ -1,16 +1,32 @@
 import logging
+from contextlib import contextmanager
 from datetime import datetime, date, timezone, timedelta, time
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager, joinedload
+from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.exc import StaleDataError
 
 from .. import models, schemas
-from ..dependencies import get_current_user, get_db
-from ..ml import generate_schedule
+from ..config import settings as app_settings
+from ..dependencies import get_current_user, get_db, get_job_queue, get_plan_flight, get_scheduler_pool
+from ..feedback_bias import accumulate_feedback_many, load_feedback_bias
+from ..jobs import Job, JobQueue, JobQueueFull
+from ..ml import SLOT_MINUTES, generate_horizon_schedule
+from ..scheduler_pool import SchedulerBusy, SchedulerPool
+from ..single_flight import SingleFlight
 
 router = APIRouter(prefix="/planning", tags=["planning"])
 logger = logging.getLogger(__name__)
 
+MIN_SLOT_MINUTES = 5
+MAX_HORIZON_DAYS = 90
+PLAN_WINDOW_DAYS = 7
+# tasks due this many days out are planned even when the horizon is shorter
+LOOKAHEAD_DAYS = 14
+
 
 def _parse_hour_str(val: str, fallback: int) -> int:
     try:
@@ -22,6 +38,12 @@ def _parse_hour_str(val: str, fallback: int) -> int:
     return fallback
 
 
+def _slot_minutes(settings: models.UserSettings) -> int:
+    value = getattr(settings, "slot_minutes", None) or SLOT_MINUTES
+    # slots must tile an hour; anything else stored by hand falls back to the default
+    return value if MIN_SLOT_MINUTES <= value <= 60 and 60 % value == 0 else SLOT_MINUTES
+
+
 def _is_workday(plan_date, mask: str | None) -> bool:
     if not mask or len(mask) < 7:
         return True
@@ -49,84 +71,37 @@ def _get_or_create_settings(db: Session, user_id: int) -> models.UserSettings:
     return settings
 
 
-def _importance_rank(importance: str) -> int:
-    return {"high": 0, "medium": 1, "low": 2}.get(importance, 1)
+@router.get("/settings", response_model=schemas.UserSettingsOut)
+def get_planning_settings(db: Session = Depends(get_db), user=Depends(get_current_user)):
+    return _get_or_create_settings(db, user.id)
 
 
-def _allocate_tasks_to_days(
-    tasks,
-    horizon_dates: list[date],
-    plan_start_date: date,
-    existing_minutes_by_day: dict[date, int],
-    start_hour: int,
-    end_hour: int,
+@router.patch("/settings", response_model=schemas.UserSettingsOut)
+def update_planning_settings(
+    settings_in: schemas.UserSettingsUpdate, db: Session = Depends(get_db), user=Depends(get_current_user)
 ):
-    assigned_tasks_by_day = {day: [] for day in horizon_dates}
-    assigned_minutes_by_day = {day: 0 for day in horizon_dates}
-    unscheduled_reasons: dict[int, str] = {}
-
-    if not horizon_dates:
-        for task in tasks:
-            unscheduled_reasons[task.id] = "Deadline outside horizon"
-        return assigned_tasks_by_day, assigned_minutes_by_day, unscheduled_reasons
-
-    day_capacity_minutes = max(1, (end_hour - start_hour) * 60)
-    tasks_sorted = sorted(
-        tasks,
-        key=lambda t: (t.deadline, _importance_rank(getattr(t, "importance", "medium"))),
-    )
-
-    for task in tasks_sorted:
-        deadline_date = task.deadline.date()
-        candidates = [day for day in horizon_dates if day <= deadline_date]
-        if not candidates:
-            unscheduled_reasons[task.id] = "Deadline outside horizon"
-            continue
-
-        far_deadline = (deadline_date - plan_start_date).days >= 4
-        best_day = None
-        best_score = None
-
-        for day in candidates:
-            day_load_minutes = existing_minutes_by_day.get(day, 0) + assigned_minutes_by_day.get(day, 0)
-            load_penalty = (day_load_minutes / day_capacity_minutes) ** 2 * 8.0
-
-            days_until_deadline = max(0, (deadline_date - day).days)
-            if days_until_deadline <= 1:
-                deadline_penalty = 0.0
-            else:
-                deadline_penalty = min(6.0, days_until_deadline * 0.6)
-
-            horizon_offset = (day - plan_start_date).days
-            early_if_far_penalty = 2.5 if far_deadline and horizon_offset <= 1 else 0.0
-
-            score = load_penalty + deadline_penalty + early_if_far_penalty
-
-            if best_score is None or score < best_score:
-                best_score = score
-                best_day = day
-            elif score == best_score and best_day is not None:
-                if far_deadline:
-                    if day > best_day:
-                        best_day = day
-                else:
-                    if day < best_day:
-                        best_day = day
-
-        if best_day is None:
-            unscheduled_reasons[task.id] = "Deadline outside horizon"
-            continue
-
-        assigned_tasks_by_day[best_day].append(task)
-        assigned_minutes_by_day[best_day] += task.duration_minutes
-
-    return assigned_tasks_by_day, assigned_minutes_by_day, unscheduled_reasons
+    settings = _get_or_create_settings(db, user.id)
+    for field, value in settings_in.model_dump(exclude_unset=True, exclude_none=True).items():
+        setattr(settings, field, value)
+    db.commit()
+    db.refresh(settings)
+    return settings
 
 
 @router.post("/plan", response_model=schemas.PlanOut)
-def generate_plan(plan_req: schemas.PlanRequest, db: Session = Depends(get_db), user=Depends(get_current_user)):
+def generate_plan(
+    plan_req: schemas.PlanRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    flight: SingleFlight = Depends(get_plan_flight),
+    scheduler: SchedulerPool = Depends(get_scheduler_pool),
+):
+    key = _plan_key(user.id, plan_req)
+    # end the auth read so a request waiting on another's plan does not pin a pooled connection
+    db.rollback()
     try:
-        return _generate_plan_impl(plan_req=plan_req, db=db, user=user)
+        # a double submit waits for the running plan instead of computing and writing it again
+        return flight.do(key, lambda: _admitted_plan(plan_req, db, user, scheduler))
     except HTTPException:
         raise
     except Exception as exc:
@@ -134,249 +109,773 @@ def generate_plan(plan_req: schemas.PlanRequest, db: Session = Depends(get_db),
         raise HTTPException(status_code=500, detail=f"Failed to generate plan: {exc}") from exc
 
 
-def _generate_plan_impl(plan_req: schemas.PlanRequest, db: Session, user):
-    LOOKAHEAD_DAYS = 14
-    start_of_day = datetime.combine(plan_req.date, time.min)
-    lookahead_end = start_of_day + timedelta(days=LOOKAHEAD_DAYS)
+@router.post("/jobs", response_model=schemas.PlanJobOut, status_code=202)
+def submit_plan_job(
+    plan_req: schemas.PlanRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    queue: JobQueue = Depends(get_job_queue),
+    flight: SingleFlight = Depends(get_plan_flight),
+    scheduler: SchedulerPool = Depends(get_scheduler_pool),
+):
+    """
+    Queue plan generation and return the job at once; poll ``GET /jobs/{id}`` for the plan.
+    """
+    bind = db.get_bind()
+    user_id = user.id
+
+    def run() -> dict:
+        # the request session is closed by the time a worker runs this
+        with Session(bind=bind, autoflush=False) as job_db:
+            try:
+                plan = flight.do(
+                    _plan_key(user_id, plan_req),
+                    lambda: _admitted_plan(plan_req, job_db, job_db.get(models.User, user_id), scheduler),
+                )
+                return plan.model_dump(mode="json")
+            except HTTPException:
+                raise
+            except Exception:
+                logger.exception("Failed to generate plan in background job")
+                raise
 
-    settings = _get_or_create_settings(db, user.id)
+    try:
+        job = queue.submit(user_id, run)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=503, detail="Plan queue is full, try again shortly") from exc
+    return _job_out(job)
+
+
+@router.get("/jobs/metrics")
+def plan_job_metrics(
+    user=Depends(get_current_user),
+    queue: JobQueue = Depends(get_job_queue),
+    scheduler: SchedulerPool = Depends(get_scheduler_pool),
+):
+    return {**queue.metrics(), "scheduler": scheduler.metrics()}
+
+
+@router.get("/jobs/{job_id}", response_model=schemas.PlanJobOut)
+def get_plan_job(
+    job_id: str,
+    wait: float = Query(0.0, ge=0.0, le=30.0, description="Seconds to wait for completion before answering."),
+    user=Depends(get_current_user),
+    queue: JobQueue = Depends(get_job_queue),
+):
+    job = queue.wait(job_id, wait) if wait > 0 else queue.get(job_id)
+    if job is None or job.owner_id != user.id:
+        raise HTTPException(status_code=404, detail="Plan job not found")
+    return _job_out(job)
+
+
+def _job_out(job: Job) -> schemas.PlanJobOut:
+    return schemas.PlanJobOut.model_validate(job)
+
+
+def _plan_key(user_id: int, plan_req: schemas.PlanRequest) -> tuple:
+    return user_id, plan_req.date, plan_req.quality
+
+
+@contextmanager
+def _write_conflicts_as_409(db: Session):
+    """
+    Turn a lost race on plan rows into a 409: a stale ``Plan.version`` on
+    UPDATE or a duplicate ``(user_id, plan_date)`` on INSERT.
+    """
+    try:
+        yield
+    except (StaleDataError, IntegrityError) as exc:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Plan was changed by another request, try again") from exc
+
+
+@contextmanager
+def _admitted(scheduler: SchedulerPool):
+    """
+    Hold one of the scheduler's admission slots, or answer 503 with
+    Retry-After so a burst of plan requests is turned away early.
+    """
+    try:
+        scheduler.acquire()
+    except SchedulerBusy as exc:
+        raise HTTPException(
+            status_code=503,
+            detail="Planner is busy, try again shortly",
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+    try:
+        yield
+    finally:
+        scheduler.release()
+
+
+def _admitted_plan(plan_req: schemas.PlanRequest, db: Session, user, scheduler: SchedulerPool) -> schemas.PlanOut:
+    with _admitted(scheduler):
+        return _generate_plan_impl(plan_req=plan_req, db=db, user=user, scheduler=scheduler)
+
+
+def _touch_plan(plan: models.Plan) -> None:
+    # force the versioned UPDATE even when no column changes
+    flag_modified(plan, "summary")
+
+
+def _working_hours(settings: models.UserSettings) -> tuple[int, int, int]:
     start_hour = _parse_hour_str(settings.working_hours_start, 8)
     end_hour = _parse_hour_str(settings.working_hours_end, 22)
     if end_hour <= start_hour:
         end_hour = min(start_hour + 12, 23)
+    return start_hour, end_hour, _slot_minutes(settings)
 
-    horizon_dates = [plan_req.date]
-    for offset in range(1, 7):
-        plan_date = plan_req.date + timedelta(days=offset)
-        if _is_workday(plan_date, settings.work_days_mask):
-            horizon_dates.append(plan_date)
-
-    plans_by_date: dict[date, models.Plan] = {}
-    for plan_date in horizon_dates:
-        plan_datetime = datetime.combine(plan_date, datetime.min.time())
-        plan = (
-            db.query(models.Plan)
-            .filter(models.Plan.user_id == user.id, models.Plan.plan_date == plan_datetime)
-            .first()
-        )
-        if not plan:
-            plan = models.Plan(
-                user_id=user.id,
-                plan_date=plan_datetime,
-                model_version="priority_model_v1",
-                status=models.PlanStatus.generated,
-                summary=None,
-            )
-            db.add(plan)
-            db.flush()
-        plans_by_date[plan_date] = plan
 
-    existing_items_by_day: dict[date, list[models.PlanItem]] = {}
-    occupied_intervals_by_day: dict[date, list[tuple[datetime, datetime]]] = {}
-    existing_minutes_by_day: dict[date, int] = {day: 0 for day in horizon_dates}
-    existing_task_ids_any_day: set[int] = set()
+def _horizon_days(settings: models.UserSettings) -> int:
+    hours = settings.default_planning_horizon_hours or 0
+    return min(MAX_HORIZON_DAYS, max(1, -(-hours // 24)))
 
-    for plan_date, plan in plans_by_date.items():
-        items = (
-            db.query(models.PlanItem)
-            .filter(models.PlanItem.plan_id == plan.id)
-            .order_by(models.PlanItem.position.asc())
-            .all()
+
+def _horizon_dates(plan_date: date, settings: models.UserSettings) -> list[date]:
+    horizon_dates = [plan_date]
+    for offset in range(1, _horizon_days(settings)):
+        day = plan_date + timedelta(days=offset)
+        if _is_workday(day, settings.work_days_mask):
+            horizon_dates.append(day)
+    return horizon_dates
+
+
+def _task_dict(t: models.Task) -> dict:
+    return dict(
+        id=t.id,
+        title=t.title,
+        duration_minutes=t.duration_minutes,
+        deadline=t.deadline,
+        task_type=t.task_type,
+        importance=t.importance,
+        preferred_time=t.preferred_time,
+        energy=t.energy,
+    )
+
+
+def _load_days(db: Session, user_id: int, days: list[date], intervals_only: bool = False):
+    """
+    Plans and items (tasks joined in) of exactly ``days``, in two statements.
+
+    With ``intervals_only`` the items are plain rows carrying just the
+    plan id, times and position, for callers that only schedule around them.
+    """
+    plans_by_date: dict[date, models.Plan] = {
+        plan.plan_date.date(): plan
+        for plan in db.query(models.Plan).filter(
+            models.Plan.user_id == user_id,
+            models.Plan.plan_date.in_([datetime.combine(day, time.min) for day in days]),
         )
-        existing_items_by_day[plan_date] = items
-        existing_task_ids_any_day.update(item.task_id for item in items)
-        occupied_intervals_by_day[plan_date] = [(item.start_datetime, item.end_datetime) for item in items]
-        existing_minutes_by_day[plan_date] = int(
-            sum((item.end_datetime - item.start_datetime).total_seconds() / 60.0 for item in items)
+    }
+    existing_items_by_day: dict[date, list[models.PlanItem]] = {day: [] for day in days}
+    if plans_by_date:
+        plan_dates_by_id = {plan.id: plan_date for plan_date, plan in plans_by_date.items()}
+        if intervals_only:
+            item_query = db.query(
+                models.PlanItem.plan_id,
+                models.PlanItem.start_datetime,
+                models.PlanItem.end_datetime,
+                models.PlanItem.position,
+            )
+        else:
+            item_query = db.query(models.PlanItem).options(joinedload(models.PlanItem.task))
+        existing_items = (
+            item_query.filter(models.PlanItem.plan_id.in_(plan_dates_by_id))
+            .order_by(models.PlanItem.position.asc(), models.PlanItem.id.asc())
+            .all()
         )
+        for item in existing_items:
+            existing_items_by_day[plan_dates_by_id[item.plan_id]].append(item)
+    return plans_by_date, existing_items_by_day
 
-    task_query = db.query(models.Task).filter(
-        models.Task.user_id == user.id,
-        models.Task.deadline >= start_of_day,
-        models.Task.deadline <= lookahead_end,
-        models.Task.status.in_([models.TaskStatus.pending, models.TaskStatus.unscheduled]),
-    )
-    if existing_task_ids_any_day:
-        task_query = task_query.filter(~models.Task.id.in_(existing_task_ids_any_day))
-    tasks_to_assign = task_query.all()
-
-    if not tasks_to_assign and not any(existing_items_by_day.values()):
-        raise HTTPException(status_code=400, detail="No pending tasks to plan for this date")
-
-    feedback = (
-        db.query(models.FeedbackLog)
-        .options(selectinload(models.FeedbackLog.task))
-        .filter(models.FeedbackLog.user_id == user.id)
-        .order_by(models.FeedbackLog.created_at.desc())
-        .limit(500)
-        .all()
+
+def _planned_in_horizon(user_id: int, horizon_dates: list[date]):
+    # anti-join against the horizon's plan items instead of a growing NOT IN list
+    return (
+        select(models.PlanItem.id)
+        .join(models.Plan, models.PlanItem.plan_id == models.Plan.id)
+        .where(
+            models.PlanItem.task_id == models.Task.id,
+            models.Plan.user_id == user_id,
+            models.Plan.plan_date.in_([datetime.combine(day, time.min) for day in horizon_dates]),
+        )
+        .exists()
     )
 
-    assigned_tasks_by_day, _, allocator_unscheduled = _allocate_tasks_to_days(
-        tasks=tasks_to_assign,
-        horizon_dates=horizon_dates,
-        plan_start_date=plan_req.date,
-        existing_minutes_by_day=existing_minutes_by_day,
+
+def _schedule_days(
+    db: Session,
+    user,
+    settings: models.UserSettings,
+    days: list[date],
+    existing_items_by_day: dict[date, list[models.PlanItem]],
+    tasks: list[models.Task],
+    quality: str,
+    scheduler: SchedulerPool | None = None,
+):
+    """
+    Run the horizon scheduler over ``days`` on plain task dicts and intervals,
+    in ``scheduler``'s worker processes when given.
+    """
+    start_hour, end_hour, slot_minutes = _working_hours(settings)
+    if not tasks:
+        return {}, [], None
+    run = scheduler.run if scheduler is not None else _run_inline
+    return run(
+        generate_horizon_schedule,
+        tasks=[_task_dict(t) for t in tasks],
+        user_profile=user.profile.value,
+        plan_dates=days,
+        feedback_bias=load_feedback_bias(db, user.id),
         start_hour=start_hour,
         end_hour=end_hour,
+        occupied_by_day={
+            day: [(item.start_datetime, item.end_datetime) for item in items]
+            for day, items in existing_items_by_day.items()
+        },
+        existing_minutes_by_day={
+            day: int(sum((item.end_datetime - item.start_datetime).total_seconds() / 60.0 for item in items))
+            for day, items in existing_items_by_day.items()
+        },
+        slot_minutes=slot_minutes,
+        search_budget_ms=app_settings.local_search_budget_ms,
+        search_max_iterations=app_settings.local_search_max_iterations,
+        exact=quality == "best",
+        exact_budget_ms=app_settings.exact_budget_ms,
+        priority_model=app_settings.priority_model,
     )
 
-    scheduled_ids: set[int] = set()
-    unscheduled_reasons: dict[int, str] = dict(allocator_unscheduled)
-    scheduled_map_by_day: dict[date, list[tuple[dict, int]]] = {}
-    model_confidence_by_day: dict[date, float | None] = {}
 
-    for plan_date in horizon_dates:
-        day_tasks = assigned_tasks_by_day.get(plan_date, [])
-        task_dicts = [
-            dict(
-                id=t.id,
-                title=t.title,
-                duration_minutes=t.duration_minutes,
-                deadline=t.deadline,
-                task_type=t.task_type,
-                importance=t.importance,
-                preferred_time=t.preferred_time,
-                energy=t.energy,
-            )
-            for t in day_tasks
-        ]
+def _run_inline(fn, **kwargs):
+    return fn(**kwargs)
 
-        scheduled = []
-        unscheduled = []
-        model_confidence = None
-        if task_dicts:
-            scheduled, unscheduled, model_confidence = generate_schedule(
-                tasks=task_dicts,
-                user_profile=user.profile.value,
-                plan_date=plan_date,
-                feedback=feedback,
-                start_hour=start_hour,
-                end_hour=end_hour,
-                occupied=occupied_intervals_by_day.get(plan_date),
+
+def _persist_schedule(
+    db: Session,
+    user_id: int,
+    days: list[date],
+    plans_by_date: dict[date, models.Plan],
+    existing_items_by_day: dict[date, list[models.PlanItem]],
+    scheduled_by_day: dict[date, list[dict]],
+    unscheduled: list[dict],
+    placed_task_ids: set[int],
+    kept_task_ids: set[int],
+):
+    """
+    Write a schedule for ``days`` with a fixed number of statements.
+
+    One INSERT for the missing plans and one for all new items; ids come back
+    via RETURNING keyed by plan date / task id, so row order does not matter.
+    Tasks in ``placed_task_ids`` become scheduled or unscheduled depending on
+    the outcome, tasks in ``kept_task_ids`` stay scheduled.
+    """
+    plan_ids_by_date = {plan_date: plan.id for plan_date, plan in plans_by_date.items()}
+    summaries = {
+        plan_date: (
+            f"{len(existing_items_by_day[plan_date]) + len(scheduled_by_day.get(plan_date, []))} scheduled, "
+            f"{len(unscheduled)} unscheduled"
+        )
+        for plan_date in days
+    }
+    for plan_date, plan in plans_by_date.items():
+        plan.summary = summaries[plan_date]
+        _touch_plan(plan)
+    # claim the existing plans before adding items; a concurrent writer makes this raise StaleDataError
+    db.flush()
+    new_plan_rows = [
+        dict(
+            user_id=user_id,
+            plan_date=datetime.combine(plan_date, time.min),
+            model_version="priority_model_v1",
+            status=models.PlanStatus.generated,
+            summary=summaries[plan_date],
+        )
+        for plan_date in days
+        if plan_date not in plans_by_date
+    ]
+    if new_plan_rows:
+        inserted = db.execute(
+            insert(models.Plan).returning(models.Plan.id, models.Plan.plan_date),
+            new_plan_rows,
+        )
+        plan_ids_by_date.update((plan_datetime.date(), plan_id) for plan_id, plan_datetime in inserted)
+
+    new_item_rows = []
+    for plan_date in days:
+        next_position = max((item.position for item in existing_items_by_day[plan_date]), default=-1) + 1
+        for offset, s in enumerate(scheduled_by_day.get(plan_date, [])):
+            new_item_rows.append(
+                dict(
+                    plan_id=plan_ids_by_date[plan_date],
+                    task_id=s["task_id"],
+                    start_datetime=_normalize_dt(datetime.fromisoformat(s["start"])),
+                    end_datetime=_normalize_dt(datetime.fromisoformat(s["end"])),
+                    explanation=s.get("explanation"),
+                    position=next_position + offset,
+                    source="ai",
+                )
             )
-        model_confidence_by_day[plan_date] = model_confidence
-
-        for u in unscheduled:
-            unscheduled_reasons[u["id"]] = u.get("reason")
-
-        for s in scheduled:
-            scheduled_ids.add(s["task_id"])
-
-        existing_items = existing_items_by_day.get(plan_date, [])
-        next_position = max((item.position for item in existing_items), default=-1) + 1
-        plan_items_map = []
-        for s in scheduled:
-            item = models.PlanItem(
-                plan_id=plans_by_date[plan_date].id,
-                task_id=s["task_id"],
-                start_datetime=_normalize_dt(datetime.fromisoformat(s["start"])),
-                end_datetime=_normalize_dt(datetime.fromisoformat(s["end"])),
-                explanation=s.get("explanation"),
-                position=next_position,
-                source="ai",
+    new_item_ids: dict[int, int] = {}
+    if new_item_rows:
+        inserted = db.execute(
+            insert(models.PlanItem).returning(models.PlanItem.id, models.PlanItem.task_id),
+            new_item_rows,
+        )
+        new_item_ids = {task_id: item_id for item_id, task_id in inserted}
+
+    scheduled_ids = {s["task_id"] for scheduled in scheduled_by_day.values() for s in scheduled}
+    status_ids = kept_task_ids | placed_task_ids
+    if status_ids:
+        db.execute(
+            update(models.Task)
+            .where(models.Task.id.in_(status_ids))
+            .values(
+                status=case(
+                    (
+                        models.Task.id.in_(kept_task_ids | scheduled_ids),
+                        models.TaskStatus.scheduled.name,
+                    ),
+                    else_=models.TaskStatus.unscheduled.name,
+                )
             )
-            db.add(item)
-            db.flush()
-            plan_items_map.append((s, item.id))
-            next_position += 1
-
-        scheduled_map_by_day[plan_date] = plan_items_map
-        total_scheduled = len(existing_items) + len(plan_items_map)
-        plans_by_date[plan_date].summary = f"{total_scheduled} scheduled, {len(unscheduled)} unscheduled"
+            .execution_options(synchronize_session=False)
+        )
+    return plan_ids_by_date, new_item_rows, new_item_ids
+
+
+def _new_items_out(
+    new_item_rows: list[dict],
+    new_item_ids: dict[int, int],
+    scheduled_by_day: dict[date, list[dict]],
+    titles: dict[int, str],
+) -> dict[int, schemas.ScheduledTaskOut]:
+    payload_by_task = {s["task_id"]: s for scheduled in scheduled_by_day.values() for s in scheduled}
+    out = {}
+    for row in new_item_rows:
+        payload = payload_by_task[row["task_id"]]
+        out[row["task_id"]] = schemas.ScheduledTaskOut(
+            plan_item_id=new_item_ids[row["task_id"]],
+            task_id=row["task_id"],
+            title=titles.get(row["task_id"], ""),
+            start=row["start_datetime"],
+            end=row["end_datetime"],
+            explanation=row["explanation"] or "",
+            priority=payload["priority"],
+            llm_explanation=payload.get("llm_explanation"),
+        )
+    return out
 
-    for items in existing_items_by_day.values():
-        for item in items:
-            if item.task:
-                item.task.status = models.TaskStatus.scheduled
 
-    for t in tasks_to_assign:
-        if t.id in scheduled_ids:
-            t.status = models.TaskStatus.scheduled
-        else:
-            t.status = models.TaskStatus.unscheduled
+def _existing_item_out(item: models.PlanItem) -> schemas.ScheduledTaskOut:
+    return schemas.ScheduledTaskOut(
+        plan_item_id=item.id,
+        task_id=item.task_id,
+        title=item.task.title if item.task else "",
+        start=item.start_datetime,
+        end=item.end_datetime,
+        explanation=item.explanation or "",
+        priority=0.0,
+        llm_explanation=None,
+    )
 
-    db.commit()
 
-    plan = plans_by_date[plan_req.date]
-    items = (
-        db.query(models.PlanItem)
-        .filter(models.PlanItem.plan_id == plan.id)
-        .order_by(models.PlanItem.position.asc())
+def _unscheduled_out(db: Session, user_id: int, since: datetime, reasons: dict[int, str]):
+    unscheduled_tasks = (
+        db.query(models.Task)
+        .filter(
+            models.Task.user_id == user_id,
+            models.Task.status == models.TaskStatus.unscheduled,
+            models.Task.deadline >= since,
+        )
         .all()
     )
-    scheduled_payload_by_id = {item_id: s for s, item_id in scheduled_map_by_day.get(plan_req.date, [])}
-    scheduled_out = []
-    for i in items:
-        payload = scheduled_payload_by_id.get(i.id)
-        scheduled_out.append(
-            schemas.ScheduledTaskOut(
-                plan_item_id=i.id,
-                task_id=i.task_id,
-                title=i.task.title if i.task else "",
-                start=i.start_datetime,
-                end=i.end_datetime,
-                explanation=i.explanation or "",
-                priority=payload["priority"] if payload else 0.0,
-                llm_explanation=payload.get("llm_explanation") if payload else None,
+    return [
+        schemas.UnscheduledTaskOut.from_orm(t).copy(update={"reason": reasons.get(t.id)})
+        for t in unscheduled_tasks
+    ]
+
+
+def _horizon_windows(plan_date: date, horizon_dates: list[date]) -> list[tuple[date, date, list[date]]]:
+    """
+    ``(first_day, end_day, days)`` per ``PLAN_WINDOW_DAYS`` calendar days of the
+    horizon, ``end_day`` exclusive; windows without a workday are dropped.
+    """
+    windows = []
+    for first_offset in range(0, (horizon_dates[-1] - plan_date).days + 1, PLAN_WINDOW_DAYS):
+        first_day = plan_date + timedelta(days=first_offset)
+        end_day = first_day + timedelta(days=PLAN_WINDOW_DAYS)
+        days = [day for day in horizon_dates if first_day <= day < end_day]
+        if days:
+            windows.append((first_day, end_day, days))
+    return windows
+
+
+def _generate_plan_impl(plan_req: schemas.PlanRequest, db: Session, user, scheduler: SchedulerPool | None = None):
+    """
+    Plan the user's horizon from ``plan_req.date`` window by window.
+
+    Each window is scheduled together with the window after it, so tasks due
+    next week can still wait for next week, but only its own days are
+    written; it is committed before the next window is read. Memory and
+    transaction length thus follow two windows rather than the horizon.
+    Tasks a window does not take that are due later carry over, the rest
+    become unscheduled.
+    """
+    start_of_day = datetime.combine(plan_req.date, time.min)
+    settings = _get_or_create_settings(db, user.id)
+    horizon_dates = _horizon_dates(plan_req.date, settings)
+    windows = _horizon_windows(plan_req.date, horizon_dates)
+    lookahead_end = max(
+        start_of_day + timedelta(days=LOOKAHEAD_DAYS),
+        datetime.combine(windows[-1][1], time.min) + timedelta(days=PLAN_WINDOW_DAYS),
+    )
+
+    unscheduled_reasons: dict[int, str] = {}
+    day_out = None
+    for index, (first_day, end_day, days) in enumerate(windows):
+        if index + 1 < len(windows):
+            _, next_end_day, next_days = windows[index + 1]
+            due_before = datetime.combine(end_day, time.min)
+            deadline_to = min(
+                lookahead_end, datetime.combine(next_end_day, time.min) + timedelta(days=PLAN_WINDOW_DAYS)
             )
-        )
+        else:
+            next_days, due_before, deadline_to = [], None, lookahead_end
+        with _write_conflicts_as_409(db):
+            window_out = _plan_window(
+                db,
+                user,
+                settings,
+                plan_req,
+                horizon_dates,
+                days,
+                next_days,
+                due_before=due_before,
+                deadline_from=datetime.combine(first_day, time.min),
+                deadline_to=deadline_to,
+                lookahead_end=lookahead_end,
+                unscheduled_reasons=unscheduled_reasons,
+                scheduler=scheduler,
+            )
+            db.commit()
+        if window_out is not None:
+            day_out = window_out
 
-    unscheduled_tasks = (
+    model_version, model_confidence, scheduled_out = day_out
+    return schemas.PlanOut(
+        model_version=model_version,
+        model_confidence=model_confidence,
+        scheduled=scheduled_out,
+        unscheduled=_unscheduled_out(db, user.id, start_of_day, unscheduled_reasons),
+    )
+
+
+def _plan_window(
+    db: Session,
+    user,
+    settings: models.UserSettings,
+    plan_req: schemas.PlanRequest,
+    horizon_dates: list[date],
+    days: list[date],
+    next_days: list[date],
+    due_before: datetime | None,
+    deadline_from: datetime,
+    deadline_to: datetime,
+    lookahead_end: datetime,
+    unscheduled_reasons: dict[int, str],
+    scheduler: SchedulerPool | None = None,
+):
+    """
+    Schedule ``days`` and ``next_days`` together and write ``days`` only.
+
+    Tasks due at or after ``due_before`` that did not land on ``days`` are
+    left untouched for the next window; with ``due_before`` None every task
+    is settled here. Returns the plan day's ``(model_version,
+    model_confidence, scheduled)`` when it is in ``days``.
+    """
+    plans_by_date, existing_items_by_day = _load_days(db, user.id, days + next_days)
+    existing_task_ids = {item.task_id for day in days for item in existing_items_by_day[day]}
+
+    tasks_to_assign = (
         db.query(models.Task)
         .filter(
             models.Task.user_id == user.id,
-            models.Task.status == models.TaskStatus.unscheduled,
-            models.Task.deadline >= start_of_day,
+            models.Task.deadline >= deadline_from,
+            models.Task.deadline <= deadline_to,
+            models.Task.status.in_([models.TaskStatus.pending, models.TaskStatus.unscheduled]),
+            ~_planned_in_horizon(user.id, horizon_dates),
         )
         .all()
     )
-    unscheduled_out = []
-    for t in unscheduled_tasks:
-        unscheduled_out.append(
-            schemas.UnscheduledTaskOut.from_orm(t).copy(update={"reason": unscheduled_reasons.get(t.id)})
+
+    if days[0] == plan_req.date and not tasks_to_assign and not existing_task_ids:
+        if not _horizon_has_work(db, user.id, horizon_dates, deadline_from, lookahead_end):
+            raise HTTPException(status_code=400, detail="No pending tasks to plan for this date")
+
+    scheduled_by_day, unscheduled, model_confidence = _schedule_days(
+        db, user, settings, days + next_days, existing_items_by_day, tasks_to_assign, plan_req.quality, scheduler
+    )
+    scheduled_by_day = {day: scheduled_by_day.get(day, []) for day in days}
+    scheduled_ids = {s["task_id"] for scheduled in scheduled_by_day.values() for s in scheduled}
+    final_task_ids = {
+        t.id
+        for t in tasks_to_assign
+        if t.id in scheduled_ids or due_before is None or t.deadline < due_before
+    }
+    unscheduled = [u for u in unscheduled if u["id"] in final_task_ids]
+    unscheduled_reasons.update((u["id"], u.get("reason")) for u in unscheduled)
+
+    plans_by_date = {day: plan for day, plan in plans_by_date.items() if day in days}
+    plan_ids_by_date, new_item_rows, new_item_ids = _persist_schedule(
+        db,
+        user.id,
+        days,
+        plans_by_date,
+        existing_items_by_day,
+        scheduled_by_day,
+        unscheduled,
+        placed_task_ids=final_task_ids,
+        kept_task_ids=existing_task_ids,
+    )
+    if plan_req.date not in days:
+        return None
+
+    plan = plans_by_date.get(plan_req.date)
+    model_version = plan.model_version if plan else "priority_model_v1"
+    new_out = _new_items_out(new_item_rows, new_item_ids, scheduled_by_day, {t.id: t.title for t in tasks_to_assign})
+    day_entries = [
+        (item.position, item.id, _existing_item_out(item)) for item in existing_items_by_day[plan_req.date]
+    ] + [
+        (row["position"], new_item_ids[row["task_id"]], new_out[row["task_id"]])
+        for row in new_item_rows
+        if row["plan_id"] == plan_ids_by_date[plan_req.date]
+    ]
+    return model_version, model_confidence, [entry[2] for entry in sorted(day_entries, key=lambda entry: entry[:2])]
+
+
+def _horizon_has_work(
+    db: Session,
+    user_id: int,
+    horizon_dates: list[date],
+    deadline_from: datetime,
+    deadline_to: datetime,
+) -> bool:
+    pending = (
+        db.query(models.Task.id)
+        .filter(
+            models.Task.user_id == user_id,
+            models.Task.deadline >= deadline_from,
+            models.Task.deadline <= deadline_to,
+            models.Task.status.in_([models.TaskStatus.pending, models.TaskStatus.unscheduled]),
+            ~_planned_in_horizon(user_id, horizon_dates),
+        )
+        .first()
+    )
+    if pending is not None:
+        return True
+    planned = (
+        db.query(models.PlanItem.id)
+        .join(models.Plan, models.PlanItem.plan_id == models.Plan.id)
+        .filter(
+            models.Plan.user_id == user_id,
+            models.Plan.plan_date.in_([datetime.combine(day, time.min) for day in horizon_dates]),
         )
+        .first()
+    )
+    return planned is not None
 
-    return schemas.PlanOut(
-        model_version=plan.model_version,
-        model_confidence=model_confidence_by_day.get(plan_req.date),
+
+@router.post("/replan", response_model=schemas.ReplanOut)
+def replan(
+    replan_req: schemas.ReplanRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+    scheduler: SchedulerPool = Depends(get_scheduler_pool),
+):
+    try:
+        with _admitted(scheduler):
+            return _replan_impl(replan_req=replan_req, db=db, user=user, scheduler=scheduler)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("Failed to replan")
+        raise HTTPException(status_code=500, detail=f"Failed to replan: {exc}") from exc
+
+
+def _replan_impl(replan_req: schemas.ReplanRequest, db: Session, user, scheduler: SchedulerPool | None = None):
+    """
+    Reschedule only the horizon days a single change can affect.
+
+    A changed task can land on any horizon day up to its deadline, plus the
+    day its AI-placed item is taken from. A moved or deleted item frees time
+    on ``previous_date`` and only takes time from its own day. Those days are
+    rescheduled around their existing items for the changed task and, where
+    time was freed, the user's unscheduled tasks; no other day is read or
+    written.
+    """
+    settings = _get_or_create_settings(db, user.id)
+    horizon_dates = _horizon_dates(replan_req.date, settings)
+
+    affected: set[date] = set()
+    changed_task = None
+    if replan_req.task_id is not None:
+        changed_task = (
+            db.query(models.Task)
+            .filter(models.Task.id == replan_req.task_id, models.Task.user_id == user.id)
+            .first()
+        )
+        if not changed_task:
+            raise HTTPException(status_code=404, detail="Task not found")
+        affected.update(day for day in horizon_dates if day <= changed_task.deadline.date())
+    if replan_req.item_id is not None:
+        item_date = (
+            db.query(models.Plan.plan_date)
+            .join(models.PlanItem, models.PlanItem.plan_id == models.Plan.id)
+            .filter(models.PlanItem.id == replan_req.item_id, models.Plan.user_id == user.id)
+            .scalar()
+        )
+        if item_date is None:
+            raise HTTPException(status_code=404, detail="Plan item not found")
+        affected.add(item_date.date())
+    if replan_req.previous_date is not None:
+        affected.add(replan_req.previous_date)
+
+    # a changed task gives up its AI-placed item; a manually placed one stays pinned
+    released_items = []
+    if changed_task is not None and changed_task.status != models.TaskStatus.completed:
+        task_items = (
+            db.query(models.PlanItem, models.Plan.plan_date)
+            .join(models.Plan, models.PlanItem.plan_id == models.Plan.id)
+            .filter(
+                models.PlanItem.task_id == changed_task.id,
+                models.Plan.plan_date.in_([datetime.combine(day, time.min) for day in horizon_dates]),
+            )
+            .all()
+        )
+        if any(item.source != "ai" for item, _ in task_items):
+            raise HTTPException(status_code=409, detail="Task is placed manually; move its item instead")
+        for item, plan_date in task_items:
+            released_items.append(item)
+            affected.add(plan_date.date())
+
+    days = sorted(day for day in affected if day in horizon_dates)
+    if not days:
+        raise HTTPException(status_code=400, detail="Change does not affect the planning horizon")
+
+    for item in released_items:
+        db.delete(item)
+    db.flush()
+
+    plans_by_date, existing_items_by_day = _load_days(db, user.id, days, intervals_only=True)
+    candidates = []
+    # unscheduled tasks only get a new chance where time was freed
+    if released_items or replan_req.item_id is not None or replan_req.previous_date is not None:
+        candidates = (
+            db.query(models.Task)
+            .filter(
+                models.Task.user_id == user.id,
+                models.Task.deadline >= datetime.combine(days[0], time.min),
+                models.Task.status == models.TaskStatus.unscheduled,
+                ~_planned_in_horizon(user.id, horizon_dates),
+            )
+            .all()
+        )
+    if changed_task is not None and changed_task.status != models.TaskStatus.completed:
+        candidates = [changed_task] + [t for t in candidates if t.id != changed_task.id]
+
+    scheduled_by_day, unscheduled, model_confidence = _schedule_days(
+        db, user, settings, days, existing_items_by_day, candidates, replan_req.quality, scheduler
+    )
+    with _write_conflicts_as_409(db):
+        _, new_item_rows, new_item_ids = _persist_schedule(
+            db,
+            user.id,
+            days,
+            plans_by_date,
+            existing_items_by_day,
+            scheduled_by_day,
+            unscheduled,
+            placed_task_ids={t.id for t in candidates},
+            kept_task_ids=set(),
+        )
+    new_out = _new_items_out(new_item_rows, new_item_ids, scheduled_by_day, {t.id: t.title for t in candidates})
+    scheduled_out = sorted(new_out.values(), key=lambda entry: entry.start)
+    # the status UPDATE bypassed the session, so set it on the way out
+    unscheduled_reasons = {u["id"]: u.get("reason") for u in unscheduled}
+    unscheduled_out = [
+        schemas.UnscheduledTaskOut.from_orm(t).copy(
+            update={"status": models.TaskStatus.unscheduled, "reason": unscheduled_reasons[t.id]}
+        )
+        for t in candidates
+        if t.id in unscheduled_reasons
+    ]
+
+    with _write_conflicts_as_409(db):
+        db.commit()
+
+    return schemas.ReplanOut(
+        affected_dates=days,
+        model_confidence=model_confidence,
         scheduled=scheduled_out,
         unscheduled=unscheduled_out,
     )
 
 
+def _plan_rows(db: Session, user_id: int, first_date: date, last_date: date):
+    """
+    Plans in a date range with their items and task titles, one row per item.
+
+    A single LEFT JOIN projection, so plans without items still yield a row
+    (with ``item_id`` None) and no per-item lazy loads are needed.
+    """
+    return (
+        db.query(
+            models.Plan.id.label("plan_id"),
+            models.Plan.plan_date,
+            models.Plan.model_version,
+            models.Plan.summary,
+            models.PlanItem.id.label("item_id"),
+            models.PlanItem.task_id,
+            models.PlanItem.start_datetime,
+            models.PlanItem.end_datetime,
+            models.PlanItem.explanation,
+            models.Task.title,
+        )
+        .outerjoin(models.PlanItem, models.PlanItem.plan_id == models.Plan.id)
+        .outerjoin(models.Task, models.Task.id == models.PlanItem.task_id)
+        .filter(
+            models.Plan.user_id == user_id,
+            models.Plan.plan_date >= datetime.combine(first_date, datetime.min.time()),
+            models.Plan.plan_date <= datetime.combine(last_date, datetime.min.time()),
+        )
+        .order_by(models.Plan.plan_date.asc(), models.PlanItem.position.asc(), models.PlanItem.id.asc())
+        .all()
+    )
+
+
 @router.get("/plan", response_model=schemas.PlanOut)
 def get_plan(plan_date: date, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    plan_datetime = datetime.combine(plan_date, datetime.min.time())
-    plan = (
-        db.query(models.Plan)
-        .filter(models.Plan.user_id == user.id, models.Plan.plan_date == plan_datetime)
-        .first()
-    )
-    if not plan:
+    rows = _plan_rows(db, user.id, plan_date, plan_date)
+    if not rows:
         raise HTTPException(status_code=404, detail="No plan found for this date")
 
-    items = (
-        db.query(models.PlanItem)
-        .filter(models.PlanItem.plan_id == plan.id)
-        .order_by(models.PlanItem.position.asc())
-        .all()
-    )
     scheduled = [
         schemas.ScheduledTaskOut(
-            plan_item_id=i.id,
-            task_id=i.task_id,
-            title=i.task.title if i.task else "",
-            start=i.start_datetime,
-            end=i.end_datetime,
-            explanation=i.explanation or "",
+            plan_item_id=row.item_id,
+            task_id=row.task_id,
+            title=row.title or "",
+            start=row.start_datetime,
+            end=row.end_datetime,
+            explanation=row.explanation or "",
             priority=0.0,
             llm_explanation=None,
         )
-        for i in items
+        for row in rows
+        if row.item_id is not None
     ]
 
-    start_of_day = plan_datetime
+    start_of_day = datetime.combine(plan_date, datetime.min.time())
     unscheduled_tasks = (
         db.query(models.Task)
         .filter(
@@ -392,7 +891,7 @@ def get_plan(plan_date: date, db: Session = Depends(get_db), user=Depends(get_cu
     ]
 
     return schemas.PlanOut(
-        model_version=plan.model_version,
+        model_version=rows[0].model_version,
         model_confidence=None,
         scheduled=scheduled,
         unscheduled=unscheduled,
@@ -406,55 +905,240 @@ def calendar(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    plans = (
-        db.query(models.Plan)
-        .filter(
-            models.Plan.user_id == user.id,
-            models.Plan.plan_date >= datetime.combine(start_date, datetime.min.time()),
-            models.Plan.plan_date <= datetime.combine(end_date, datetime.min.time()),
+    calendar = []
+    days_by_plan: dict[int, dict] = {}
+    for row in _plan_rows(db, user.id, start_date, end_date):
+        day = days_by_plan.get(row.plan_id)
+        if day is None:
+            day = days_by_plan[row.plan_id] = {
+                "plan_date": row.plan_date.date().isoformat(),
+                "model_version": row.model_version,
+                "summary": row.summary,
+                "scheduled": [],
+            }
+            calendar.append(day)
+        if row.item_id is None:
+            continue
+        day["scheduled"].append(
+            {
+                "plan_item_id": row.item_id,
+                "task_id": row.task_id,
+                "title": row.title or "",
+                "start": row.start_datetime.isoformat(),
+                "end": row.end_datetime.isoformat(),
+                "explanation": row.explanation or "",
+                "llm_explanation": None,
+                "priority": 0.0,
+            }
         )
-        .order_by(models.Plan.plan_date.asc())
-        .all()
-    )
+    return {"days": calendar}
+
+
+def _occupied_message(title: str, start: datetime, end: datetime) -> str:
+    return f"Time slot already occupied by '{title}' from {start:%H:%M} to {end:%H:%M}."
+
+
+def _sweep_day(plan_date: date, entries: list[dict], ripple: bool) -> dict[int, tuple[datetime, datetime]]:
+    """
+    Check one day's items for overlaps after a batch of moves.
+
+    ``entries`` hold ``id``, ``title``, ``start``, ``end`` and ``moved``.
+    Sorted by start, each item is compared with the item that ends last so
+    far; an overlap involving a moved item is a 400. With ``ripple`` an
+    unmoved item that a moved (or already shifted) item runs into is pushed
+    back to start where that item ends, which cascades down the day.
+    Overlaps between untouched items are left alone. Returns the new times
+    of the shifted items.
+    """
+    day_end = datetime.combine(plan_date + timedelta(days=1), time.min)
+    shifted: dict[int, tuple[datetime, datetime]] = {}
+    last = None
+    # on equal starts the moved item keeps its slot
+    for entry in sorted(entries, key=lambda e: (e["start"], not e["moved"])):
+        if last is not None and entry["start"] < last["end"]:
+            if ripple and not entry["moved"] and (last["moved"] or last["id"] in shifted):
+                entry = {**entry, "start": last["end"], "end": entry["end"] + (last["end"] - entry["start"])}
+                if entry["end"] > day_end:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Not enough room left on {plan_date.isoformat()} to shift '{entry['title']}'.",
+                    )
+                shifted[entry["id"]] = (entry["start"], entry["end"])
+            elif entry["moved"] or last["moved"]:
+                occupant = last if entry["moved"] else entry
+                raise HTTPException(
+                    status_code=400,
+                    detail=_occupied_message(occupant["title"], occupant["start"], occupant["end"]),
+                )
+        if last is None or entry["end"] > last["end"]:
+            last = entry
+    return shifted
+
+
+def _move_plan_items(
+    db: Session,
+    user: models.User,
+    moves: list[schemas.PlanItemMove],
+    ripple: bool = False,
+) -> tuple[list[schemas.ScheduledTaskOut], list[schemas.ScheduledTaskOut]]:
+    """
+    Move plan items in one transaction, all or nothing.
+
+    The moved items come with their plans and tasks in one query and the
+    other items of the target days in a second one; overlaps across the
+    whole batch are found in memory by ``_sweep_day``. Missing plans,
+    shifted items and feedback rows are written in bulk and committed once.
+    Returns the moved and the ripple-shifted items.
+    """
+    targets: dict[int, tuple[datetime, datetime]] = {}
+    for move in moves:
+        start, end = _normalize_dt(move.start), _normalize_dt(move.end)
+        if end <= start:
+            raise HTTPException(status_code=400, detail="End time must be after start time.")
+        targets[move.item_id] = (start, end)
 
     items = (
         db.query(models.PlanItem)
         .join(models.Plan, models.PlanItem.plan_id == models.Plan.id)
-        .filter(
-            models.Plan.user_id == user.id,
-            models.Plan.plan_date >= datetime.combine(start_date, datetime.min.time()),
-            models.Plan.plan_date <= datetime.combine(end_date, datetime.min.time()),
-        )
+        .options(contains_eager(models.PlanItem.plan), joinedload(models.PlanItem.task))
+        .filter(models.PlanItem.id.in_(targets), models.Plan.user_id == user.id)
         .all()
     )
-    items_by_plan = {}
-    for it in items:
-        items_by_plan.setdefault(it.plan_id, []).append(it)
+    if len(items) != len(targets):
+        raise HTTPException(status_code=404, detail="Plan item not found")
 
-    calendar = []
-    for plan in plans:
-        day_items = items_by_plan.get(plan.id, [])
-        calendar.append(
-            {
-                "plan_date": plan.plan_date.date().isoformat(),
-                "model_version": plan.model_version,
-                "summary": plan.summary,
-                "scheduled": [
-                    {
-                        "plan_item_id": it.id,
-                        "task_id": it.task_id,
-                        "title": it.task.title if it.task else "",
-                        "start": it.start_datetime.isoformat(),
-                        "end": it.end_datetime.isoformat(),
-                        "explanation": it.explanation or "",
-                        "llm_explanation": None,
-                        "priority": 0.0,
-                    }
-                    for it in sorted(day_items, key=lambda i: i.position)
+    target_dates = {start.date() for start, _ in targets.values()}
+    plans_by_date = {
+        plan.plan_date.date(): plan
+        for plan in db.query(models.Plan).filter(
+            models.Plan.user_id == user.id,
+            models.Plan.plan_date.in_([datetime.combine(d, time.min) for d in target_dates]),
+        )
+    }
+    plan_dates_by_id = {plan.id: plan_date for plan_date, plan in plans_by_date.items()}
+    entries_by_date: dict[date, list[dict]] = {plan_date: [] for plan_date in target_dates}
+    others: dict[int, tuple] = {}
+    if plans_by_date:
+        for row in (
+            db.query(
+                models.PlanItem.id,
+                models.PlanItem.plan_id,
+                models.PlanItem.task_id,
+                models.PlanItem.start_datetime,
+                models.PlanItem.end_datetime,
+                models.PlanItem.explanation,
+                models.Task.title,
+            )
+            .outerjoin(models.Task, models.PlanItem.task_id == models.Task.id)
+            .filter(models.PlanItem.plan_id.in_(plan_dates_by_id), models.PlanItem.id.notin_(targets))
+        ):
+            others[row.id] = row
+            entries_by_date[plan_dates_by_id[row.plan_id]].append(
+                dict(id=row.id, title=row.title or "another task", start=row.start_datetime, end=row.end_datetime, moved=False)
+            )
+    for item in items:
+        start, end = targets[item.id]
+        entries_by_date[start.date()].append(
+            dict(id=item.id, title=item.task.title if item.task else "another task", start=start, end=end, moved=True)
+        )
+    shifted: dict[int, tuple[datetime, datetime]] = {}
+    for plan_date, entries in entries_by_date.items():
+        shifted.update(_sweep_day(plan_date, entries, ripple))
+
+    now = datetime.utcnow()
+    moved_out = []
+    feedback = []
+    with _write_conflicts_as_409(db):
+        for item in items:
+            _touch_plan(item.plan)
+        for plan_date in target_dates:
+            if plan_date in plans_by_date:
+                _touch_plan(plans_by_date[plan_date])
+        # claim the plans before writing; a concurrent writer makes this raise StaleDataError
+        db.flush()
+        model_versions = {targets[item.id][0].date(): item.plan.model_version for item in items}
+        new_plan_rows = [
+            dict(
+                user_id=user.id,
+                plan_date=datetime.combine(plan_date, time.min),
+                model_version=model_versions[plan_date],
+                status=models.PlanStatus.adjusted,
+                summary=None,
+            )
+            for plan_date in sorted(target_dates)
+            if plan_date not in plans_by_date
+        ]
+        plan_ids_by_date = {plan_date: plan.id for plan_date, plan in plans_by_date.items()}
+        if new_plan_rows:
+            inserted = db.execute(
+                insert(models.Plan).returning(models.Plan.id, models.Plan.plan_date),
+                new_plan_rows,
+            )
+            plan_ids_by_date.update((plan_datetime.date(), plan_id) for plan_id, plan_datetime in inserted)
+
+        for item in items:
+            start, end = targets[item.id]
+            # feedback: earlier (+1) vs later (-1)
+            delta = (start - item.start_datetime).total_seconds()
+            outcome = 1 if delta < 0 else -1 if delta > 0 else 0
+            if outcome != 0:
+                feedback.append((item, outcome))
+            if item.plan.plan_date.date() != start.date():
+                item.plan_id = plan_ids_by_date[start.date()]
+                item.position = 0
+            item.start_datetime = start
+            item.end_datetime = end
+            item.source = "manual"
+            if item.task:
+                item.task.status = models.TaskStatus.scheduled
+            moved_out.append(
+                schemas.ScheduledTaskOut(
+                    plan_item_id=item.id,
+                    task_id=item.task_id,
+                    title=item.task.title if item.task else "",
+                    start=start,
+                    end=end,
+                    explanation=item.explanation or "",
+                    priority=0.0,
+                    llm_explanation=None,
+                )
+            )
+        if shifted:
+            db.execute(
+                update(models.PlanItem),
+                [dict(id=item_id, start_datetime=start, end_datetime=end) for item_id, (start, end) in shifted.items()],
+            )
+        if feedback:
+            db.execute(
+                insert(models.FeedbackLog),
+                [
+                    dict(
+                        user_id=user.id,
+                        task_id=item.task_id,
+                        outcome=outcome,
+                        note="User manually adjusted schedule",
+                        created_at=now,
+                    )
+                    for item, outcome in feedback
                 ],
-            }
+            )
+            accumulate_feedback_many(db, user.id, [(item.task, outcome) for item, outcome in feedback if item.task], now)
+        db.commit()
+
+    shifted_out = [
+        schemas.ScheduledTaskOut(
+            plan_item_id=item_id,
+            task_id=others[item_id].task_id,
+            title=others[item_id].title or "",
+            start=start,
+            end=end,
+            explanation=others[item_id].explanation or "",
+            priority=0.0,
+            llm_explanation=None,
         )
-    return {"days": calendar}
+        for item_id, (start, end) in sorted(shifted.items(), key=lambda kv: kv[1])
+    ]
+    return moved_out, shifted_out
 
 
 @router.patch("/item/{item_id}", response_model=schemas.ScheduledTaskOut)
@@ -465,102 +1149,18 @@ def update_plan_item(
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    item = (
-        db.query(models.PlanItem)
-        .join(models.Plan, models.PlanItem.plan_id == models.Plan.id)
-        .filter(models.PlanItem.id == item_id, models.Plan.user_id == user.id)
-        .first()
-    )
-    if not item:
-        raise HTTPException(status_code=404, detail="Plan item not found")
+    [moved], _ = _move_plan_items(db, user, [schemas.PlanItemMove(item_id=item_id, start=start, end=end)])
+    return moved
 
-    start = _normalize_dt(start)
-    end = _normalize_dt(end)
 
-    if end <= start:
-        raise HTTPException(status_code=400, detail="End time must be after start time.")
-
-    original_start = item.start_datetime
-    new_plan_date = start.date()
-    target_plan = item.plan
-
-    # move to another plan if date changed
-    if item.plan.plan_date.date() != new_plan_date:
-        new_plan_datetime = datetime.combine(new_plan_date, datetime.min.time())
-        target_plan = (
-            db.query(models.Plan)
-            .filter(models.Plan.user_id == user.id, models.Plan.plan_date == new_plan_datetime)
-            .first()
-        )
-
-    if target_plan:
-        conflict = (
-            db.query(models.PlanItem)
-            .join(models.Task, models.PlanItem.task_id == models.Task.id)
-            .filter(
-                models.PlanItem.plan_id == target_plan.id,
-                models.PlanItem.id != item.id,
-                models.PlanItem.start_datetime < end,
-                models.PlanItem.end_datetime > start,
-            )
-            .order_by(models.PlanItem.start_datetime.asc())
-            .first()
-        )
-        if conflict:
-            conflict_title = conflict.task.title if conflict.task else "another task"
-            conflict_start = conflict.start_datetime.strftime("%H:%M")
-            conflict_end = conflict.end_datetime.strftime("%H:%M")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Time slot already occupied by '{conflict_title}' from {conflict_start} to {conflict_end}.",
-            )
-
-    if item.plan.plan_date.date() != new_plan_date:
-        if not target_plan:
-            new_plan = models.Plan(
-                user_id=user.id,
-                plan_date=new_plan_datetime,
-                model_version=item.plan.model_version,
-                status=models.PlanStatus.adjusted,
-                summary=None,
-            )
-            db.add(new_plan)
-            db.flush()
-            target_plan = new_plan
-        item.plan_id = target_plan.id
-        item.position = 0
-
-    item.start_datetime = start
-    item.end_datetime = end
-    item.source = "manual"
-    if item.task:
-        item.task.status = models.TaskStatus.scheduled
-    db.commit()
-    db.refresh(item)
-
-    # feedback: earlier (+1) vs later (-1)
-    delta = (start - original_start).total_seconds()
-    outcome = 1 if delta < 0 else -1 if delta > 0 else 0
-    if outcome != 0:
-        fb = models.FeedbackLog(
-            user_id=user.id,
-            task_id=item.task_id,
-            outcome=outcome,
-            note="User manually adjusted schedule",
-        )
-        db.add(fb)
-        db.commit()
-
-    return schemas.ScheduledTaskOut(
-        plan_item_id=item.id,
-        task_id=item.task_id,
-        title=item.task.title if item.task else "",
-        start=item.start_datetime,
-        end=item.end_datetime,
-        explanation=item.explanation or "",
-        priority=0.0,
-        llm_explanation=None,
-    )
+@router.patch("/items", response_model=schemas.PlanItemMovesOut)
+def move_plan_items(
+    payload: schemas.PlanItemMovesRequest,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    moved, shifted = _move_plan_items(db, user, payload.moves, ripple=payload.ripple)
+    return schemas.PlanItemMovesOut(moved=moved, shifted=shifted)
 
 
 @router.delete("/item/{item_id}")
@@ -574,6 +1174,7 @@ def delete_plan_item(item_id: int, db: Session = Depends(get_db), user=Depends(g
     if not item:
         raise HTTPException(status_code=404, detail="Plan item not found")
     task = item.task
+    _touch_plan(item.plan)
     db.delete(item)
     if task:
         remaining = (
@@ -583,5 +1184,6 @@ def delete_plan_item(item_id: int, db: Session = Depends(get_db), user=Depends(g
         )
         if not remaining:
             task.status = models.TaskStatus.unscheduled
-    db.commit()
+    with _write_conflicts_as_409(db):
+        db.commit()
     return {"detail": "Removed from calendar"}
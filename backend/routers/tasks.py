@@ -1,8 +1,13 @@
-﻿from fastapi import APIRouter, Depends, HTTPException
+﻿from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from .. import models, schemas
 from ..dependencies import get_current_user, get_db
+from ..ml import predict_priority_columns
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -42,6 +47,51 @@ def list_tasks(db: Session = Depends(get_db), user=Depends(get_current_user)):
     return tasks
 
 
+@router.get("/ranked", response_model=list[schemas.RankedTaskOut])
+def rank_tasks(
+    plan_date: Optional[date] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+):
+    # table columns rather than ORM entities: a backlog can run to thousands of
+    # tasks, and the rows are scored column by column
+    tasks_table = models.Task.__table__
+    result = db.execute(
+        select(
+            tasks_table.c.id,
+            tasks_table.c.title,
+            tasks_table.c.duration_minutes,
+            tasks_table.c.deadline,
+            tasks_table.c.task_type,
+            tasks_table.c.importance,
+            tasks_table.c.preferred_time,
+            tasks_table.c.energy,
+            tasks_table.c.status,
+        )
+        .where(tasks_table.c.user_id == user.id, tasks_table.c.status != models.TaskStatus.completed)
+        .order_by(tasks_table.c.deadline.asc())
+    )
+    keys = list(result.keys())
+    rows = result.all()
+    if not rows:
+        return []
+    columns = dict(zip(keys, zip(*rows)))
+    scores = predict_priority_columns(
+        duration_minutes=columns["duration_minutes"],
+        deadline=columns["deadline"],
+        importance=columns["importance"],
+        task_type=columns["task_type"],
+        preferred_time=columns["preferred_time"],
+        energy=columns["energy"],
+        user_profile=user.profile.value,
+        plan_date=plan_date or date.today(),
+    ).tolist()
+    # stable, so equal priorities keep the earlier deadline first
+    order = sorted(range(len(rows)), key=scores.__getitem__, reverse=True)[:limit]
+    return [dict(zip(keys, rows[idx]), priority=scores[idx]) for idx in order]
+
+
 @router.delete("/{task_id}")
 def delete_task(task_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
     task = (
@@ -0,0 +1,118 @@
+import math
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .ml import get_priority_model, get_table_priority_model
+
+SCHEDULER_PROCESSES = 0
+SCHEDULER_MAX_PENDING = 8
+_RUN_SAMPLES = 64
+
+
+class SchedulerBusy(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__(f"Scheduler is at capacity, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def _warm_worker(priority_model: str = "tree") -> None:
+    # load the model when the worker starts, not on its first plan
+    get_priority_model()
+    if priority_model == "table":
+        get_table_priority_model()
+
+
+class SchedulerPool:
+    """
+    Admission control for plan computations, plus an optional process pool
+    that runs the scheduler.
+
+    ``acquire`` admits at most ``max(1, processes) + max_pending`` plan
+    computations at a time and raises ``SchedulerBusy`` beyond that, with a
+    retry estimate from recent run times. ``run`` calls the scheduler in a
+    worker process that keeps a warm copy of the priority model, so scoring
+    and search do not hold this process's GIL. Arguments and results must be
+    picklable. With ``processes=0`` it runs inline on the calling thread.
+    ``priority_model`` names the model the workers warm up, as in
+    ``generate_schedule``.
+    """
+
+    def __init__(
+        self,
+        processes: int = SCHEDULER_PROCESSES,
+        max_pending: int = SCHEDULER_MAX_PENDING,
+        priority_model: str = "tree",
+    ):
+        self.processes = max(0, processes)
+        self.priority_model = priority_model
+        self.capacity = max(1, self.processes) + max(0, max_pending)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self._rejected = 0
+        self._runs = 0
+        self._run_s: Deque[float] = deque(maxlen=_RUN_SAMPLES)
+        self._executor: Optional[ProcessPoolExecutor] = self._new_executor() if self.processes else None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn, not fork: the server process holds threads and open connections
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+            initargs=(self.priority_model,),
+        )
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._admitted >= self.capacity:
+                self._rejected += 1
+                raise SchedulerBusy(self._retry_after())
+            self._admitted += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._admitted -= 1
+
+    def _retry_after(self) -> int:
+        # the work already admitted, at the recent mean run time, spread over the workers
+        mean_s = sum(self._run_s) / len(self._run_s) if self._run_s else 1.0
+        return max(1, math.ceil(mean_s * self._admitted / max(1, self.processes)))
+
+    def run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        executor = self._executor
+        try:
+            if executor is None:
+                return fn(**kwargs)
+            return executor.submit(fn, **kwargs).result()
+        except BrokenProcessPool:
+            # a worker died; later plans get a fresh pool
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._new_executor()
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            with self._lock:
+                self._runs += 1
+                self._run_s.append(time.perf_counter() - started)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "capacity": self.capacity,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "runs": self._runs,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
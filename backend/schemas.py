@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from typing import Optional, List, Literal
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
 
 from .models import UserProfile, TaskStatus
 
@@ -40,6 +40,30 @@ class AuthResponse(BaseModel):
     user: UserOut
 
 
+class UserSettingsOut(BaseModel):
+    working_hours_start: str
+    working_hours_end: str
+    work_days_mask: str
+    default_planning_horizon_hours: int
+    slot_minutes: int
+    notifications_enabled: bool
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserSettingsUpdate(BaseModel):
+    slot_minutes: Optional[int] = Field(None, ge=5, le=60)
+    # planning caps the horizon at 90 days
+    default_planning_horizon_hours: Optional[int] = Field(None, ge=1, le=90 * 24)
+
+    @field_validator("slot_minutes")
+    @classmethod
+    def _divides_hour(cls, value):
+        if value is not None and 60 % value:
+            raise ValueError("slot_minutes must divide 60")
+        return value
+
+
 class TaskCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -69,8 +93,22 @@ class TaskOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RankedTaskOut(BaseModel):
+    id: int
+    title: str
+    duration_minutes: int
+    deadline: datetime
+    task_type: str
+    importance: str
+    preferred_time: str
+    energy: str
+    status: TaskStatus
+    priority: float
+
+
 class PlanRequest(BaseModel):
     date: date
+    quality: Literal["standard", "best"] = "standard"
 
 
 class ScheduledTaskOut(BaseModel):
@@ -91,6 +129,62 @@ class PlanOut(BaseModel):
     unscheduled: List["UnscheduledTaskOut"]
 
 
+class ReplanRequest(BaseModel):
+    date: date
+    task_id: Optional[int] = None
+    item_id: Optional[int] = None
+    previous_date: Optional[date] = None
+    quality: Literal["standard", "best"] = "standard"
+
+    @model_validator(mode="after")
+    def _has_change(self):
+        if self.task_id is None and self.item_id is None and self.previous_date is None:
+            raise ValueError("Provide task_id, item_id or previous_date")
+        return self
+
+
+class ReplanOut(BaseModel):
+    affected_dates: List[date]
+    model_confidence: Optional[float] = None
+    scheduled: List[ScheduledTaskOut]
+    unscheduled: List["UnscheduledTaskOut"]
+
+
+class PlanItemMove(BaseModel):
+    item_id: int
+    start: datetime
+    end: datetime
+
+
+class PlanItemMovesRequest(BaseModel):
+    moves: List[PlanItemMove] = Field(min_length=1, max_length=200)
+    ripple: bool = False
+
+    @model_validator(mode="after")
+    def _unique_items(self):
+        if len({move.item_id for move in self.moves}) != len(self.moves):
+            raise ValueError("Each item can be moved only once per request")
+        return self
+
+
+class PlanItemMovesOut(BaseModel):
+    moved: List[ScheduledTaskOut]
+    shifted: List[ScheduledTaskOut]
+
+
+class PlanJobOut(BaseModel):
+    id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[PlanOut] = None
+    error: Optional[str] = None
+    error_status: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class FeedbackCreate(BaseModel):
     task_id: Optional[int] = None
     outcome: Literal[-1, 1] = Field(..., description="+1 if user wanted earlier/higher priority, -1 if later")
@@ -0,0 +1,142 @@
+import itertools
+import random
+from datetime import date, datetime, timedelta
+
+from backend.ml import scheduler
+from backend.ml.exact import _plan_cost, solve_day_exact
+
+
+class _LinearModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def predict(self, payload):
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+def _random_day(seed: int):
+    rng = random.Random(seed)
+    plan_date = date(2025, 3, 3) + timedelta(days=rng.randint(0, 6))
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i + 1,
+            title=f"Task {i}",
+            duration_minutes=rng.choice([30, 45, 60, 90]),
+            deadline=day_start + timedelta(hours=rng.uniform(10, 60)),
+            task_type=rng.choice(["work", "study", "admin", "personal"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(rng.randint(3, 8))
+    ]
+    busy_start = day_start + timedelta(hours=rng.randint(9, 18))
+    return plan_date, tasks, [(busy_start, busy_start + timedelta(minutes=45))]
+
+
+def _random_assignments(rng: random.Random):
+    cost_model = scheduler.DayCostModel(scheduler.build_slot_offsets(8, 13))
+    occupied = scheduler.OccupancyIndex(cost_model.n_slots)
+    busy = rng.randrange(cost_model.n_slots - 1)
+    occupied.occupy(busy, busy + 1, -1)
+    assignments = {}
+    for task_id in range(1, rng.randint(2, 4) + 1):
+        required_slots = rng.randint(1, 3)
+        latest_end_minute = rng.choice([780.0, 480.0 + rng.randint(3, 10) * 30])
+        starts = cost_model.candidate_starts(occupied, required_slots, latest_end_minute).tolist()
+        if not starts:
+            continue
+        start = rng.choice(starts)
+        occupied.occupy(start, start + required_slots, task_id)
+        assignments[task_id] = dict(
+            start_idx=start,
+            end_idx=start + required_slots,
+            required_slots=required_slots,
+            latest_end_minute=latest_end_minute,
+            preferred_window=tuple(sorted(rng.sample(range(cost_model.n_slots + 1), 2))),
+            energy=rng.choice(["low", "medium", "high"]),
+            duration_minutes=required_slots * 30,
+            hours_until_deadline=rng.uniform(1.0, 60.0),
+        )
+    return assignments, occupied, cost_model
+
+
+def _brute_force_cost(assignments, occupied, cost_model):
+    fixed = scheduler.OccupancyIndex(cost_model.n_slots)
+    for idx, owner in enumerate(occupied.owners):
+        if owner == -1:
+            fixed.occupy(idx, idx + 1, -1)
+    task_ids = list(assignments)
+    options = [
+        cost_model.candidate_starts(
+            fixed, assignments[t]["required_slots"], assignments[t]["latest_end_minute"]
+        ).tolist()
+        for t in task_ids
+    ]
+    best = float("inf")
+    for starts in itertools.product(*options):
+        trial = scheduler.OccupancyIndex(cost_model.n_slots)
+        trial.owners = list(fixed.owners)
+        trial.free_run = list(fixed.free_run)
+        trial.free_back = list(fixed.free_back)
+        placed = {}
+        for task_id, start in zip(task_ids, starts):
+            info = assignments[task_id]
+            if not trial.fits(start, info["required_slots"]):
+                break
+            trial.occupy(start, start + info["required_slots"], task_id)
+            placed[task_id] = dict(info, start_idx=start, end_idx=start + info["required_slots"])
+        else:
+            best = min(best, _plan_cost(placed, trial, cost_model))
+    return best
+
+
+def test_exact_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(60):
+        assignments, occupied, cost_model = _random_assignments(rng)
+        expected = _brute_force_cost(assignments, occupied, cost_model)
+
+        report = solve_day_exact(assignments, occupied, cost_model, budget_ms=1000)
+
+        assert report["optimal"]
+        assert abs(report["final_cost"] - expected) < 1e-9
+        assert abs(_plan_cost(assignments, occupied, cost_model) - expected) < 1e-9
+
+
+def test_exact_mode_never_worse_than_local_search():
+    for seed in range(15):
+        plan_date, tasks, busy = _random_day(seed)
+        standard, best = {}, {}
+        scheduler.schedule_day(
+            tasks, "worker", plan_date, occupied_intervals=busy, model=_LinearModel(), search_stats=standard
+        )
+        scheduled, _, _ = scheduler.schedule_day(
+            tasks, "worker", plan_date, occupied_intervals=busy, model=_LinearModel(),
+            exact=True, exact_budget_ms=200, search_stats=best,
+        )
+
+        assert best["exact"]["attempted"]
+        assert best["exact"]["final_cost"] <= standard["final_cost"] + 1e-9
+        spans = sorted((s["start"], s["end"]) for s in scheduled)
+        for (_, end_a), (start_b, _) in zip(spans, spans[1:]):
+            assert end_a <= start_b
+
+
+def test_exact_keeps_incumbent_when_limit_is_hit():
+    rng = random.Random(3)
+    assignments, occupied, cost_model = _random_assignments(rng)
+    before = {task_id: info["start_idx"] for task_id, info in assignments.items()}
+    owners = list(occupied.owners)
+
+    report = solve_day_exact(assignments, occupied, cost_model, node_limit=1)
+
+    assert not report["optimal"]
+    assert report["limit"] == "nodes"
+    assert report["final_cost"] == report["initial_cost"]
+    assert {task_id: info["start_idx"] for task_id, info in assignments.items()} == before
+    assert occupied.owners == owners
+
+    skipped = solve_day_exact(assignments, occupied, cost_model, max_tasks=0)
+    assert not skipped["attempted"]
+    assert skipped["limit"] == "max_tasks"
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from backend.ml.priority_model import FEATURE_ORDER, encode_feature_columns, encode_features
+
+
+ROWS = [
+    dict(user_type="student", duration_minutes=30, hours_until_deadline=4.5, importance="high", task_type="study",
+         preferred_time="morning", energy="low", plan_day_of_week=0, is_weekend=0),
+    dict(user_type="entrepreneur", duration_minutes=120, hours_until_deadline=0.0, importance="low", task_type="admin",
+         preferred_time="evening", energy="high", plan_day_of_week=6, is_weekend=1),
+    # unknown categories fall back to the same defaults as encode_features
+    dict(user_type="retiree", duration_minutes=45, hours_until_deadline=72.25, importance="urgent", task_type="zzz",
+         preferred_time="night", energy="aaa", plan_day_of_week=3, is_weekend=0),
+]
+
+
+def test_columns_match_row_wise_encoding():
+    columns = {field: [row[field] for row in ROWS] for field in FEATURE_ORDER}
+    features = encode_feature_columns(**columns)
+    expected = np.array([encode_features(**row) for row in ROWS], dtype=float)
+    assert features.dtype == np.float64 and features.flags.c_contiguous
+    np.testing.assert_array_equal(features, expected)
+
+    as_arrays = encode_feature_columns(**{field: np.asarray(values) for field, values in columns.items()})
+    np.testing.assert_array_equal(as_arrays, expected)
+
+
+def test_scalars_broadcast_and_empty_input():
+    features = encode_feature_columns(
+        user_type="worker",
+        duration_minutes=[30, 60],
+        hours_until_deadline=np.array([1.0, 2.0]),
+        importance=["low", "high"],
+        task_type="meeting",
+        preferred_time="anytime",
+        energy=["medium", "high"],
+        plan_day_of_week=5,
+        is_weekend=1,
+    )
+    assert features.shape == (2, len(FEATURE_ORDER))
+    assert features[:, 0].tolist() == [1.0, 1.0] and features[:, 7].tolist() == [5.0, 5.0]
+
+    empty = encode_feature_columns(**{field: [] for field in FEATURE_ORDER})
+    assert empty.shape == (0, len(FEATURE_ORDER))
+
+    with pytest.raises(ValueError):
+        encode_feature_columns(**{field: [[0, 1]] for field in FEATURE_ORDER})
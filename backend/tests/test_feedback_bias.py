@@ -0,0 +1,181 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+from backend.feedback_bias import accumulate_feedback, load_feedback_bias
+from backend.ml import scheduler
+
+
+class _DummyFeedback:
+    def __init__(self, task, outcome, created_at):
+        self.task = task
+        self.outcome = outcome
+        self.created_at = created_at
+
+
+@pytest.fixture()
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return TestingSessionLocal
+
+
+def _create_user(db) -> models.User:
+    user = models.User(
+        email="user@example.com",
+        name="Test User",
+        profile=models.UserProfile.worker,
+        role=models.UserRole.user,
+        timezone="UTC",
+        hashed_password="not-used",
+        is_active=True,
+        token_version=0,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_incremental_bias_matches_full_recomputation(session_factory):
+    rng = random.Random(3)
+    now = datetime(2025, 3, 10, 12, 0)
+    with session_factory() as db:
+        user = _create_user(db)
+        tasks = [
+            models.Task(
+                user_id=user.id,
+                title=f"Task {i}",
+                duration_minutes=30,
+                deadline=now + timedelta(days=2),
+                task_type=rng.choice(["work", "study"]),
+                importance=rng.choice(["low", "medium", "high"]),
+                preferred_time=rng.choice(["morning", "evening"]),
+                energy=rng.choice(["low", "high"]),
+            )
+            for i in range(6)
+        ]
+        db.add_all(tasks)
+        db.flush()
+
+        # mostly in order, with a few late writes older than the stored rows
+        history = sorted(now - timedelta(hours=rng.uniform(1, 24 * 40)) for _ in range(60))
+        history[10], history[40] = history[40], history[10]
+        feedback = []
+        for created_at in history:
+            task = rng.choice(tasks)
+            outcome = rng.choice([-1, 1])
+            accumulate_feedback(db, user.id, task, outcome, created_at)
+            db.flush()
+            feedback.append(_DummyFeedback(task, outcome, created_at))
+        db.commit()
+
+        assert db.query(models.FeedbackBias).filter(models.FeedbackBias.user_id == user.id).count() <= 1 + 6 * 3
+        bias, strength = load_feedback_bias(db, user.id, now=now)
+        expected_bias, expected_strength = scheduler._bias_from_feedback(feedback, now=now)
+
+    assert strength == pytest.approx(expected_strength)
+    assert bias.keys() == expected_bias.keys()
+    for key, value in expected_bias.items():
+        assert bias[key] == pytest.approx(value)
+
+
+def test_feedback_endpoints_update_bias_rows(session_factory):
+    if TestClient is None:
+        pytest.skip("fastapi TestClient requires requests")
+    with session_factory() as db:
+        user_id = _create_user(db).id
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    try:
+        client = TestClient(app)
+        res = client.post(
+            "/api/v1/tasks",
+            json={
+                "title": "Report",
+                "description": None,
+                "duration_minutes": 60,
+                "deadline": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+                "task_type": "work",
+                "importance": "high",
+                "preferred_time": "morning",
+                "energy": "high",
+            },
+        )
+        assert res.status_code == 200, res.text
+        task_id = res.json()["id"]
+
+        assert client.post("/api/v1/feedback/", json={"task_id": task_id, "outcome": 1}).status_code == 200
+        assert client.post("/api/v1/feedback/", json={"task_id": task_id, "outcome": 1}).status_code == 200
+        assert client.post("/api/v1/feedback/", json={"outcome": -1}).status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+
+    with session_factory() as db:
+        rows = {row.key: row for row in db.query(models.FeedbackBias).filter(models.FeedbackBias.user_id == user_id)}
+        bias, strength = load_feedback_bias(db, user_id)
+
+    assert set(rows) == {"total", "type_importance:work:high", "preferred_time:morning", "energy:high"}
+    assert rows["total"].weight == pytest.approx(2.0, rel=1e-3)
+    assert strength == pytest.approx(0.25, rel=1e-3)
+    assert bias["energy:high"] == pytest.approx(0.5, rel=1e-3)
+
+
+def test_concurrent_first_feedback_for_a_key_does_not_conflict(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bias.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    now = datetime(2025, 3, 10, 12, 0)
+    with factory() as db:
+        user_id = _create_user(db).id
+    task = models.Task(task_type="work", importance="high", preferred_time="morning", energy="high")
+
+    # the other request commits the same new keys right after this one finds them missing
+    raced = []
+
+    def race(conn, cursor, statement, *args):
+        if not raced and statement.startswith("SELECT") and "feedback_bias" in statement:
+            raced.append(1)
+            with factory() as other:
+                accumulate_feedback(other, user_id, task, 1, now)
+                other.commit()
+
+    event.listen(engine, "after_cursor_execute", race)
+    with factory() as db:
+        accumulate_feedback(db, user_id, task, -1, now)
+        db.commit()
+
+    with factory() as db:
+        rows = {row.key: row for row in db.query(models.FeedbackBias).filter(models.FeedbackBias.user_id == user_id)}
+    assert set(rows) == {"total", "type_importance:work:high", "preferred_time:morning", "energy:high"}
+    assert rows["total"].weight == pytest.approx(2.0)
+    assert rows["energy:high"].weighted_sum == pytest.approx(0.0)
@@ -0,0 +1,83 @@
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
+
+from backend.ml.flat_trees import FLAT_MAX_DEPTH, FLAT_MAX_ROWS, FlatTreeEnsemble, flatten_ensemble
+from backend.ml.priority_model import get_feature_importances, load_model, predict
+
+
+def _training_data(rng, rows=400):
+    X = np.column_stack(
+        [
+            rng.integers(0, 3, rows),
+            rng.integers(15, 240, rows),
+            rng.uniform(0.0, 400.0, rows),
+            rng.integers(0, 6, rows),
+        ]
+    ).astype(float)
+    y = X[:, 0] * 0.5 - np.log1p(X[:, 2]) + rng.normal(0.0, 0.1, rows)
+    return X, y
+
+
+def test_flat_ensemble_matches_sklearn_including_split_edges():
+    rng = np.random.default_rng(3)
+    X, y = _training_data(rng)
+    # depth 3 is scored from the outcome table, depth 4 by walking the trees
+    for init, max_depth in ((None, 3), (None, 4), ("zero", 3), ("zero", 4)):
+        model = GradientBoostingRegressor(random_state=0, n_estimators=40, max_depth=max_depth, init=init).fit(X, y)
+        flat = flatten_ensemble(model)
+        assert isinstance(flat, FlatTreeEnsemble)
+
+        X_test, _ = _training_data(rng, rows=300)
+        # rows sitting exactly on split thresholds take the left branch in both
+        tree = model.estimators_[0, 0].tree_
+        edges = np.repeat(X_test[:1], tree.node_count, axis=0)
+        split = tree.children_left >= 0
+        edges[np.flatnonzero(split), tree.feature[split]] = tree.threshold[split]
+        for batch in (X_test, X_test[:100], edges, X_test[:1]):
+            np.testing.assert_allclose(flat.predict(batch), model.predict(batch), rtol=0, atol=1e-9)
+
+
+def test_large_batches_are_walked_in_chunks_without_sklearn(monkeypatch):
+    rng = np.random.default_rng(6)
+    X, y = _training_data(rng)
+    X_test, _ = _training_data(rng, rows=3 * FLAT_MAX_ROWS + 17)
+
+    def fail(X):
+        raise AssertionError("large batches should not fall back to sklearn")
+
+    for max_depth in (3, 5):
+        model = GradientBoostingRegressor(random_state=0, n_estimators=30, max_depth=max_depth).fit(X, y)
+        flat = flatten_ensemble(model)
+        expected = model.predict(X_test)
+        monkeypatch.setattr(flat.estimator, "predict", fail)
+        np.testing.assert_allclose(flat.predict(X_test), expected, rtol=0, atol=1e-9)
+
+
+def test_load_model_returns_flat_ensemble_usable_like_estimator(tmp_path):
+    rng = np.random.default_rng(4)
+    X, y = _training_data(rng)
+    model = GradientBoostingRegressor(random_state=0, n_estimators=20, max_depth=3).fit(X, y)
+    path = tmp_path / "model.pkl"
+    joblib.dump(model, path)
+
+    loaded = load_model(path)
+    assert isinstance(loaded, FlatTreeEnsemble)
+    assert predict(list(X[0]), model=loaded) == pytest.approx(float(model.predict(X[:1])[0]), abs=1e-9)
+    assert get_feature_importances(loaded) == list(model.feature_importances_)
+
+
+def test_unsupported_estimators_are_left_alone(tmp_path):
+    rng = np.random.default_rng(5)
+    X, y = _training_data(rng, rows=100)
+    forest = RandomForestRegressor(n_estimators=3, random_state=0).fit(X, y)
+    assert flatten_ensemble(forest) is None
+    assert flatten_ensemble(GradientBoostingRegressor()) is None
+    deep = GradientBoostingRegressor(n_estimators=3, max_depth=FLAT_MAX_DEPTH + 2, random_state=0).fit(X, y)
+    assert flatten_ensemble(deep) is None
+
+    path = tmp_path / "forest.pkl"
+    joblib.dump(forest, path)
+    assert isinstance(load_model(path), RandomForestRegressor)
+
@@ -0,0 +1,158 @@
+import random
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from backend.ml import scheduler
+from backend.ml.horizon import day_choice_penalties, day_choice_penalty, schedule_horizon
+
+
+class _CountingModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, payload):
+        self.calls += 1
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+def _task(task_id: int, deadline: datetime, duration_minutes: int, **overrides) -> dict:
+    task = dict(
+        id=task_id,
+        title=f"Task {task_id}",
+        duration_minutes=duration_minutes,
+        deadline=deadline,
+        task_type="work",
+        importance="medium",
+        preferred_time="anytime",
+        energy="medium",
+    )
+    task.update(overrides)
+    return task
+
+
+def test_day_boundaries_stop_free_runs():
+    rng = random.Random(5)
+    index = scheduler.OccupancyIndex(30, day_slots=10)
+    assert index.free_run[:10] == list(range(10, 0, -1))
+    assert index.free_run[10] == 10
+    for owner in range(25):
+        required = rng.randint(1, 3)
+        starts = index.fitting_starts(required)
+        if not starts:
+            break
+        start = rng.choice(starts)
+        assert start // 10 == (start + required - 1) // 10
+        index.occupy(start, start + required, owner)
+        for day in range(3):
+            owners = index.owners[day * 10 : day * 10 + 10]
+            runs = [next((n for n in range(10 - i) if owners[i + n] is not None), 10 - i) for i in range(10)]
+            assert index.free_run[day * 10 : day * 10 + 10] == runs
+
+    edge = scheduler.OccupancyIndex(20, day_slots=10)
+    edge.occupy(8, 9, 1)
+    edge.occupy(10, 11, 2)
+    # the slot before midnight touches the day end, so it is not a sliver gap
+    assert edge.right_gap(9) == 0
+    assert edge.neighbors(8, 9) == (None, None)
+
+
+def test_horizon_places_task_on_day_where_it_fits():
+    plan_start = date(2025, 3, 3)
+    horizon_dates = [plan_start, plan_start + timedelta(days=1)]
+    first_day = datetime.combine(plan_start, datetime.min.time())
+    second_day = first_day + timedelta(days=1)
+    # day one is chopped into one-hour free runs, day two is busy but has a long free block
+    occupied = {
+        horizon_dates[0]: [
+            (first_day + timedelta(hours=hour, minutes=50), first_day + timedelta(hours=hour + 1, minutes=10))
+            for hour in range(8, 22, 2)
+        ],
+        horizon_dates[1]: [(second_day + timedelta(hours=10), second_day + timedelta(hours=18))],
+    }
+    existing_minutes = {horizon_dates[0]: 140, horizon_dates[1]: 480}
+    deadline = second_day + timedelta(hours=21)
+
+    scheduled_by_day, unscheduled, _ = schedule_horizon(
+        [_task(1, deadline, 90)],
+        "worker",
+        horizon_dates,
+        occupied_intervals_by_day=occupied,
+        existing_minutes_by_day=existing_minutes,
+        model=_CountingModel(),
+    )
+
+    assert unscheduled == []
+    assert scheduled_by_day[horizon_dates[0]] == []
+    [entry] = scheduled_by_day[horizon_dates[1]]
+    start = datetime.fromisoformat(entry["start"])
+    assert start.date() == horizon_dates[1]
+    assert start.hour >= 18 or start + timedelta(minutes=90) <= second_day + timedelta(hours=10)
+
+
+def test_horizon_scores_once_and_respects_deadlines():
+    plan_start = date(2025, 3, 3)
+    horizon_dates = [plan_start + timedelta(days=offset) for offset in range(5)]
+    origin = datetime.combine(plan_start, datetime.min.time())
+    tasks = [
+        _task(i + 1, origin + timedelta(hours=20 + 9 * i), 30 + (i % 4) * 30, importance=("low", "medium", "high")[i % 3])
+        for i in range(30)
+    ]
+    model = _CountingModel()
+
+    scheduled_by_day, unscheduled, _ = schedule_horizon(tasks, "worker", horizon_dates, model=model)
+
+    assert model.calls == 1
+    deadlines = {t["id"]: t["deadline"] for t in tasks}
+    placed = [entry for entries in scheduled_by_day.values() for entry in entries]
+    assert len(placed) + len(unscheduled) == len(tasks)
+    for plan_date, entries in scheduled_by_day.items():
+        spans = sorted((entry["start"], entry["end"]) for entry in entries)
+        for (_, end_a), (start_b, _) in zip(spans, spans[1:]):
+            assert end_a <= start_b
+        for entry in entries:
+            start = datetime.fromisoformat(entry["start"])
+            end = datetime.fromisoformat(entry["end"])
+            assert start.date() == plan_date
+            assert 8 <= start.hour and end <= datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=22)
+            assert end <= deadlines[entry["task_id"]] + timedelta(minutes=30)
+    assert len({datetime.fromisoformat(e["start"]).date() for e in placed}) >= 3
+
+
+def test_day_penalties_match_scalar_penalty():
+    plan_start = date(2025, 3, 3)
+    horizon_dates = [plan_start + timedelta(days=offset) for offset in range(0, 40, 3)]
+    day_numbers = np.array([(day - plan_start).days for day in horizon_dates])
+    loads = np.linspace(0.0, 700.0, len(horizon_dates))
+    for deadline_day in (0, 1, 3, 4, 12, 39):
+        deadline_date = plan_start + timedelta(days=deadline_day)
+        expected = [
+            day_choice_penalty(day, deadline_date, plan_start, load, 840)
+            for day, load in zip(horizon_dates, loads.tolist())
+        ]
+        assert day_choice_penalties(day_numbers, deadline_day, loads, 840).tolist() == expected
+
+
+def test_task_without_a_contiguous_run_is_unscheduled():
+    plan_start = date(2025, 3, 3)
+    horizon_dates = [plan_start, plan_start + timedelta(days=1)]
+    origin = datetime.combine(plan_start, datetime.min.time())
+    # both days are chopped into one-hour free runs
+    occupied = {
+        day: [
+            (datetime.combine(day, datetime.min.time()) + timedelta(hours=hour),
+             datetime.combine(day, datetime.min.time()) + timedelta(hours=hour + 1))
+            for hour in range(9, 22, 2)
+        ]
+        for day in horizon_dates
+    }
+    tasks = [_task(1, origin + timedelta(days=1, hours=21), 90), _task(2, origin + timedelta(days=1, hours=21), 60)]
+
+    scheduled_by_day, unscheduled, _ = schedule_horizon(
+        tasks, "worker", horizon_dates, occupied_intervals_by_day=occupied, model=_CountingModel()
+    )
+
+    assert [t["id"] for t in unscheduled] == [1]
+    assert [entry["task_id"] for entries in scheduled_by_day.values() for entry in entries] == [2]
@@ -0,0 +1,175 @@
+import random
+from datetime import date, datetime, timedelta
+
+from backend.ml import scheduler
+from backend.ml import local_search
+from backend.ml.local_search import optimize_day
+
+
+class _LinearModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def predict(self, payload):
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+def _random_day(seed: int):
+    rng = random.Random(seed)
+    plan_date = date(2025, 3, 3) + timedelta(days=rng.randint(0, 6))
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i + 1,
+            title=f"Task {i}",
+            duration_minutes=rng.choice([30, 45, 60, 90, 120]),
+            deadline=day_start + timedelta(hours=rng.uniform(10, 60)),
+            task_type=rng.choice(["work", "study", "admin", "personal"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(rng.randint(3, 12))
+    ]
+    busy_start = day_start + timedelta(hours=rng.randint(9, 18))
+    return plan_date, tasks, [(busy_start, busy_start + timedelta(minutes=45))]
+
+
+def test_local_search_never_worse_than_greedy():
+    improved = 0
+    for seed in range(40):
+        plan_date, tasks, busy = _random_day(seed)
+        greedy, searched = {}, {}
+        scheduler.schedule_day(
+            tasks, "worker", plan_date, occupied_intervals=busy, model=_LinearModel(),
+            search_budget_ms=0, search_stats=greedy,
+        )
+        scheduled, _, _ = scheduler.schedule_day(
+            tasks, "worker", plan_date, occupied_intervals=busy, model=_LinearModel(),
+            search_budget_ms=50, search_stats=searched,
+        )
+
+        assert searched["initial_cost"] == greedy["initial_cost"]
+        assert searched["final_cost"] <= greedy["initial_cost"] + 1e-9
+        assert searched["cost_improvement"] >= 0.0
+        spans = sorted((s["start"], s["end"]) for s in scheduled)
+        for (_, end_a), (start_b, _) in zip(spans, spans[1:]):
+            assert end_a <= start_b
+        improved += searched["cost_improvement"] > 0
+    assert improved > 0
+
+
+def test_local_search_closes_single_slot_gaps():
+    cost_model = scheduler.DayCostModel(scheduler.build_slot_offsets(8, 12))
+    occupied = scheduler.OccupancyIndex(cost_model.n_slots)
+    base = dict(
+        required_slots=2,
+        latest_end_minute=12 * 60.0,
+        preferred_window=(0, 8),
+        energy="medium",
+        duration_minutes=60,
+        hours_until_deadline=100.0,
+    )
+    assignments = {1: dict(base, start_idx=0, end_idx=2), 2: dict(base, start_idx=3, end_idx=5)}
+    occupied.occupy(0, 2, 1)
+    occupied.occupy(3, 5, 2)
+
+    report = optimize_day(assignments, occupied, cost_model, budget_ms=50)
+
+    assert report["initial_cost"] == 4.0
+    assert report["final_cost"] == 0.0
+    assert report["iterations"] >= report["improvements"] >= 1
+    assert report["converged"]
+    first, second = sorted((info["start_idx"], info["end_idx"]) for info in assignments.values())
+    assert first[1] == second[0]
+
+
+def test_local_search_respects_zero_budget():
+    cost_model = scheduler.DayCostModel(scheduler.build_slot_offsets(8, 12))
+    occupied = scheduler.OccupancyIndex(cost_model.n_slots)
+    occupied.occupy(1, 3, 1)
+    assignments = {
+        1: dict(
+            start_idx=1, end_idx=3, required_slots=2, latest_end_minute=720.0, preferred_window=(0, 8),
+            energy="medium", duration_minutes=60, hours_until_deadline=100.0,
+        )
+    }
+
+    report = optimize_day(assignments, occupied, cost_model, budget_ms=0)
+
+    assert report["iterations"] == 0
+    assert not report["converged"]
+    assert assignments[1]["start_idx"] == 1
+
+
+def test_local_search_improves_every_day_of_a_long_horizon(monkeypatch):
+    day_slots = 8
+    n_days = 90
+    slot_offsets = [day * 24 * 60 + offset for day in range(n_days) for offset in scheduler.build_slot_offsets(8, 12)]
+    cost_model = scheduler.DayCostModel(slot_offsets, day_slots=day_slots)
+    occupied = scheduler.OccupancyIndex(len(slot_offsets), day_slots)
+    assignments = {}
+    for day in range(n_days):
+        # two blocks a slot apart, as in the single-day gap test
+        for task_id, start in ((2 * day + 1, day * day_slots), (2 * day + 2, day * day_slots + 3)):
+            assignments[task_id] = dict(
+                start_idx=start, end_idx=start + 2, required_slots=2, latest_end_minute=float(slot_offsets[-1] + 30),
+                preferred_window=(0, day_slots), energy="medium", duration_minutes=60, hours_until_deadline=100.0,
+            )
+            occupied.occupy(start, start + 2, task_id)
+
+    pairs = []
+    swap_candidates = local_search._DaySearch.swap_candidates
+
+    def recording_swap_candidates(search, first, second):
+        pairs.append((search.assignments[first]["start_idx"] // day_slots, search.assignments[second]["start_idx"] // day_slots))
+        return swap_candidates(search, first, second)
+
+    monkeypatch.setattr(local_search._DaySearch, "swap_candidates", recording_swap_candidates)
+    report = optimize_day(assignments, occupied, cost_model, budget_ms=2000)
+
+    # swaps are only ever generated within a day
+    assert pairs and all(first == second for first, second in pairs)
+
+    assert report["converged"]
+    assert report["improvements"] >= n_days
+    for day in range(n_days):
+        first, second = sorted(
+            (info["start_idx"], info["end_idx"]) for info in assignments.values() if info["start_idx"] // day_slots == day
+        )
+        assert first[1] == second[0]
+
+
+def test_iteration_cap_not_the_clock_decides_the_plan():
+    rng = random.Random(7)
+    plan_date = date(2025, 3, 4)
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i + 1,
+            title=f"Task {i}",
+            duration_minutes=rng.choice([15, 30, 45, 60]),
+            deadline=day_start + timedelta(hours=rng.uniform(10, 60)),
+            task_type="work",
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy="medium",
+        )
+        for i in range(20)
+    ]
+    plans = []
+    for budget_ms in (1000, 60000):
+        stats = {}
+        scheduled, _, _ = scheduler.schedule_day(
+            tasks, "worker", plan_date, model=_LinearModel(),
+            search_budget_ms=budget_ms, search_max_iterations=40, search_stats=stats,
+        )
+        assert stats["iterations"] == 40
+        assert not stats["converged"] and not stats["timed_out"]
+        plans.append([(s["task_id"], s["start"]) for s in scheduled])
+    assert plans[0] == plans[1]
+
+    stats = {}
+    scheduler.schedule_day(
+        tasks, "worker", plan_date, model=_LinearModel(), search_budget_ms=1e-6, search_stats=stats,
+    )
+    assert stats["timed_out"]
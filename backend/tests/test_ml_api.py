@@ -49,10 +49,10 @@ def test_predict_priority_uses_cached_model(monkeypatch):
 def test_prioritize_tasks_sorts_and_annotations(monkeypatch):
     priorities = {"Quick Sync": 80.0, "Deep Research": 25.0}
 
-    def fake_predict(task, user_profile, plan_date):
-        return priorities[task["title"]]
+    def fake_predict(tasks, user_profile, plan_date):
+        return [priorities[task["title"]] for task in tasks]
 
-    monkeypatch.setattr(ml, "predict_priority", fake_predict)
+    monkeypatch.setattr(ml, "predict_priorities", fake_predict)
 
     tasks = [
         {
@@ -74,3 +74,51 @@ def test_prioritize_tasks_sorts_and_annotations(monkeypatch):
     assert [t["title"] for t in prioritized] == ["Quick Sync", "Deep Research"]
     assert all("priority" in t for t in prioritized)
     assert "priority" not in tasks[0] and "priority" not in tasks[1]
+
+
+def test_predict_priorities_scores_all_tasks_in_one_call(monkeypatch):
+    class _RowModel:
+        calls = 0
+
+        def predict(self, payload):
+            self.calls += 1
+            # importance column, so each task keeps its own score
+            return [row[3] for row in payload]
+
+    model = _RowModel()
+    monkeypatch.setattr(ml, "get_priority_model", lambda: model)
+    tasks = [
+        {"id": i, "title": f"Task {i}", "duration_minutes": 30, "deadline": None, "importance": importance}
+        for i, importance in enumerate(["low", "high", "medium"] * 50)
+    ]
+
+    scores = ml.predict_priorities(tasks, user_profile="worker", plan_date=date(2025, 5, 5))
+
+    assert model.calls == 1
+    assert scores[:3] == [0.0, 2.0, 1.0]
+    assert len(scores) == len(tasks)
+    assert ml.predict_priorities([], user_profile="worker", plan_date=date(2025, 5, 5)) == []
+
+
+def test_priority_columns_count_deadlines_from_the_plan_start(monkeypatch):
+    class _DeadlineModel:
+        def predict(self, payload):
+            return [row[2] for row in payload]
+
+    monkeypatch.setattr(ml, "get_priority_model", lambda: _DeadlineModel())
+    plan_date = date(2025, 5, 5)
+    deadlines = [datetime(2025, 5, 5, 20, 30), datetime(2025, 5, 4, 9, 0), None]
+    scores = ml.predict_priority_columns(
+        duration_minutes=[30, 60, 45],
+        deadline=deadlines,
+        importance=["high", "low", "medium"],
+        task_type=["work"] * 3,
+        preferred_time=["anytime"] * 3,
+        energy=["medium"] * 3,
+        user_profile="worker",
+        plan_date=plan_date,
+    )
+    # hours after 08:00 on the plan date; overdue and missing deadlines count as due now
+    assert scores.tolist() == [12.5, 0.0, 0.0]
+    tasks = [{"duration_minutes": 30, "deadline": deadline} for deadline in deadlines]
+    assert ml.predict_priorities(tasks, user_profile="worker", plan_date=plan_date) == scores.tolist()
@@ -0,0 +1,172 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from backend.ml import service
+from backend.ml.plan_cache import PlanCache, plan_fingerprint
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+_PLAN_SCRIPT = """
+import json
+from datetime import date, datetime, timedelta
+
+from backend.ml import scheduler
+from backend.ml.plan_cache import plan_fingerprint
+
+
+class LinearModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def predict(self, payload):
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+plan_date = date(2025, 3, 4)
+day_start = datetime.combine(plan_date, datetime.min.time())
+tasks = [
+    dict(
+        id=i + 1,
+        title=f"Task {i}",
+        duration_minutes=30 + (i % 3) * 30,
+        deadline=day_start + timedelta(hours=12 + i * 5),
+        task_type="work",
+        importance=("low", "medium", "high")[i % 3],
+        preferred_time=("morning", "afternoon", "evening", "anytime")[i % 4],
+        energy="medium",
+    )
+    for i in range(12)
+]
+# a generous search budget so the wall-clock limit cannot cut the search short
+plans = [
+    [
+        (s["task_id"], s["start"])
+        for s in scheduler.schedule_day(tasks, profile, plan_date, model=LinearModel(), search_budget_ms=5000)[0]
+    ]
+    for profile in ("student", "worker", "entrepreneur")
+]
+key = plan_fingerprint(kind="day", tasks=tasks, feedback_bias=({}, 0.0), model=None, plan_date=plan_date, start_hour=8)
+print(json.dumps({"plans": plans, "seed": scheduler._stable_seed(plan_date, "worker"), "key": key}))
+"""
+
+
+class _CountingModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, payload):
+        self.calls += 1
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+def _tasks(plan_date: date) -> list[dict]:
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    return [
+        dict(
+            id=i + 1,
+            title=f"Task {i}",
+            duration_minutes=45,
+            deadline=day_start + timedelta(hours=20 + i),
+            task_type="study",
+            importance="medium",
+            preferred_time="anytime",
+            energy="medium",
+        )
+        for i in range(5)
+    ]
+
+
+def _run_plan_script(hash_seed: str) -> dict:
+    env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+    result = subprocess.run(
+        [sys.executable, "-c", _PLAN_SCRIPT],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_plans_and_fingerprints_do_not_depend_on_hash_seed():
+    first = _run_plan_script("1")
+    second = _run_plan_script("2")
+
+    assert first == second
+
+
+def test_generate_schedule_serves_repeated_inputs_from_cache(monkeypatch):
+    model = _CountingModel()
+    monkeypatch.setattr(service, "get_priority_model", lambda: model)
+    monkeypatch.setattr(service, "_PLAN_CACHE", PlanCache())
+    plan_date = date(2025, 3, 4)
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    busy = [(day_start + timedelta(hours=9), day_start + timedelta(hours=10))]
+
+    first = service.generate_schedule(_tasks(plan_date), user_profile="worker", plan_date=plan_date, occupied=busy)
+    first[0][0]["title"] = "mutated by caller"
+    second = service.generate_schedule(_tasks(plan_date), user_profile="worker", plan_date=plan_date, occupied=busy)
+
+    assert model.calls == 1
+    assert second[0][0]["title"] != "mutated by caller"
+    assert [s["start"] for s in second[0]] == [s["start"] for s in first[0]]
+
+    moved = [(day_start + timedelta(hours=11), day_start + timedelta(hours=12))]
+    service.generate_schedule(_tasks(plan_date), user_profile="worker", plan_date=plan_date, occupied=moved)
+    assert model.calls == 2
+    assert service._PLAN_CACHE.stats()["hits"] == 1
+
+
+def test_fingerprint_covers_scheduling_inputs():
+    plan_date = date(2025, 3, 4)
+    base = dict(kind="day", tasks=_tasks(plan_date), feedback_bias=({}, 0.0), model=None, plan_date=plan_date, start_hour=8)
+    key = plan_fingerprint(**base)
+
+    assert plan_fingerprint(**base) == key
+    assert plan_fingerprint(**dict(base, start_hour=9)) != key
+    assert plan_fingerprint(**dict(base, tasks=_tasks(plan_date)[:4])) != key
+    assert plan_fingerprint(**dict(base, model=_CountingModel())) != key
+
+
+def test_plan_cache_evicts_least_recently_used():
+    cache = PlanCache(max_entries=2, max_tasks=10)
+    cache.put("a", {"plan": "a"}, size=3)
+    cache.put("b", {"plan": "b"}, size=3)
+    assert cache.get("a") == {"plan": "a"}
+    cache.put("c", {"plan": "c"}, size=3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"plan": "a"}
+
+    cache.put("d", {"plan": "d"}, size=8)
+    assert len(cache) == 1
+    assert cache.stats()["tasks"] == 8
+    cache.put("huge", {"plan": "huge"}, size=11)
+    assert cache.get("huge") is None
+
+
+def test_plans_cut_short_by_the_clock_are_not_cached(monkeypatch):
+    model = _CountingModel()
+    monkeypatch.setattr(service, "get_priority_model", lambda: model)
+    monkeypatch.setattr(service, "_PLAN_CACHE", PlanCache())
+    plan_date = date(2025, 3, 4)
+
+    for _ in range(2):
+        service.generate_schedule(_tasks(plan_date), user_profile="worker", plan_date=plan_date, search_budget_ms=1e-6)
+    assert model.calls == 2
+    assert len(service._PLAN_CACHE) == 0
+
+    # with the iteration cap deciding, the budget does not change the plan
+    plans = [
+        service.generate_schedule(_tasks(plan_date), user_profile="worker", plan_date=plan_date, search_budget_ms=budget_ms)[0]
+        for budget_ms in (1000, 60000, 60000)
+    ]
+    assert model.calls == 4
+    assert plans[0] == plans[1] == plans[2]
+    assert len(service._PLAN_CACHE) == 2
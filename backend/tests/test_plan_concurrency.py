@@ -0,0 +1,176 @@
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db, get_plan_flight
+from backend.routers import planning
+from backend.single_flight import SingleFlight
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env(tmp_path):
+    # a file database, so concurrent requests get their own connections
+    engine = create_engine(f"sqlite:///{tmp_path / 'plans.db'}", connect_args={"check_same_thread": False})
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    flight = SingleFlight()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.add(models.UserSettings(user=user, working_hours_start="08:00", working_hours_end="22:00"))
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    app.dependency_overrides[get_plan_flight] = lambda: flight
+
+    yield TestClient(app), TestingSessionLocal, user_id, flight
+
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+def _create_task(client: TestClient, title: str, deadline: datetime) -> dict:
+    res = client.post(
+        "/api/v1/tasks",
+        json={
+            "title": title,
+            "description": None,
+            "duration_minutes": 60,
+            "deadline": deadline.isoformat(),
+            "task_type": "work",
+            "importance": "medium",
+            "preferred_time": "anytime",
+            "energy": "medium",
+        },
+    )
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+def test_concurrent_plan_requests_share_one_computation(client_env, monkeypatch):
+    client, session_factory, user_id, flight = client_env
+    plan_date = date.today()
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(days=1, hours=20)
+    for i in range(6):
+        _create_task(client, f"Task {i}", deadline)
+
+    n_requests = 50
+    key = (user_id, plan_date, "standard")
+    computations = []
+    original = planning.generate_horizon_schedule
+
+    def slow_schedule(**kwargs):
+        computations.append(1)
+        # hold the computation until every other request is waiting on it
+        give_up = time.monotonic() + 10
+        while flight.waiters(key) < n_requests - 1 and time.monotonic() < give_up:
+            time.sleep(0.01)
+        return original(**kwargs)
+
+    monkeypatch.setattr(planning, "generate_horizon_schedule", slow_schedule)
+
+    barrier = threading.Barrier(n_requests)
+    responses = [None] * n_requests
+
+    def post(index: int) -> None:
+        barrier.wait()
+        responses[index] = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+
+    threads = [threading.Thread(target=post, args=(i,)) for i in range(n_requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert all(res is not None and res.status_code == 200 for res in responses), [
+        res.text for res in responses if res is not None and res.status_code != 200
+    ]
+    assert len(computations) == 1
+    item_ids = {tuple(item["plan_item_id"] for item in res.json()["scheduled"]) for res in responses}
+    assert len(item_ids) == 1
+
+    with session_factory() as db:
+        items_per_task = (
+            db.query(models.PlanItem.task_id, func.count(models.PlanItem.id))
+            .group_by(models.PlanItem.task_id)
+            .all()
+        )
+        plans_per_day = (
+            db.query(models.Plan.plan_date, func.count(models.Plan.id)).group_by(models.Plan.plan_date).all()
+        )
+    assert len(items_per_task) == 6
+    assert all(count == 1 for _, count in items_per_task)
+    assert all(count == 1 for _, count in plans_per_day)
+
+
+def test_plan_written_from_a_stale_read_is_a_conflict(client_env, monkeypatch):
+    client, session_factory, user_id, _ = client_env
+    plan_date = date.today()
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=21)
+    _create_task(client, "First", deadline)
+    assert client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()}).status_code == 200
+    late = _create_task(client, "Late", deadline)
+
+    original = planning._schedule_days
+
+    def schedule_with_interleaved_edit(*args, **kwargs):
+        # another writer updates today's plan after this request has read it
+        with session_factory() as other:
+            plan = (
+                other.query(models.Plan)
+                .filter(models.Plan.plan_date == datetime.combine(plan_date, datetime.min.time()))
+                .one()
+            )
+            plan.summary = "edited elsewhere"
+            other.commit()
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(planning, "_schedule_days", schedule_with_interleaved_edit)
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 409, res.text
+
+    with session_factory() as db:
+        assert db.get(models.Task, late["id"]).status == models.TaskStatus.pending
+        assert db.query(models.PlanItem).filter(models.PlanItem.task_id == late["id"]).count() == 0
+
+    monkeypatch.setattr(planning, "_schedule_days", original)
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    assert {item["title"] for item in res.json()["scheduled"]} == {"First", "Late"}
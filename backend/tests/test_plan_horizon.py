@@ -0,0 +1,182 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+from backend.routers import planning
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.add(
+            models.UserSettings(
+                user=user,
+                working_hours_start="08:00",
+                working_hours_end="22:00",
+                default_planning_horizon_hours=21 * 24,
+            )
+        )
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield TestClient(app), TestingSessionLocal, user_id, commits
+
+    app.dependency_overrides.clear()
+
+
+def _create_task(client: TestClient, title: str, deadline: datetime, duration_minutes: int = 120) -> dict:
+    res = client.post(
+        "/api/v1/tasks",
+        json={
+            "title": title,
+            "description": None,
+            "duration_minutes": duration_minutes,
+            "deadline": deadline.isoformat(),
+            "task_type": "work",
+            "importance": "medium",
+            "preferred_time": "anytime",
+            "energy": "medium",
+        },
+    )
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+def _placements(client: TestClient, first: date, last: date) -> dict[int, date]:
+    res = client.get(
+        "/api/v1/planning/calendar",
+        params={"start_date": first.isoformat(), "end_date": last.isoformat()},
+    )
+    assert res.status_code == 200, res.text
+    return {
+        item["task_id"]: datetime.fromisoformat(item["start"]).date()
+        for day in res.json()["days"]
+        for item in day["scheduled"]
+    }
+
+
+def test_horizon_length_follows_setting_and_is_capped():
+    settings = models.UserSettings(default_planning_horizon_hours=72, work_days_mask="1111111")
+    plan_date = date(2025, 3, 3)
+    assert planning._horizon_dates(plan_date, settings)[-1] == plan_date + timedelta(days=2)
+
+    settings.default_planning_horizon_hours = 10_000
+    horizon_dates = planning._horizon_dates(plan_date, settings)
+    assert len(horizon_dates) == planning.MAX_HORIZON_DAYS
+    windows = planning._horizon_windows(plan_date, horizon_dates)
+    assert len(windows) == 13
+    assert [day for _, _, days in windows for day in days] == horizon_dates
+
+
+def test_long_horizon_is_planned_and_committed_per_window(client_env):
+    client, _, _, commits = client_env
+    plan_date = date.today()
+    origin = datetime.combine(plan_date, datetime.min.time())
+    deadlines = {}
+    for due_day in (2, 9, 16, 20):
+        for i in range(3):
+            task = _create_task(client, f"Due {due_day}.{i}", origin + timedelta(days=due_day, hours=20))
+            deadlines[task["id"]] = plan_date + timedelta(days=due_day)
+
+    commits.clear()
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    assert res.json()["unscheduled"] == []
+    assert len(commits) == 3
+
+    placed = _placements(client, plan_date, plan_date + timedelta(days=20))
+    assert set(placed) == set(deadlines)
+    for task_id, day in placed.items():
+        assert day <= deadlines[task_id]
+        # near-deadline days are cheapest, so nothing is pulled into an earlier window
+        assert (day - plan_date).days // 7 == (deadlines[task_id] - plan_date).days // 7
+
+
+def test_task_spills_into_earlier_window_when_its_own_is_full(client_env):
+    client, session_factory, user_id, _ = client_env
+    plan_date = date.today()
+    origin = datetime.combine(plan_date, datetime.min.time())
+    with session_factory() as db:
+        for offset in range(7, 14):
+            day = origin + timedelta(days=offset)
+            blocker = models.Task(
+                user_id=user_id,
+                title=f"Busy {offset}",
+                duration_minutes=14 * 60,
+                deadline=day + timedelta(hours=23),
+                task_type="work",
+                importance="medium",
+                preferred_time="anytime",
+                energy="medium",
+                status=models.TaskStatus.scheduled,
+            )
+            plan = models.Plan(user_id=user_id, plan_date=day)
+            db.add(
+                models.PlanItem(
+                    plan=plan,
+                    task=blocker,
+                    start_datetime=day + timedelta(hours=8),
+                    end_datetime=day + timedelta(hours=22),
+                    position=0,
+                    source="manual",
+                )
+            )
+        db.commit()
+    task = _create_task(client, "Squeezed", origin + timedelta(days=12, hours=20))
+
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+
+    placed = _placements(client, plan_date, plan_date + timedelta(days=20))
+    assert (placed[task["id"]] - plan_date).days < 7
+    with session_factory() as db:
+        assert db.get(models.Task, task["id"]).status == models.TaskStatus.scheduled
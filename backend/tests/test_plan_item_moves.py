@@ -0,0 +1,247 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield TestClient(app), TestingSessionLocal, user_id, statements
+
+    app.dependency_overrides.clear()
+
+
+def _seed_day(session_factory, user_id: int, origin: datetime, hours: list[int]) -> list[int]:
+    """One plan on ``origin`` with an hour-long item starting at each of ``hours``."""
+    with session_factory() as db:
+        plan = models.Plan(user_id=user_id, plan_date=origin)
+        db.add(plan)
+        for i, hour in enumerate(hours):
+            task = models.Task(
+                user_id=user_id,
+                title=f"Item {i}",
+                duration_minutes=60,
+                deadline=origin + timedelta(days=3),
+                task_type="work",
+                importance="medium",
+                preferred_time="anytime",
+                energy="medium",
+                status=models.TaskStatus.scheduled,
+            )
+            db.add(
+                models.PlanItem(
+                    plan=plan,
+                    task=task,
+                    start_datetime=origin + timedelta(hours=hour),
+                    end_datetime=origin + timedelta(hours=hour + 1),
+                    position=i,
+                    source="ai",
+                )
+            )
+        db.commit()
+        return [item.id for item in sorted(plan.items, key=lambda item: item.position)]
+
+
+def _move(item_id: int, start: datetime, minutes: int = 60) -> dict:
+    return {"item_id": item_id, "start": start.isoformat(), "end": (start + timedelta(minutes=minutes)).isoformat()}
+
+
+def _spans(session_factory, user_id: int) -> dict[int, tuple[datetime, datetime]]:
+    with session_factory() as db:
+        items = (
+            db.query(models.PlanItem)
+            .join(models.Plan)
+            .filter(models.Plan.user_id == user_id)
+        )
+        return {item.id: (item.start_datetime, item.end_datetime) for item in items}
+
+
+def test_batch_swaps_items_and_moves_across_days(client_env):
+    client, session_factory, user_id, _ = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    a, b, c = _seed_day(session_factory, user_id, origin, [9, 10, 14])
+    tomorrow = origin + timedelta(days=1)
+
+    # swapping two adjacent items is only possible as one batch
+    res = client.patch(
+        "/api/v1/planning/items",
+        json={
+            "moves": [
+                _move(a, origin + timedelta(hours=10)),
+                _move(b, origin + timedelta(hours=9)),
+                _move(c, tomorrow + timedelta(hours=8)),
+            ]
+        },
+    )
+    assert res.status_code == 200, res.text
+    body = res.json()
+    assert [item["plan_item_id"] for item in body["moved"]] == [a, b, c]
+    assert body["shifted"] == []
+
+    spans = _spans(session_factory, user_id)
+    assert spans[a][0] == origin + timedelta(hours=10)
+    assert spans[b][0] == origin + timedelta(hours=9)
+    assert spans[c][0] == tomorrow + timedelta(hours=8)
+    with session_factory() as db:
+        moved = db.get(models.PlanItem, c)
+        assert moved.plan.plan_date == tomorrow
+        assert moved.plan.status == models.PlanStatus.adjusted
+        assert {item.source for item in db.query(models.PlanItem)} == {"manual"}
+        outcomes = sorted(fb.outcome for fb in db.query(models.FeedbackLog))
+        assert outcomes == [-1, -1, 1]
+        assert db.query(models.FeedbackBias).filter(models.FeedbackBias.key == "total").one().weight == 3.0
+
+
+def test_conflict_anywhere_in_batch_rejects_every_move(client_env):
+    client, session_factory, user_id, _ = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    a, b, c = _seed_day(session_factory, user_id, origin, [9, 11, 14])
+    before = _spans(session_factory, user_id)
+
+    res = client.patch(
+        "/api/v1/planning/items",
+        json={
+            "moves": [
+                _move(a, origin + timedelta(hours=16)),
+                # lands on b, which is not part of the batch
+                _move(c, origin + timedelta(hours=11, minutes=30)),
+            ]
+        },
+    )
+    assert res.status_code == 400
+    assert res.json()["detail"] == "Time slot already occupied by 'Item 1' from 11:00 to 12:00."
+    assert _spans(session_factory, user_id) == before
+
+    # two moved items colliding with each other are caught too
+    res = client.patch(
+        "/api/v1/planning/items",
+        json={"moves": [_move(a, origin + timedelta(hours=16)), _move(c, origin + timedelta(hours=16, minutes=30))]},
+    )
+    assert res.status_code == 400
+    assert _spans(session_factory, user_id) == before
+
+    res = client.patch("/api/v1/planning/items", json={"moves": [_move(a, origin), _move(a, origin)]})
+    assert res.status_code == 422
+
+
+def test_ripple_pushes_later_items_back(client_env):
+    client, session_factory, user_id, _ = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    a, b, c, d = _seed_day(session_factory, user_id, origin, [8, 10, 11, 15])
+
+    # a grows into 10:00-11:30; b and c move down, d still fits where it is
+    res = client.patch(
+        "/api/v1/planning/items",
+        json={"moves": [_move(a, origin + timedelta(hours=10), minutes=90)], "ripple": True},
+    )
+    assert res.status_code == 200, res.text
+    shifted = res.json()["shifted"]
+    assert [item["plan_item_id"] for item in shifted] == [b, c]
+
+    spans = _spans(session_factory, user_id)
+    assert spans[b] == (origin + timedelta(hours=11, minutes=30), origin + timedelta(hours=12, minutes=30))
+    assert spans[c] == (origin + timedelta(hours=12, minutes=30), origin + timedelta(hours=13, minutes=30))
+    assert spans[d] == (origin + timedelta(hours=15), origin + timedelta(hours=16))
+
+    # an earlier item is never shifted, so overlapping it still conflicts
+    res = client.patch(
+        "/api/v1/planning/items",
+        json={"moves": [_move(d, origin + timedelta(hours=13))], "ripple": True},
+    )
+    assert res.status_code == 400
+
+
+def test_batch_statement_count_does_not_grow_with_moves(client_env):
+    client, session_factory, user_id, statements = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    ids = _seed_day(session_factory, user_id, origin, list(range(0, 20)))
+    tomorrow = origin + timedelta(days=1)
+
+    counts = []
+    for batch, day in ((ids[:2], tomorrow), (ids[2:20], tomorrow + timedelta(days=1))):
+        statements.clear()
+        res = client.patch(
+            "/api/v1/planning/items",
+            json={"moves": [_move(item_id, day + timedelta(hours=i)) for i, item_id in enumerate(batch)]},
+        )
+        assert res.status_code == 200, res.text
+        counts.append(len(statements))
+    # the first batch also creates the feedback bias rows
+    assert counts[1] <= counts[0] <= 15
+
+
+def test_single_item_route_shares_batch_path(client_env):
+    client, session_factory, user_id, statements = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    a, b = _seed_day(session_factory, user_id, origin, [9, 10])
+
+    res = client.patch(
+        f"/api/v1/planning/item/{a}",
+        params={"start": (origin + timedelta(hours=10, minutes=30)).isoformat(), "end": (origin + timedelta(hours=11)).isoformat()},
+    )
+    assert res.status_code == 400
+
+    statements.clear()
+    res = client.patch(
+        f"/api/v1/planning/item/{b}",
+        params={"start": (origin + timedelta(hours=7)).isoformat(), "end": (origin + timedelta(hours=8)).isoformat()},
+    )
+    assert res.status_code == 200, res.text
+    assert res.json()["plan_item_id"] == b
+    assert sum(1 for sql in statements if sql.startswith("SELECT")) <= 5
+    with session_factory() as db:
+        [fb] = db.query(models.FeedbackLog).all()
+        assert (fb.task_id, fb.outcome) == (db.get(models.PlanItem, b).task_id, 1)
@@ -0,0 +1,195 @@
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend import dependencies
+from backend.dependencies import get_current_user, get_db, get_job_queue
+from backend.jobs import InlineJobQueue, JobQueue, JobQueueFull, ThreadPoolJobQueue
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _create_task(client: TestClient, title: str, deadline: datetime) -> None:
+    res = client.post(
+        "/api/v1/tasks",
+        json={
+            "title": title,
+            "description": None,
+            "duration_minutes": 60,
+            "deadline": deadline.isoformat(),
+            "task_type": "work",
+            "importance": "high",
+            "preferred_time": "morning",
+            "energy": "high",
+        },
+    )
+    assert res.status_code == 200, res.text
+
+
+def test_plan_job_runs_in_background_and_matches_stored_plan(client_env):
+    client = client_env
+    queue = ThreadPoolJobQueue(workers=1)
+    app.dependency_overrides[get_job_queue] = lambda: queue
+    plan_date = date.today()
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=23)
+    _create_task(client, "Task A", deadline)
+    _create_task(client, "Task B", deadline)
+
+    try:
+        res = client.post("/api/v1/planning/jobs", json={"date": plan_date.isoformat()})
+        assert res.status_code == 202, res.text
+        job_id = res.json()["id"]
+
+        res = client.get(f"/api/v1/planning/jobs/{job_id}", params={"wait": 10})
+        assert res.status_code == 200, res.text
+        job = res.json()
+        assert job["status"] == "succeeded", job
+        assert {item["title"] for item in job["result"]["scheduled"]} == {"Task A", "Task B"}
+
+        stored = client.get("/api/v1/planning/plan", params={"plan_date": plan_date.isoformat()}).json()
+        assert [i["plan_item_id"] for i in stored["scheduled"]] == [i["plan_item_id"] for i in job["result"]["scheduled"]]
+
+        metrics = client.get("/api/v1/planning/jobs/metrics").json()
+        assert metrics["succeeded"] == 1
+        assert metrics["queue_depth"] == 0
+        assert metrics["run_ms"]["count"] == 1
+    finally:
+        queue.shutdown()
+
+
+def test_failed_and_unknown_jobs(client_env):
+    client = client_env
+    queue = InlineJobQueue()
+    app.dependency_overrides[get_job_queue] = lambda: queue
+
+    res = client.post("/api/v1/planning/jobs", json={"date": date.today().isoformat()})
+    assert res.status_code == 202
+    job = res.json()
+    assert job["status"] == "failed"
+    assert job["error_status"] == 400
+    assert "No pending tasks" in job["error"]
+
+    assert client.get("/api/v1/planning/jobs/not-a-job").status_code == 404
+    other_owner = queue.submit(owner_id=999, fn=lambda: None)
+    assert client.get(f"/api/v1/planning/jobs/{other_owner.id}").status_code == 404
+
+
+def test_job_queue_bounds_pending_jobs_and_reports_depth():
+    queue = ThreadPoolJobQueue(workers=1, max_pending=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocked():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    try:
+        first = queue.submit(1, blocked)
+        assert started.wait(5)
+        second = queue.submit(1, lambda: "next")
+        with pytest.raises(JobQueueFull):
+            queue.submit(1, lambda: "rejected")
+
+        metrics = queue.metrics()
+        assert (metrics["queue_depth"], metrics["running"], metrics["rejected"]) == (1, 1, 1)
+
+        release.set()
+        assert queue.wait(second.id, 5).result == "next"
+        assert first.result == "done"
+        metrics = queue.metrics()
+        assert (metrics["queue_depth"], metrics["running"], metrics["succeeded"]) == (0, 0, 2)
+        assert metrics["wait_ms"]["count"] == 2
+    finally:
+        release.set()
+        queue.shutdown()
+
+
+def test_concurrent_first_requests_share_one_queue(monkeypatch):
+    created = []
+
+    class SlowQueue(InlineJobQueue):
+        def __init__(self, workers, max_pending):
+            time.sleep(0.05)
+            created.append(self)
+            super().__init__(max_pending=max_pending)
+
+    monkeypatch.setattr(dependencies, "ThreadPoolJobQueue", SlowQueue)
+    monkeypatch.setattr(dependencies, "_job_queue", None)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def first_request():
+        barrier.wait()
+        seen.append(dependencies.get_job_queue())
+
+    threads = [threading.Thread(target=first_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(created) == 1
+    assert len(seen) == 8 and all(queue is created[0] for queue in seen)
+    dependencies.shutdown_job_queue()
+    assert dependencies._job_queue is None
+
+
+def test_job_queue_requires_a_dispatch_strategy():
+    with pytest.raises(TypeError):
+        JobQueue()
@@ -0,0 +1,183 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+class _StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def reset(self) -> None:
+        self.count = 0
+
+
+def _client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.add(models.UserSettings(user=user, working_hours_start="08:00", working_hours_end="22:00"))
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    return TestClient(app), _StatementCounter(engine), TestingSessionLocal, user_id
+
+
+def _create_tasks(client: TestClient, plan_date: date, count: int, offset: int = 0) -> None:
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    for i in range(offset, offset + count):
+        res = client.post(
+            "/api/v1/tasks",
+            json={
+                "title": f"Task {i}",
+                "description": None,
+                "duration_minutes": 30,
+                "deadline": (day_start + timedelta(hours=20 + 7 * i)).isoformat(),
+                "task_type": "work",
+                "importance": ("low", "medium", "high")[i % 3],
+                "preferred_time": "anytime",
+                "energy": "medium",
+            },
+        )
+        assert res.status_code == 200, res.text
+
+
+def _plan_statement_counts(task_count: int) -> tuple[int, int]:
+    plan_date = date.today()
+    client, counter, _, _ = _client_env()
+    try:
+        _create_tasks(client, plan_date, task_count)
+        counter.reset()
+        res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+        assert res.status_code == 200, res.text
+        assert len(res.json()["scheduled"]) > 0
+        first = counter.count
+
+        # replanning reads the items written above and adds new ones around them
+        _create_tasks(client, plan_date, task_count, offset=task_count)
+        counter.reset()
+        res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+        assert res.status_code == 200, res.text
+        return first, counter.count
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_plan_generation_statement_count_is_independent_of_task_count():
+    small = _plan_statement_counts(3)
+    large = _plan_statement_counts(30)
+
+    assert small == large
+
+
+def _seed_plans(session_factory, user_id: int, first_date: date, days: int, items_per_day: int) -> None:
+    with session_factory() as db:
+        for offset in range(days):
+            day_start = datetime.combine(first_date + timedelta(days=offset), datetime.min.time())
+            plan = models.Plan(user_id=user_id, plan_date=day_start, summary=f"{items_per_day} scheduled")
+            db.add(plan)
+            for i in range(items_per_day):
+                start = day_start + timedelta(hours=8 + i)
+                task = models.Task(
+                    user_id=user_id,
+                    title=f"Task {offset}-{i}",
+                    duration_minutes=45,
+                    deadline=day_start + timedelta(hours=23),
+                    task_type="work",
+                    importance="medium",
+                    preferred_time="anytime",
+                    energy="medium",
+                    status=models.TaskStatus.scheduled,
+                )
+                db.add(
+                    models.PlanItem(
+                        plan=plan,
+                        task=task,
+                        start_datetime=start,
+                        end_datetime=start + timedelta(minutes=45),
+                        position=i,
+                    )
+                )
+        db.commit()
+
+
+def _read_statement_counts(days: int) -> tuple[int, int]:
+    first_date = date(2025, 1, 1)
+    client, counter, session_factory, user_id = _client_env()
+    try:
+        _seed_plans(session_factory, user_id, first_date, days, items_per_day=5)
+
+        counter.reset()
+        res = client.get(
+            "/api/v1/planning/calendar",
+            params={"start_date": first_date.isoformat(), "end_date": (first_date + timedelta(days=days - 1)).isoformat()},
+        )
+        assert res.status_code == 200, res.text
+        calendar_days = res.json()["days"]
+        assert len(calendar_days) == days
+        assert all(len(day["scheduled"]) == 5 and day["scheduled"][0]["title"] for day in calendar_days)
+        calendar_count = counter.count
+
+        counter.reset()
+        res = client.get("/api/v1/planning/plan", params={"plan_date": first_date.isoformat()})
+        assert res.status_code == 200, res.text
+        assert [item["title"] for item in res.json()["scheduled"]] == [f"Task 0-{i}" for i in range(5)]
+        return calendar_count, counter.count
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_plan_reads_statement_count_is_independent_of_range():
+    month = _read_statement_counts(30)
+    quarter = _read_statement_counts(90)
+
+    assert month == quarter
+    assert month[0] <= 2
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import ml, models
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+class _ImportanceModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def predict(self, payload):
+        # importance first, then the sooner deadline
+        return [row[3] * 1000.0 - row[2] for row in payload]
+
+
+@pytest.fixture()
+def client_env(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    monkeypatch.setattr(ml, "get_priority_model", lambda: _ImportanceModel())
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield TestClient(app), TestingSessionLocal, user_id, statements
+
+    app.dependency_overrides.clear()
+
+
+def _add_task(db, user_id: int, title: str, importance: str, deadline: datetime, status=models.TaskStatus.pending):
+    db.add(
+        models.Task(
+            user_id=user_id,
+            title=title,
+            duration_minutes=30,
+            deadline=deadline,
+            task_type="work",
+            importance=importance,
+            preferred_time="anytime",
+            energy="medium",
+            status=status,
+        )
+    )
+
+
+def test_ranked_tasks_sorted_by_learned_priority(client_env):
+    client, session_factory, user_id, statements = client_env
+    origin = datetime.combine(date.today(), datetime.min.time())
+    with session_factory() as db:
+        _add_task(db, user_id, "Later low", "low", origin + timedelta(days=1))
+        _add_task(db, user_id, "High far", "high", origin + timedelta(days=5))
+        _add_task(db, user_id, "High soon", "high", origin + timedelta(hours=20))
+        _add_task(db, user_id, "Medium", "medium", origin + timedelta(hours=10), status=models.TaskStatus.scheduled)
+        _add_task(db, user_id, "Done", "high", origin + timedelta(hours=12), status=models.TaskStatus.completed)
+        db.commit()
+
+    statements.clear()
+    res = client.get("/api/v1/tasks/ranked", params={"plan_date": date.today().isoformat()})
+    assert res.status_code == 200, res.text
+    ranked = res.json()
+    assert [task["title"] for task in ranked] == ["High soon", "High far", "Medium", "Later low"]
+    assert ranked[0]["priority"] > ranked[1]["priority"] > ranked[2]["priority"]
+    assert ranked[2]["status"] == "scheduled"
+    # the user, then one query for the whole backlog
+    assert len(statements) == 2
+
+    res = client.get("/api/v1/tasks/ranked", params={"limit": 2})
+    assert [task["title"] for task in res.json()] == ["High soon", "High far"]
+    assert client.get("/api/v1/tasks/ranked", params={"limit": 0}).status_code == 422
@@ -0,0 +1,198 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield TestClient(app), TestingSessionLocal, user_id
+
+    app.dependency_overrides.clear()
+
+
+def _create_task(client: TestClient, title: str, deadline: datetime, duration_minutes: int = 60) -> dict:
+    payload = {
+        "title": title,
+        "description": None,
+        "duration_minutes": duration_minutes,
+        "deadline": deadline.isoformat(),
+        "task_type": "work",
+        "importance": "medium",
+        "preferred_time": "anytime",
+        "energy": "medium",
+    }
+    res = client.post("/api/v1/tasks", json=payload)
+    assert res.status_code == 200, res.text
+    return res.json()
+
+
+def _calendar(client: TestClient, first: date, last: date) -> dict[str, list]:
+    res = client.get(
+        "/api/v1/planning/calendar",
+        params={"start_date": first.isoformat(), "end_date": last.isoformat()},
+    )
+    assert res.status_code == 200, res.text
+    return {day["plan_date"]: day["scheduled"] for day in res.json()["days"]}
+
+
+def test_replan_new_task_touches_only_days_before_its_deadline(client_env):
+    client, _, _ = client_env
+    plan_date = date.today()
+    origin = datetime.combine(plan_date, datetime.min.time())
+    for i in range(12):
+        _create_task(client, f"Task {i}", origin + timedelta(days=i % 6, hours=17), duration_minutes=90)
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    before = _calendar(client, plan_date, plan_date + timedelta(days=6))
+
+    new_task = _create_task(client, "Urgent", origin + timedelta(days=1, hours=17), duration_minutes=30)
+    res = client.post("/api/v1/planning/replan", json={"date": plan_date.isoformat(), "task_id": new_task["id"]})
+    assert res.status_code == 200, res.text
+    body = res.json()
+
+    assert body["affected_dates"] == [plan_date.isoformat(), (plan_date + timedelta(days=1)).isoformat()]
+    [placed] = body["scheduled"]
+    assert placed["task_id"] == new_task["id"]
+    assert datetime.fromisoformat(placed["start"]).date() in (plan_date, plan_date + timedelta(days=1))
+
+    after = _calendar(client, plan_date, plan_date + timedelta(days=6))
+    for day in sorted(before)[2:]:
+        assert after[day] == before[day]
+    for day in sorted(before)[:2]:
+        assert [i["plan_item_id"] for i in before[day]] == [
+            i["plan_item_id"] for i in after[day] if i["task_id"] != new_task["id"]
+        ]
+        spans = sorted((i["start"], i["end"]) for i in after[day])
+        assert all(end_a <= start_b for (_, end_a), (start_b, _) in zip(spans, spans[1:]))
+
+
+def test_replan_freed_day_places_unscheduled_task(client_env):
+    client, session_factory, user_id = client_env
+    plan_date = date.today()
+    origin = datetime.combine(plan_date, datetime.min.time())
+    deadline = origin + timedelta(hours=23)
+
+    with session_factory() as db:
+        plan = models.Plan(user_id=user_id, plan_date=origin)
+        db.add(plan)
+        for i, hour in enumerate((8, 12, 16)):
+            task = models.Task(
+                user_id=user_id,
+                title=f"Booked {i}",
+                duration_minutes=240,
+                deadline=deadline,
+                task_type="work",
+                importance="medium",
+                preferred_time="anytime",
+                energy="medium",
+                status=models.TaskStatus.scheduled,
+            )
+            db.add(
+                models.PlanItem(
+                    plan=plan,
+                    task=task,
+                    start_datetime=origin + timedelta(hours=hour),
+                    end_datetime=origin + timedelta(hours=hour + 4),
+                    position=i,
+                    source="manual",
+                )
+            )
+        waiting = models.Task(
+            user_id=user_id,
+            title="Waiting",
+            duration_minutes=180,
+            deadline=deadline,
+            task_type="work",
+            importance="medium",
+            preferred_time="anytime",
+            energy="medium",
+            status=models.TaskStatus.unscheduled,
+        )
+        db.add(waiting)
+        db.commit()
+        waiting_id = waiting.id
+        moved_id = plan.items[1].id
+
+    # the middle block moves to tomorrow, freeing 12:00-16:00 today
+    tomorrow = origin + timedelta(days=1)
+    res = client.patch(
+        f"/api/v1/planning/item/{moved_id}",
+        params={"start": (tomorrow + timedelta(hours=9)).isoformat(), "end": (tomorrow + timedelta(hours=13)).isoformat()},
+    )
+    assert res.status_code == 200, res.text
+
+    res = client.post(
+        "/api/v1/planning/replan",
+        json={"date": plan_date.isoformat(), "item_id": moved_id, "previous_date": plan_date.isoformat()},
+    )
+    assert res.status_code == 200, res.text
+    body = res.json()
+
+    assert body["affected_dates"] == [plan_date.isoformat(), (plan_date + timedelta(days=1)).isoformat()]
+    [placed] = body["scheduled"]
+    assert placed["task_id"] == waiting_id
+    start = datetime.fromisoformat(placed["start"])
+    assert origin + timedelta(hours=12) <= start and start + timedelta(minutes=180) <= origin + timedelta(hours=16)
+
+    with session_factory() as db:
+        planned_days = {p.plan_date.date() for p in db.query(models.Plan).filter(models.Plan.user_id == user_id)}
+        assert db.get(models.Task, waiting_id).status == models.TaskStatus.scheduled
+    assert planned_days == {plan_date, plan_date + timedelta(days=1)}
+
+
+def test_replan_requires_a_change(client_env):
+    client, _, _ = client_env
+    res = client.post("/api/v1/planning/replan", json={"date": date.today().isoformat()})
+    assert res.status_code == 422
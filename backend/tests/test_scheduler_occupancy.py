@@ -0,0 +1,91 @@
+import random
+from datetime import datetime
+
+from backend.ml import scheduler
+
+
+def _brute_free_run(owners):
+    runs = []
+    for start in range(len(owners)):
+        run = 0
+        while start + run < len(owners) and owners[start + run] is None:
+            run += 1
+        runs.append(run)
+    return runs
+
+
+def _brute_free_back(owners):
+    return _brute_free_run(owners[::-1])[::-1]
+
+
+def test_occupancy_index_tracks_free_runs():
+    rng = random.Random(7)
+    index = scheduler.OccupancyIndex(28)
+    placed = []
+    for owner in range(40):
+        if placed and rng.random() < 0.4:
+            start, end = placed.pop(rng.randrange(len(placed)))
+            index.release(start, end)
+        else:
+            required = rng.randint(1, 4)
+            starts = index.fitting_starts(required)
+            if not starts:
+                continue
+            start = rng.choice(starts)
+            index.occupy(start, start + required, owner)
+            placed.append((start, start + required))
+        assert index.free_run == _brute_free_run(index.owners)
+        assert index.free_back == _brute_free_back(index.owners)
+
+
+def test_fitting_starts_respects_stop_and_blocked_slots():
+    index = scheduler.OccupancyIndex(10)
+    index.occupy(3, 5, -1)
+
+    assert index.fitting_starts(2) == [0, 1, 5, 6, 7, 8]
+    assert index.fitting_starts(2, stop=6) == [0, 1, 5]
+    assert not index.fits(2, 2)
+    assert index.fits(5, 5)
+
+
+def test_fragmentation_penalty_flags_single_slot_gaps():
+    index = scheduler.OccupancyIndex(10)
+    index.occupy(0, 2, 1)
+    index.occupy(6, 8, 2)
+
+    # leaves one free slot on each side (slots 2 and 5)
+    assert scheduler._fragmentation_penalty(index, 3, 2) == 4.0
+    # flush against the earlier block, leaves a two-slot gap before the later one
+    assert scheduler._fragmentation_penalty(index, 2, 2) == 0.0
+
+
+def test_minute_offsets_map_deadlines_and_busy_intervals():
+    slot_offsets = scheduler.build_slot_offsets(start_hour=8, end_hour=12)
+    assert slot_offsets == [480, 510, 540, 570, 600, 630, 660, 690]
+
+    # a 2-slot task must start its last slot before 10:15 -> last start 9:30
+    assert scheduler._latest_fitting_stop(slot_offsets, 2, 615.0) == 4
+    assert scheduler._latest_fitting_stop(slot_offsets, 2, 600.0) == 3
+    assert scheduler._latest_fitting_stop(slot_offsets, 9, 720.0) == 0
+
+    day_start = datetime(2025, 3, 4)
+    occupied = scheduler.OccupancyIndex(len(slot_offsets))
+    scheduler._apply_occupied_intervals(
+        occupied,
+        slot_offsets,
+        day_start,
+        [(day_start.replace(hour=8, minute=50), day_start.replace(hour=9, minute=40))],
+    )
+    assert occupied.owners == [None, -1, -1, -1, None, None, None, None]
+
+
+def test_fragmentation_sliver_scales_with_slot_size():
+    # 5-minute slots: a 40-minute gap is still a sliver, a full hour is not
+    index = scheduler.OccupancyIndex(40)
+    index.occupy(0, 4, 1)
+    sliver_slots = scheduler._sliver_slots(5)
+
+    assert sliver_slots == 11
+    assert scheduler._fragmentation_penalty(index, 12, 3, sliver_slots) == 2.0
+    assert scheduler._fragmentation_penalty(index, 16, 3, sliver_slots) == 0.0
+    assert scheduler._sliver_slots(30) == 1
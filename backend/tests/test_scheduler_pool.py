@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend import dependencies
+from backend.dependencies import get_current_user, get_db, get_scheduler_pool
+from backend.scheduler_pool import SchedulerBusy, SchedulerPool
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client_env():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _create_task(client: TestClient, title: str, deadline: datetime) -> None:
+    res = client.post(
+        "/api/v1/tasks",
+        json={
+            "title": title,
+            "description": None,
+            "duration_minutes": 60,
+            "deadline": deadline.isoformat(),
+            "task_type": "work",
+            "importance": "high",
+            "preferred_time": "morning",
+            "energy": "high",
+        },
+    )
+    assert res.status_code == 200, res.text
+
+
+def test_plan_requests_beyond_capacity_get_503_with_retry_after(client_env):
+    client = client_env
+    scheduler = SchedulerPool(processes=0, max_pending=0)
+    app.dependency_overrides[get_scheduler_pool] = lambda: scheduler
+    plan_date = date.today()
+    _create_task(client, "Task A", datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=23))
+
+    scheduler.acquire()  # another plan is running
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 503
+    assert int(res.headers["Retry-After"]) >= 1
+    res = client.post(
+        "/api/v1/planning/replan",
+        json={"date": plan_date.isoformat(), "previous_date": plan_date.isoformat()},
+    )
+    assert res.status_code == 503
+    scheduler.release()
+
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    metrics = client.get("/api/v1/planning/jobs/metrics").json()["scheduler"]
+    assert (metrics["rejected"], metrics["admitted"], metrics["runs"]) == (2, 0, 1)
+    scheduler.acquire()
+    with pytest.raises(SchedulerBusy):
+        scheduler.acquire()
+
+
+def test_plan_is_scheduled_in_a_worker_process(client_env):
+    client = client_env
+    scheduler = SchedulerPool(processes=1)
+    app.dependency_overrides[get_scheduler_pool] = lambda: scheduler
+    plan_date = date.today()
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=23)
+    _create_task(client, "Task A", deadline)
+    _create_task(client, "Task B", deadline)
+
+    try:
+        assert scheduler.run(os.getpid) != os.getpid()
+        res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+        assert res.status_code == 200, res.text
+        assert {item["title"] for item in res.json()["scheduled"]} == {"Task A", "Task B"}
+        assert scheduler.metrics()["runs"] == 2
+    finally:
+        scheduler.shutdown()
+
+
+def test_concurrent_first_requests_share_one_pool(monkeypatch):
+    created = []
+
+    class SlowPool(SchedulerPool):
+        def __init__(self, **kwargs):
+            time.sleep(0.05)
+            created.append(self)
+            super().__init__(processes=0, max_pending=kwargs["max_pending"])
+
+    monkeypatch.setattr(dependencies, "SchedulerPool", SlowPool)
+    monkeypatch.setattr(dependencies, "_scheduler_pool", None)
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def first_request():
+        barrier.wait()
+        seen.append(dependencies.get_scheduler_pool())
+
+    threads = [threading.Thread(target=first_request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(created) == 1
+    assert len(seen) == 8 and all(pool is created[0] for pool in seen)
+    dependencies.shutdown_scheduler_pool()
+    assert dependencies._scheduler_pool is None
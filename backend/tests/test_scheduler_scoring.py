@@ -0,0 +1,123 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from backend.ml import scheduler
+
+
+class _CountingModel:
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, payload):
+        self.calls += 1
+        return [row[1] * 0.01 - row[2] * 0.3 + row[3] * 7.0 + row[4] for row in payload]
+
+
+def _tasks(plan_date: date, count: int) -> list[dict]:
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    choices = ("low", "medium", "high")
+    return [
+        dict(
+            id=i + 1,
+            title=f"Task {i}",
+            duration_minutes=30 + (i % 4) * 30,
+            deadline=day_start + timedelta(hours=10 + (i * 7) % 90),
+            task_type=("work", "study", "admin")[i % 3],
+            importance=choices[i % 3],
+            preferred_time=("morning", "afternoon", "evening", "anytime")[i % 4],
+            energy=choices[(i + 1) % 3],
+        )
+        for i in range(count)
+    ]
+
+
+def test_schedule_day_scores_backlog_with_one_model_call():
+    plan_date = date(2025, 3, 4)
+    model = _CountingModel()
+
+    scheduler.schedule_day(_tasks(plan_date, 200), "worker", plan_date, model=model)
+
+    assert model.calls == 1
+
+
+def test_batched_scores_match_single_row_scoring():
+    plan_date = date(2025, 3, 4)
+    plan_start = datetime.combine(plan_date, datetime.min.time()).replace(hour=8)
+    tasks = _tasks(plan_date, 12)
+    bias_map = {"type_importance:work:low": 0.5, "preferred_time:anytime": -0.25, "energy:high": 0.3}
+    model = _CountingModel()
+
+    scored = scheduler._score_tasks(
+        tasks,
+        user_profile="worker",
+        plan_date=plan_date,
+        plan_start=plan_start,
+        bias_map=bias_map,
+        model=model,
+    )
+
+    for task, item in zip(tasks, scored):
+        single = scheduler._score_tasks(
+            [task],
+            user_profile="worker",
+            plan_date=plan_date,
+            plan_start=plan_start,
+            bias_map=bias_map,
+            model=model,
+        )[0]
+        assert item["priority"] == pytest.approx(single["priority"], abs=1e-12)
+        assert item["bias_reasons"] == single["bias_reasons"]
+
+
+def test_vectorized_costs_match_scalar_placement_cost():
+    plan_date = date(2025, 3, 4)
+    slot_offsets = scheduler.build_slot_offsets(start_hour=8, end_hour=22)
+    occupied = scheduler.OccupancyIndex(len(slot_offsets))
+    occupied.occupy(3, 5, 1)
+    occupied.occupy(12, 13, -1)
+    occupied.occupy(20, 24, 2)
+    cost_model = scheduler.DayCostModel(slot_offsets)
+    latest_end_minute = slot_offsets[0] + 11 * 60 + 17.5
+
+    for preferred_time in ("morning", "afternoon", "evening", "anytime"):
+        for energy in ("low", "medium", "high"):
+            window = scheduler._time_window_indices(preferred_time, len(slot_offsets), 8, 22)
+            kwargs = dict(
+                required_slots=2,
+                latest_end_minute=latest_end_minute,
+                preferred_window=window,
+                task_energy=energy,
+                duration_minutes=50,
+                hours_until_deadline=11.3,
+            )
+            starts = cost_model.candidate_starts(occupied, 2, latest_end_minute)
+            vector = cost_model.placement_costs(occupied=occupied, starts=starts, **kwargs)
+            scalar = [
+                scheduler._placement_cost(occupied=occupied, slot_offsets=slot_offsets, start_idx=int(s), **kwargs)
+                for s in starts
+            ]
+            assert list(starts) == occupied.fitting_starts(2, stop=int(starts[-1]) + 1)
+            assert vector.tolist() == scalar
+
+
+@pytest.mark.parametrize("slot_minutes", [5, 15, 30])
+def test_schedule_day_honours_slot_minutes(slot_minutes):
+    plan_date = date(2025, 3, 4)
+    tasks = _tasks(plan_date, 10)
+
+    scheduled, _, _ = scheduler.schedule_day(
+        tasks, "worker", plan_date, model=_CountingModel(), slot_minutes=slot_minutes
+    )
+
+    assert scheduled
+    spans = sorted(
+        (datetime.fromisoformat(s["start"]), datetime.fromisoformat(s["end"])) for s in scheduled
+    )
+    for start, end in spans:
+        assert start.minute % slot_minutes == 0
+        assert end.minute % slot_minutes == 0
+    for (_, end_a), (start_b, _) in zip(spans, spans[1:]):
+        assert end_a <= start_b
@@ -0,0 +1,61 @@
+import numpy as np
+
+from backend.ml.data_gen import (
+    ENERGY,
+    ENERGY_WEIGHTS,
+    IMPORTANCE,
+    IMPORTANCE_WEIGHTS,
+    expert_priority_score,
+    expert_priority_scores,
+    generate_synthetic_columns,
+    generate_synthetic_columns_parallel,
+)
+from backend.ml.priority_model import FEATURE_ORDER
+
+
+def _scalar_labels(columns):
+    return np.array(
+        [
+            expert_priority_score(**{field: columns[field][idx].item() for field in FEATURE_ORDER})
+            for idx in range(len(columns["priority"]))
+        ]
+    )
+
+
+def test_vector_labels_match_scalar_rules_including_boundaries():
+    columns = generate_synthetic_columns(3000, seed=7)
+    np.testing.assert_array_equal(columns["priority"], _scalar_labels(columns))
+
+    # the thresholds of every branch, on both sides
+    edges = generate_synthetic_columns(8, seed=8)
+    edges["hours_until_deadline"] = np.array([4.0, 4.001, 24.0, 24.001, 72.0, 72.001, 1.0, 119.0])
+    edges["duration_minutes"] = np.array([120, 150, 120, 150, 120, 150, 120, 150])
+    edges["plan_day_of_week"] = np.array([2, 3, 4, 5, 6, 0, 1, 2])
+    edges["is_weekend"] = (edges["plan_day_of_week"] >= 5).astype(int)
+    labels = expert_priority_scores(**{field: edges[field] for field in FEATURE_ORDER})
+    np.testing.assert_array_equal(labels, _scalar_labels(edges))
+
+
+def test_fixed_seed_reproduces_rows_with_the_scalar_distribution():
+    first = generate_synthetic_columns(20000, seed=11)
+    again = generate_synthetic_columns(20000, seed=11)
+    for field in FEATURE_ORDER + ["priority"]:
+        np.testing.assert_array_equal(first[field], again[field])
+    assert not np.array_equal(first["priority"], generate_synthetic_columns(20000, seed=12)["priority"])
+
+    hours = first["hours_until_deadline"]
+    assert hours.min() >= 1 and hours.max() < 120
+    assert np.array_equal(first["is_weekend"], (first["plan_day_of_week"] >= 5).astype(int))
+    for name, weight in zip(IMPORTANCE, IMPORTANCE_WEIGHTS):
+        assert abs(np.mean(first["importance"] == name) - weight) < 0.02
+    for name, weight in zip(ENERGY, ENERGY_WEIGHTS):
+        assert abs(np.mean(first["energy"] == name) - weight) < 0.02
+
+
+def test_parallel_generation_is_independent_of_worker_count():
+    serial = generate_synthetic_columns_parallel(1000, seed=5, workers=1, chunk_rows=300)
+    parallel = generate_synthetic_columns_parallel(1000, seed=5, workers=2, chunk_rows=300)
+    assert len(serial["priority"]) == 1000
+    for field in FEATURE_ORDER + ["priority"]:
+        np.testing.assert_array_equal(serial[field], parallel[field])
+    assert len(generate_synthetic_columns_parallel(0, seed=5)["priority"]) == 0
@@ -0,0 +1,137 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+
+from backend.ml import service
+from backend.ml.priority_model import encode_features
+from backend.ml import table_model
+from backend.ml.table_model import TablePriorityModel, grid_knots, load_table_model, split_thresholds
+from backend.scheduler_pool import _warm_worker
+
+
+class LinearModel:
+    """Linear in duration and deadline, so bilinear interpolation reproduces it exactly."""
+
+    feature_importances_ = [0.1, 0.05, 0.4, 0.2, 0.1, 0.05, 0.05, 0.03, 0.02]
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=float)
+        return 10.0 * X[:, 3] + 3.0 * X[:, 4] + X[:, 7] - 0.02 * X[:, 1] - 0.1 * X[:, 2] + 5.0 * X[:, 8]
+
+
+def _encoded(duration, hours, importance="high", task_type="work", weekday=2):
+    return encode_features(
+        user_type="worker",
+        duration_minutes=duration,
+        hours_until_deadline=hours,
+        importance=importance,
+        task_type=task_type,
+        preferred_time="morning",
+        energy="medium",
+        plan_day_of_week=weekday,
+        is_weekend=1 if weekday >= 5 else 0,
+    )
+
+
+def test_table_interpolates_between_knots_and_reports_its_error():
+    source = LinearModel()
+    table = TablePriorityModel.from_model(source, duration_knots=[15, 60, 240], deadline_knots=[0, 4, 24, 168], check_rows=2000)
+
+    rows = np.array(
+        [
+            _encoded(60, 4.0),
+            _encoded(37, 10.5, importance="low", weekday=6),
+            _encoded(500, 900.0, task_type="admin"),
+        ]
+    )
+    expected = source.predict(rows)
+    # beyond the last knots the inputs are clamped
+    expected[2] = source.predict(np.array([_encoded(240, 168.0, task_type="admin")]))[0]
+    np.testing.assert_allclose(table.predict(rows), expected, atol=1e-3)
+    assert table.max_error is not None and table.max_error < 1e-3
+    assert table.mean_abs_error <= table.max_error
+    assert table.feature_importances_.tolist() == source.feature_importances_
+
+
+def test_tree_splits_become_knot_pairs():
+    rng = np.random.default_rng(0)
+    X = np.array([_encoded(int(rng.choice([30, 60, 90, 120])), float(rng.uniform(1, 120))) for _ in range(600)])
+    y = np.where(X[:, 2] <= 24.0, 20.0, 0.0) + np.where(X[:, 1] > 75, -5.0, 0.0)
+    model = GradientBoostingRegressor(n_estimators=5, max_depth=2, random_state=0).fit(X, y)
+
+    durations, deadlines = grid_knots(model)
+    strongest = split_thresholds(model, 2)[0]
+    assert strongest in deadlines and strongest + 0.01 in deadlines
+    for threshold in split_thresholds(model, 1):
+        assert np.floor(threshold) in durations and np.floor(threshold) + 1 in durations
+
+    table = TablePriorityModel.from_model(model, duration_knots=durations, deadline_knots=[0.0, strongest, strongest + 0.01, 168.0])
+    probe = np.array([_encoded(duration, hours) for duration in (30, 60, 90, 120) for hours in (2.0, 23.0, 30.0, 100.0)])
+    np.testing.assert_allclose(table.predict(probe), model.predict(probe), atol=1e-3)
+
+
+def test_table_model_is_built_once_and_used_for_planning(tmp_path, monkeypatch):
+    source = LinearModel()
+    monkeypatch.setattr(service, "TABLE_MODEL_PATH", tmp_path / "table.pkl")
+    monkeypatch.setattr(service, "_TABLE_MODEL_CACHE", None)
+    monkeypatch.setattr(service, "get_priority_model", lambda: source)
+
+    table = service.get_table_priority_model()
+    assert isinstance(table, TablePriorityModel)
+    assert isinstance(load_table_model(tmp_path / "table.pkl"), TablePriorityModel)
+    assert service.get_table_priority_model() is table
+
+    plan_date = date.today()
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=20)
+    tasks = [
+        {
+            "id": i,
+            "title": f"Task {i}",
+            "duration_minutes": 30,
+            "deadline": deadline,
+            "task_type": "work",
+            "importance": importance,
+            "preferred_time": "anytime",
+            "energy": "medium",
+        }
+        for i, importance in enumerate(["low", "high"])
+    ]
+    scheduled, unscheduled, _ = service.generate_schedule(
+        tasks, user_profile="worker", plan_date=plan_date, priority_model="table"
+    )
+    assert not unscheduled
+    by_id = {s["task_id"]: s for s in scheduled}
+    assert by_id[1]["priority"] > by_id[0]["priority"]
+
+
+def test_save_replaces_the_table_file_whole(tmp_path, monkeypatch):
+    path = tmp_path / "table.pkl"
+    small = TablePriorityModel.from_model(LinearModel(), duration_knots=[15, 240], deadline_knots=[0, 168], check_rows=100)
+    small.save(path)
+    larger = TablePriorityModel.from_model(LinearModel(), duration_knots=[15, 60, 240], deadline_knots=[0, 168], check_rows=100)
+    larger.save(path)
+    assert load_table_model(path).duration_knots.tolist() == [15, 60, 240]
+
+    def dump_partly(obj, file):
+        file.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(table_model.joblib, "dump", dump_partly)
+    with pytest.raises(OSError):
+        small.save(path)
+    assert load_table_model(path).duration_knots.tolist() == [15, 60, 240]
+    assert [p.name for p in tmp_path.iterdir()] == ["table.pkl"]
+
+
+def test_worker_warm_up_builds_the_table_when_configured(tmp_path, monkeypatch):
+    monkeypatch.setattr(service, "TABLE_MODEL_PATH", tmp_path / "table.pkl")
+    monkeypatch.setattr(service, "_TABLE_MODEL_CACHE", None)
+    monkeypatch.setattr(service, "get_priority_model", lambda: LinearModel())
+
+    _warm_worker("tree")
+    assert service._TABLE_MODEL_CACHE is None
+    _warm_worker("table")
+    assert isinstance(service._TABLE_MODEL_CACHE, TablePriorityModel)
+    assert (tmp_path / "table.pkl").exists()
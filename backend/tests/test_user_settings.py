@@ -0,0 +1,151 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import Depends
+try:
+    from fastapi.testclient import TestClient
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    TestClient = None
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend import models
+
+if TestClient is None:
+    pytest.skip("fastapi TestClient requires requests", allow_module_level=True)
+
+
+@pytest.fixture()
+def client():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with TestingSessionLocal() as db:
+        user = models.User(
+            email="user@example.com",
+            name="Test User",
+            profile=models.UserProfile.worker,
+            role=models.UserRole.user,
+            timezone="UTC",
+            hashed_password="not-used",
+            is_active=True,
+            token_version=0,
+        )
+        db.add(user)
+        db.add(models.UserSettings(user=user))
+        db.commit()
+        user_id = user.id
+
+    def override_get_current_user(db=Depends(get_db)):
+        return db.get(models.User, user_id)
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = override_get_current_user
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+
+
+def test_slot_minutes_must_tile_an_hour(client):
+    res = client.get("/api/v1/planning/settings")
+    assert res.status_code == 200, res.text
+    assert res.json()["slot_minutes"] == 30
+
+    for bad in (4, 7, 45, 90):
+        res = client.patch("/api/v1/planning/settings", json={"slot_minutes": bad})
+        assert res.status_code == 422, bad
+
+    res = client.patch("/api/v1/planning/settings", json={"slot_minutes": 12})
+    assert res.status_code == 200, res.text
+    assert res.json()["slot_minutes"] == 12
+    assert client.get("/api/v1/planning/settings").json()["slot_minutes"] == 12
+
+
+def test_fifteen_minute_user_gets_quarter_hour_items(client):
+    assert client.patch("/api/v1/planning/settings", json={"slot_minutes": 15}).status_code == 200
+    plan_date = date.today() + timedelta(days=1)
+    deadline = datetime.combine(plan_date, datetime.min.time()) + timedelta(hours=20)
+    for i in range(4):
+        res = client.post(
+            "/api/v1/tasks",
+            json={
+                "title": f"Task {i}",
+                "duration_minutes": 45,
+                "deadline": deadline.isoformat(),
+                "task_type": "work",
+                "importance": "high",
+                "preferred_time": "morning",
+                "energy": "medium",
+            },
+        )
+        assert res.status_code == 200, res.text
+
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    starts = [datetime.fromisoformat(item["start"]) for item in res.json()["scheduled"]]
+    assert len(starts) == 4
+    assert all(start.minute % 15 == 0 for start in starts)
+    # back-to-back 45-minute items only pack this way on a quarter-hour grid
+    assert any(start.minute % 30 for start in starts)
+
+
+def test_default_user_plans_a_week_ahead(client):
+    settings = client.get("/api/v1/planning/settings").json()
+    assert settings["default_planning_horizon_hours"] == 168
+
+    plan_date = date.today() + timedelta(days=1)
+    deadline = datetime.combine(plan_date + timedelta(days=6), datetime.min.time()) + timedelta(hours=20)
+    for i in range(7):
+        res = client.post(
+            "/api/v1/tasks",
+            json={
+                "title": f"Task {i}",
+                "duration_minutes": 9 * 60,
+                "deadline": deadline.isoformat(),
+                "task_type": "work",
+                "importance": "high",
+                "preferred_time": "morning",
+                "energy": "medium",
+            },
+        )
+        assert res.status_code == 200, res.text
+
+    res = client.post("/api/v1/planning/plan", json={"date": plan_date.isoformat()})
+    assert res.status_code == 200, res.text
+    assert res.json()["unscheduled"] == []
+
+    res = client.get(
+        "/api/v1/planning/calendar",
+        params={"start_date": plan_date.isoformat(), "end_date": (plan_date + timedelta(days=6)).isoformat()},
+    )
+    assert res.status_code == 200, res.text
+    # one nine-hour task per ten-hour working day needs all seven days
+    days = {datetime.fromisoformat(item["start"]).date() for day in res.json()["days"] for item in day["scheduled"]}
+    assert days == {plan_date + timedelta(days=offset) for offset in range(7)}
+
+
+def test_planning_horizon_is_settable_up_to_ninety_days(client):
+    res = client.patch("/api/v1/planning/settings", json={"default_planning_horizon_hours": 90 * 24})
+    assert res.status_code == 200, res.text
+    assert res.json()["default_planning_horizon_hours"] == 90 * 24
+
+    for bad in (0, 90 * 24 + 1):
+        res = client.patch("/api/v1/planning/settings", json={"default_planning_horizon_hours": bad})
+        assert res.status_code == 422, bad
@@ -0,0 +1,71 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml.priority_model import (
+    ENERGY_MAP,
+    FEATURE_ORDER,
+    IMPORTANCE_MAP,
+    PREF_TIME_MAP,
+    TASK_TYPE_MAP,
+    USER_TYPE_MAP,
+    encode_feature_columns,
+    encode_features,
+)
+
+
+def _columns(rng: np.random.Generator, rows: int) -> dict:
+    return {
+        "user_type": rng.choice(list(USER_TYPE_MAP), rows).tolist(),
+        "duration_minutes": rng.choice([15, 30, 45, 60, 90, 120], rows).tolist(),
+        "hours_until_deadline": rng.uniform(0.0, 336.0, rows).tolist(),
+        "importance": rng.choice(list(IMPORTANCE_MAP), rows).tolist(),
+        "task_type": rng.choice(list(TASK_TYPE_MAP), rows).tolist(),
+        "preferred_time": rng.choice(list(PREF_TIME_MAP), rows).tolist(),
+        "energy": rng.choice(list(ENERGY_MAP), rows).tolist(),
+        "plan_day_of_week": rng.integers(0, 7, rows).tolist(),
+        "is_weekend": rng.integers(0, 2, rows).tolist(),
+    }
+
+
+def _row_wise(columns: dict) -> np.ndarray:
+    return np.array(
+        [encode_features(**dict(zip(FEATURE_ORDER, values))) for values in zip(*(columns[f] for f in FEATURE_ORDER))],
+        dtype=float,
+    )
+
+
+def _median_ms(fn, columns: dict, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(columns)
+        samples.append((time.perf_counter() - started) * 1e3)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Feature encoding: encode_features per row vs encode_feature_columns.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    columns = _columns(np.random.default_rng(0), args.rows)
+    if not np.array_equal(_row_wise(columns), encode_feature_columns(**columns)):
+        raise SystemExit("columnar encoding differs from encode_features")
+
+    row_ms = _median_ms(_row_wise, columns, args.repeats)
+    col_ms = _median_ms(lambda c: encode_feature_columns(**c), columns, args.repeats)
+    print(f"{args.rows} rows: row-wise {row_ms:8.1f} ms  columnar {col_ms:8.1f} ms  speedup {row_ms / col_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml import get_priority_model
+
+
+def _feature_rows(rng: np.random.Generator, rows: int) -> np.ndarray:
+    return np.column_stack(
+        [
+            rng.integers(0, 3, rows),
+            rng.choice([15, 30, 45, 60, 90, 120], rows),
+            rng.uniform(0.0, 336.0, rows),
+            rng.integers(0, 3, rows),
+            rng.integers(0, 6, rows),
+            rng.integers(0, 4, rows),
+            rng.integers(0, 3, rows),
+            rng.integers(0, 7, rows),
+            rng.integers(0, 2, rows),
+        ]
+    ).astype(float)
+
+
+def _median_us(fn, X: np.ndarray, repeats: int) -> float:
+    fn(X)
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(X)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Priority model latency: sklearn predict vs the flat-array evaluator.")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    flat = get_priority_model()
+    sklearn_model = flat.estimator
+    rng = np.random.default_rng(0)
+    check = _feature_rows(rng, 5000)
+    flat_pred = flat.predict(check)
+    max_error = float(np.max(np.abs(flat_pred - sklearn_model.predict(check))))
+    print(f"max |flat - sklearn| over {len(check)} rows: {max_error:.2e}")
+
+    for rows in (1, 100, 1000, 5000):
+        X = _feature_rows(rng, rows)
+        sk_us = _median_us(sklearn_model.predict, X, args.repeats)
+        flat_us = _median_us(flat.predict, X, args.repeats)
+        print(f"{rows:>4} rows: sklearn {sk_us:8.1f} us  flat {flat_us:8.1f} us  speedup {sk_us / flat_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml import get_priority_model
+from backend.ml.horizon import schedule_horizon
+
+
+def _workload(rng: random.Random, n_tasks: int, days: int):
+    plan_start = date(2025, 1, 6)
+    horizon_dates = [plan_start + timedelta(days=offset) for offset in range(days)]
+    occupied = {}
+    for day in horizon_dates:
+        midnight = datetime.combine(day, datetime.min.time())
+        starts = sorted(rng.sample(range(8 * 60, 21 * 60, 60), rng.randint(0, 6)))
+        occupied[day] = [
+            (midnight + timedelta(minutes=start), midnight + timedelta(minutes=start + rng.choice([30, 60])))
+            for start in starts
+        ]
+    existing = {
+        day: int(sum((end - start).total_seconds() // 60 for start, end in intervals))
+        for day, intervals in occupied.items()
+    }
+    tasks = [
+        dict(
+            id=i,
+            title=f"Task {i}",
+            duration_minutes=rng.choice([30, 45, 60, 90, 120, 180]),
+            deadline=datetime.combine(plan_start + timedelta(days=rng.randint(0, days - 1)), datetime.min.time())
+            + timedelta(hours=20),
+            task_type=rng.choice(["study", "work", "meeting", "personal", "admin"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(n_tasks)
+    ]
+    return tasks, horizon_dates, occupied, existing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time schedule_horizon's priority-ordered pass over a long horizon.")
+    parser.add_argument("--tasks", type=int, default=1500)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    model = get_priority_model()
+    tasks, horizon_dates, occupied, existing = _workload(random.Random(0), args.tasks, args.days)
+    samples = []
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        scheduled_by_day, unscheduled, _ = schedule_horizon(
+            tasks,
+            "worker",
+            horizon_dates,
+            occupied_intervals_by_day=occupied,
+            existing_minutes_by_day=existing,
+            model=model,
+            search_budget_ms=0,
+        )
+        samples.append((time.perf_counter() - started) * 1000.0)
+    placed = sum(len(entries) for entries in scheduled_by_day.values())
+    print(
+        f"{args.tasks} tasks over {args.days} days: median {statistics.median(samples):.1f} ms, "
+        f"{placed} placed, {len(unscheduled)} unscheduled"
+    )
+
+
+if __name__ == "__main__":
+    main()
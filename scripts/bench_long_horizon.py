@@ -0,0 +1,90 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend import models, schemas
+from backend.database import Base
+from backend.routers import planning
+
+
+def _session(plan_date: date, horizon_days: int, tasks_per_day: int, seed: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    origin = datetime.combine(plan_date, datetime.min.time())
+    with SessionLocal() as db:
+        user = models.User(
+            email="bench@example.com",
+            name="Bench",
+            profile=models.UserProfile.worker,
+            hashed_password="not-used",
+        )
+        db.add(user)
+        db.flush()
+        db.add(
+            models.UserSettings(
+                user_id=user.id,
+                working_hours_start="08:00",
+                working_hours_end="22:00",
+                default_planning_horizon_hours=horizon_days * 24,
+            )
+        )
+        db.add_all(
+            models.Task(
+                user_id=user.id,
+                title=f"Task {day}.{i}",
+                duration_minutes=rng.choice([30, 45, 60, 90]),
+                deadline=origin + timedelta(days=day, hours=rng.randint(12, 21)),
+                task_type=rng.choice(["study", "work", "meeting", "personal", "admin"]),
+                importance=rng.choice(["low", "medium", "high"]),
+                preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+                energy=rng.choice(["low", "medium", "high"]),
+                status=models.TaskStatus.pending,
+            )
+            for day in range(horizon_days)
+            for i in range(tasks_per_day)
+        )
+        db.commit()
+        user_id = user.id
+    return SessionLocal, user_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time and peak memory of plan generation per horizon length.")
+    parser.add_argument("--horizons", type=int, nargs="+", default=[7, 30, 90])
+    parser.add_argument("--tasks-per-day", type=int, default=8)
+    args = parser.parse_args()
+
+    plan_date = date.today()
+    for horizon_days in args.horizons:
+        SessionLocal, user_id = _session(plan_date, horizon_days, args.tasks_per_day, seed=1)
+        with SessionLocal() as db:
+            user = db.get(models.User, user_id)
+            tracemalloc.start()
+            started = time.perf_counter()
+            out = planning._generate_plan_impl(schemas.PlanRequest(date=plan_date), db, user)
+            elapsed = (time.perf_counter() - started) * 1000.0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            placed = db.query(models.PlanItem).count()
+        print(
+            f"{horizon_days:>3} days: {elapsed:8.1f} ms, peak {peak / 1024:8.0f} KiB, "
+            f"{placed} items placed, {len(out.unscheduled)} unscheduled"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend import models
+from backend.app import app
+from backend.database import Base
+from backend.dependencies import get_current_user, get_db
+from backend.ml import get_priority_model
+from backend.routers.tasks import rank_tasks
+
+
+def _backlog_session(n_tasks: int, seed: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    with SessionLocal() as db:
+        user = models.User(
+            email="bench@example.com",
+            name="Bench",
+            profile=models.UserProfile.worker,
+            hashed_password="not-used",
+        )
+        db.add(user)
+        db.commit()
+        db.execute(
+            insert(models.Task),
+            [
+                dict(
+                    user_id=user.id,
+                    title=f"Task {i}",
+                    duration_minutes=rng.choice([15, 30, 45, 60, 90, 120]),
+                    deadline=now + timedelta(hours=rng.uniform(1, 24 * 21)),
+                    task_type=rng.choice(["study", "work", "meeting", "personal", "social", "admin"]),
+                    importance=rng.choice(["low", "medium", "high"]),
+                    preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+                    energy=rng.choice(["low", "medium", "high"]),
+                    status=models.TaskStatus.pending,
+                )
+                for i in range(n_tasks)
+            ],
+        )
+        db.commit()
+        user_id = user.id
+    return SessionLocal, user_id
+
+
+def _median_ms(fn, repeats: int) -> float:
+    fn()
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time ranking a large task backlog by learned priority.")
+    parser.add_argument("--tasks", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=15)
+    args = parser.parse_args()
+
+    SessionLocal, user_id = _backlog_session(args.tasks, seed=1)
+    get_priority_model()
+
+    with SessionLocal() as db:
+        user = db.get(models.User, user_id)
+        handler_ms = _median_ms(lambda: rank_tasks(date.today(), None, db, user), args.repeats)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda db=Depends(get_db): db.get(models.User, user_id)
+    client = TestClient(app)
+    request_ms = _median_ms(lambda: client.get("/api/v1/tasks/ranked"), args.repeats)
+    app.dependency_overrides.clear()
+
+    print(f"{args.tasks} tasks: DB load + scoring + sort {handler_ms:.1f} ms, full request {request_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend import models, schemas
+from backend.database import Base
+from backend.routers import planning
+
+
+def _task(rng: random.Random, user_id: int, title: str, deadline: datetime, duration_minutes: int) -> models.Task:
+    return models.Task(
+        user_id=user_id,
+        title=title,
+        duration_minutes=duration_minutes,
+        deadline=deadline,
+        task_type=rng.choice(["study", "work", "meeting", "personal", "admin"]),
+        importance=rng.choice(["low", "medium", "high"]),
+        preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+        energy=rng.choice(["low", "medium", "high"]),
+        status=models.TaskStatus.pending,
+    )
+
+
+def _planned_session(plan_date: date, n_tasks: int, seed: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    origin = datetime.combine(plan_date, datetime.min.time())
+    with SessionLocal() as db:
+        user = models.User(
+            email="bench@example.com",
+            name="Bench",
+            profile=models.UserProfile.worker,
+            hashed_password="not-used",
+        )
+        db.add(user)
+        db.flush()
+        db.add(models.UserSettings(user_id=user.id, working_hours_start="08:00", working_hours_end="22:00"))
+        db.add_all(
+            _task(rng, user.id, f"Task {i}", origin + timedelta(days=i % 7, hours=21), rng.choice([30, 45, 60]))
+            for i in range(n_tasks)
+        )
+        db.commit()
+        planning._generate_plan_impl(schemas.PlanRequest(date=plan_date), db, user)
+        user_id = user.id
+    return SessionLocal, user_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time adding one task: full horizon plan vs incremental replan.")
+    parser.add_argument("--tasks", type=int, default=60, help="Tasks already planned across the horizon.")
+    parser.add_argument("--repeats", type=int, default=30)
+    args = parser.parse_args()
+
+    plan_date = date.today()
+    origin = datetime.combine(plan_date, datetime.min.time())
+    timings = {}
+    for mode in ("full", "replan"):
+        SessionLocal, user_id = _planned_session(plan_date, args.tasks, seed=1)
+        rng = random.Random(2)
+        samples = []
+        for i in range(args.repeats):
+            with SessionLocal() as db:
+                user = db.get(models.User, user_id)
+                task = _task(rng, user_id, f"New {i}", origin + timedelta(days=1, hours=21), 15)
+                db.add(task)
+                db.commit()
+                started = time.perf_counter()
+                if mode == "full":
+                    planning._generate_plan_impl(schemas.PlanRequest(date=plan_date), db, user)
+                else:
+                    planning._replan_impl(schemas.ReplanRequest(date=plan_date, task_id=task.id), db, user)
+                samples.append((time.perf_counter() - started) * 1000.0)
+        timings[mode] = statistics.median(samples)
+        print(f"{mode:>6}: median {timings[mode]:.2f} ms over {args.repeats} added tasks")
+    print(f"speedup {timings['full'] / timings['replan']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
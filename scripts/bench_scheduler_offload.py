@@ -0,0 +1,94 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml import generate_horizon_schedule, get_priority_model
+from backend.scheduler_pool import SchedulerPool
+
+
+def _plan_kwargs(rng: random.Random, plan_date: date, n_tasks: int) -> dict:
+    origin = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i,
+            title=f"Task {i}",
+            duration_minutes=rng.choice([30, 45, 60, 90]),
+            deadline=origin + timedelta(days=rng.randint(0, 6), hours=rng.randint(12, 21)),
+            task_type=rng.choice(["study", "work", "meeting", "personal", "admin"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(n_tasks)
+    ]
+    return dict(
+        tasks=tasks,
+        user_profile="worker",
+        plan_dates=[plan_date + timedelta(days=offset) for offset in range(7)],
+        feedback_bias=({}, 0.0),
+        start_hour=8,
+        end_hour=22,
+        search_budget_ms=50.0,
+    )
+
+
+def _light_request_ms(samples: int) -> list[float]:
+    # stands in for auth or task CRUD: a request arrives every 5 ms and does a little Python work;
+    # its latency includes waiting to get the GIL back after the sleep
+    latencies = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        time.sleep(0.005)
+        sorted(str(i) for i in range(2000))
+        latencies.append((time.perf_counter() - started) * 1000.0 - 5.0)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latency of light requests while plans compute inline vs in processes.")
+    parser.add_argument("--planners", type=int, default=4, help="Concurrent plan computations.")
+    parser.add_argument("--tasks", type=int, default=120)
+    parser.add_argument("--samples", type=int, default=300)
+    args = parser.parse_args()
+
+    get_priority_model()
+    plan_date = date.today()
+    for processes in (0, 2):
+        pool = SchedulerPool(processes=processes, max_pending=args.planners)
+        if processes:
+            pool.run(get_priority_model)  # let the workers start before timing
+        stop = threading.Event()
+
+        def plan_loop(seed: int) -> None:
+            rng = random.Random(seed)
+            while not stop.is_set():
+                kwargs = _plan_kwargs(rng, plan_date + timedelta(days=rng.randint(0, 1000)), args.tasks)
+                pool.run(generate_horizon_schedule, **kwargs)
+
+        planners = [threading.Thread(target=plan_loop, args=(seed,)) for seed in range(args.planners)]
+        for thread in planners:
+            thread.start()
+        time.sleep(0.2)
+        latencies = sorted(_light_request_ms(args.samples))
+        stop.set()
+        for thread in planners:
+            thread.join()
+        runs = pool.metrics()["runs"]
+        pool.shutdown()
+        print(
+            f"processes={processes}: light request median {statistics.median(latencies):.2f} ms, "
+            f"p95 {latencies[int(0.95 * len(latencies))]:.2f} ms, {runs} plans computed"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml import generate_schedule, get_priority_model
+
+
+def _make_day(rng: random.Random, plan_date: date, n_tasks: int):
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i + 1,
+            title=f"Task {i + 1}",
+            duration_minutes=rng.choice([15, 25, 30, 45, 60, 90]),
+            deadline=day_start + timedelta(hours=rng.uniform(12, 96)),
+            task_type=rng.choice(["study", "work", "meeting", "personal", "social", "admin"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(n_tasks)
+    ]
+    occupied = []
+    for _ in range(3):
+        start = day_start + timedelta(hours=rng.randint(9, 19), minutes=rng.choice([0, 10, 20, 40]))
+        occupied.append((start, start + timedelta(minutes=rng.choice([20, 35, 60]))))
+    return tasks, occupied
+
+
+def _time_plans(days, slot_minutes: int, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for plan_date, tasks, occupied in days:
+            generate_schedule(
+                tasks,
+                user_profile="worker",
+                plan_date=plan_date,
+                start_hour=8,
+                end_hour=22,
+                occupied=occupied,
+                slot_minutes=slot_minutes,
+            )
+        samples.append((time.perf_counter() - started) / len(days))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare plan latency across slot sizes.")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per planned day.")
+    parser.add_argument("--days", type=int, default=50, help="Distinct days per measurement.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    get_priority_model()
+    rng = random.Random(0)
+    start = date(2025, 3, 3)
+    days = [
+        (start + timedelta(days=i), *_make_day(rng, start + timedelta(days=i), args.tasks))
+        for i in range(args.days)
+    ]
+
+    baseline = _time_plans(days, 30, args.repeats)
+    print(f"30-minute slots: {baseline * 1000:.2f} ms per day ({args.tasks} tasks)")
+    for slot_minutes in (15, 5):
+        latency = _time_plans(days, slot_minutes, args.repeats)
+        print(
+            f"{slot_minutes:>2}-minute slots: {latency * 1000:.2f} ms per day "
+            f"({latency / baseline:.2f}x of 30-minute)"
+        )
+
+
+if __name__ == "__main__":
+    main()
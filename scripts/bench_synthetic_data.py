@@ -0,0 +1,42 @@
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml.data_gen import (
+    generate_synthetic_columns,
+    generate_synthetic_columns_parallel,
+    generate_synthetic_dataset,
+)
+
+
+def _seconds(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Synthetic training data: per-row dicts vs NumPy columns.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--stress-rows", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    random.seed(0)
+    rows_s = _seconds(lambda: generate_synthetic_dataset(args.rows))
+    cols_s = _seconds(lambda: generate_synthetic_columns(args.rows, seed=0))
+    print(f"{args.rows} rows: dicts {rows_s * 1e3:8.1f} ms  columns {cols_s * 1e3:8.1f} ms  speedup {rows_s / cols_s:.1f}x")
+
+    serial_s = _seconds(lambda: generate_synthetic_columns_parallel(args.stress_rows, seed=0, workers=1))
+    parallel_s = _seconds(lambda: generate_synthetic_columns_parallel(args.stress_rows, seed=0, workers=args.workers))
+    print(f"{args.stress_rows} rows: 1 process {serial_s:6.2f} s  pool {parallel_s:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+from datetime import datetime, timedelta
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+# The hot queries of the planning and feedback routers, with the parameters
+# they are run with. Kept as SQL so the plans below read like the statements.
+HOT_QUERIES = {
+    "plan: pending tasks (anti-join)": """
+        SELECT tasks.id FROM tasks
+        WHERE tasks.user_id = :user_id
+          AND tasks.deadline >= :day_start AND tasks.deadline <= :lookahead_end
+          AND tasks.status IN ('pending', 'unscheduled')
+          AND NOT EXISTS (
+            SELECT plan_items.id FROM plan_items JOIN plans ON plan_items.plan_id = plans.id
+            WHERE plan_items.task_id = tasks.id AND plans.user_id = :user_id
+              AND plans.plan_date IN (:day_start, :day_after)
+          )
+    """,
+    "plan: unscheduled tasks": """
+        SELECT tasks.id FROM tasks
+        WHERE tasks.user_id = :user_id AND tasks.status = 'unscheduled' AND tasks.deadline >= :day_start
+    """,
+    "plan: horizon plans": """
+        SELECT plans.id FROM plans
+        WHERE plans.user_id = :user_id AND plans.plan_date >= :day_start AND plans.plan_date <= :week_end
+    """,
+    "plan: horizon items": """
+        SELECT plan_items.id, tasks.title FROM plan_items LEFT OUTER JOIN tasks ON tasks.id = plan_items.task_id
+        WHERE plan_items.plan_id IN (:plan_id, :plan_id_2) ORDER BY plan_items.position
+    """,
+    "plan: feedback bias": """
+        SELECT feedback_bias.key FROM feedback_bias WHERE feedback_bias.user_id = :user_id
+    """,
+    "calendar: plan rows": """
+        SELECT plans.id, plan_items.id, tasks.title FROM plans
+        LEFT OUTER JOIN plan_items ON plan_items.plan_id = plans.id
+        LEFT OUTER JOIN tasks ON tasks.id = plan_items.task_id
+        WHERE plans.user_id = :user_id AND plans.plan_date >= :day_start AND plans.plan_date <= :month_end
+        ORDER BY plans.plan_date, plan_items.position, plan_items.id
+    """,
+    "move_plan_items: moved items": """
+        SELECT plan_items.id, plans.id, tasks.title FROM plan_items
+        JOIN plans ON plan_items.plan_id = plans.id
+        LEFT OUTER JOIN tasks ON tasks.id = plan_items.task_id
+        WHERE plan_items.id IN (:item_id, :item_id_2) AND plans.user_id = :user_id
+    """,
+    "move_plan_items: target plans": """
+        SELECT plans.id FROM plans WHERE plans.user_id = :user_id AND plans.plan_date IN (:day_start, :day_after)
+    """,
+    "move_plan_items: other items of the days": """
+        SELECT plan_items.id, plan_items.plan_id, plan_items.task_id, plan_items.start_datetime,
+               plan_items.end_datetime, plan_items.explanation, tasks.title
+        FROM plan_items LEFT OUTER JOIN tasks ON plan_items.task_id = tasks.id
+        WHERE plan_items.plan_id IN (:plan_id, :plan_id_2) AND plan_items.id NOT IN (:item_id, :item_id_2)
+    """,
+    "feedback: list": """
+        SELECT feedback_logs.id FROM feedback_logs
+        WHERE feedback_logs.user_id = :user_id ORDER BY feedback_logs.created_at DESC
+    """,
+}
+
+
+def _ts(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _seed(conn, rng: random.Random, users: int, tasks: int, days: int, items_per_day: int, feedback: int) -> None:
+    origin = datetime(2025, 1, 1)
+    now = _ts(origin)
+    conn.exec_driver_sql(
+        "INSERT INTO users (id, email, name, profile, role, timezone, hashed_password, is_active, token_version) "
+        "VALUES (?, ?, ?, 'worker', 'user', 'UTC', 'x', 1, 0)",
+        [(u, f"user{u}@example.com", f"User {u}") for u in range(1, users + 1)],
+    )
+    statuses = ("pending", "pending", "scheduled", "completed", "unscheduled")
+    conn.exec_driver_sql(
+        "INSERT INTO tasks (id, user_id, title, duration_minutes, deadline, task_type, importance, "
+        "preferred_time, energy, status, created_at, updated_at) "
+        "VALUES (?, ?, ?, 30, ?, 'work', 'medium', 'anytime', 'medium', ?, ?, ?)",
+        [
+            (
+                t,
+                rng.randint(1, users),
+                f"Task {t}",
+                _ts(origin + timedelta(minutes=rng.randint(0, 180 * 24 * 60))),
+                rng.choice(statuses),
+                now,
+                now,
+            )
+            for t in range(1, tasks + 1)
+        ],
+    )
+    conn.exec_driver_sql(
+        "INSERT INTO plans (id, user_id, plan_date, created_at, model_version, status) "
+        "VALUES (?, ?, ?, ?, 'priority_model_v1', 'generated')",
+        [
+            ((u - 1) * days + d + 1, u, _ts(origin + timedelta(days=d)), now)
+            for u in range(1, users + 1)
+            for d in range(days)
+        ],
+    )
+    conn.exec_driver_sql(
+        "INSERT INTO plan_items (plan_id, task_id, start_datetime, end_datetime, position, source) "
+        "VALUES (?, ?, ?, ?, ?, 'ai')",
+        [
+            (
+                plan_id,
+                rng.randint(1, tasks),
+                _ts(origin + timedelta(days=(plan_id - 1) % days, hours=8 + i)),
+                _ts(origin + timedelta(days=(plan_id - 1) % days, hours=8 + i, minutes=45)),
+                i,
+            )
+            for plan_id in range(1, users * days + 1)
+            for i in range(items_per_day)
+        ],
+    )
+    conn.exec_driver_sql(
+        "INSERT INTO feedback_logs (user_id, task_id, outcome, created_at) VALUES (?, ?, ?, ?)",
+        [
+            (rng.randint(1, users), rng.randint(1, tasks), rng.choice((-1, 1)), _ts(origin - timedelta(hours=f)))
+            for f in range(feedback)
+        ],
+    )
+    conn.exec_driver_sql(
+        "INSERT INTO feedback_bias (user_id, key, weighted_sum, weight, updated_at) VALUES (?, ?, 0.5, 1.0, ?)",
+        [(u, key, now) for u in range(1, users + 1) for key in ("total", "energy:medium", "preferred_time:anytime")],
+    )
+    conn.exec_driver_sql("ANALYZE")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Print EXPLAIN QUERY PLAN for the planning hot queries.")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=30, help="Plans per user.")
+    parser.add_argument("--items-per-day", type=int, default=5)
+    parser.add_argument("--feedback", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # the schema comes from the migrations, so this checks what production gets
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(tmp, 'explain.db').as_posix()}"
+        from alembic import command
+        from alembic.config import Config
+        from sqlalchemy import create_engine, text
+
+        config = Config(str(REPO_ROOT / "alembic.ini"))
+        config.set_main_option("script_location", str(REPO_ROOT / "alembic"))
+        command.upgrade(config, "head")
+
+        engine = create_engine(os.environ["DATABASE_URL"])
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            _seed(conn, random.Random(0), args.users, args.tasks, args.days, args.items_per_day, args.feedback)
+        print(f"seeded {args.tasks} tasks for {args.users} users in {time.perf_counter() - started:.1f}s\n")
+
+        day_start = datetime(2025, 1, 10)
+        params = {
+            "user_id": 1,
+            "day_start": _ts(day_start),
+            "day_after": _ts(day_start + timedelta(days=1)),
+            "week_end": _ts(day_start + timedelta(days=6)),
+            "month_end": _ts(day_start + timedelta(days=30)),
+            "lookahead_end": _ts(day_start + timedelta(days=14)),
+            "plan_id": 10,
+            "plan_id_2": 11,
+            "item_id": 46,
+            "item_id_2": 51,
+        }
+        table_scans = []
+        with engine.connect() as conn:
+            for name, sql in HOT_QUERIES.items():
+                rows = conn.execute(text("EXPLAIN QUERY PLAN " + " ".join(sql.split())), params).fetchall()
+                print(name)
+                for row in rows:
+                    detail = row[-1]
+                    print(f"  {detail}")
+                    if detail.startswith("SCAN") and "CONSTANT ROW" not in detail:
+                        table_scans.append((name, detail))
+                print()
+
+    if table_scans:
+        print("table scans:")
+        for name, detail in table_scans:
+            print(f"  {name}: {detail}")
+        sys.exit(1)
+    print("no table scans")
+
+
+if __name__ == "__main__":
+    main()
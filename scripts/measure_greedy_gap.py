@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.append(str(REPO_ROOT))
+
+from backend.ml import get_priority_model, schedule_day
+
+
+def _make_day(rng: random.Random, plan_date: date, n_tasks: int):
+    day_start = datetime.combine(plan_date, datetime.min.time())
+    tasks = [
+        dict(
+            id=i + 1,
+            title=f"Task {i + 1}",
+            duration_minutes=rng.choice([15, 25, 30, 45, 60, 90]),
+            deadline=day_start + timedelta(hours=rng.uniform(12, 96)),
+            task_type=rng.choice(["study", "work", "meeting", "personal", "social", "admin"]),
+            importance=rng.choice(["low", "medium", "high"]),
+            preferred_time=rng.choice(["morning", "afternoon", "evening", "anytime"]),
+            energy=rng.choice(["low", "medium", "high"]),
+        )
+        for i in range(n_tasks)
+    ]
+    occupied = []
+    for _ in range(3):
+        start = day_start + timedelta(hours=rng.randint(9, 19), minutes=rng.choice([0, 10, 20, 40]))
+        occupied.append((start, start + timedelta(minutes=rng.choice([20, 35, 60]))))
+    return tasks, occupied
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure how far greedy and local search are from the exact day plan.")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[6, 10, 15], help="Tasks per planned day.")
+    parser.add_argument("--days", type=int, default=30, help="Distinct days per task count.")
+    parser.add_argument("--slot-minutes", type=int, default=30)
+    parser.add_argument("--budget-ms", type=float, default=70.0, help="Exact search time limit per day.")
+    args = parser.parse_args()
+
+    model = get_priority_model()
+    start = date(2025, 3, 3)
+    for n_tasks in args.tasks:
+        rng = random.Random(n_tasks)
+        greedy_gaps, search_gaps, latencies, proven = [], [], [], 0
+        for i in range(args.days):
+            plan_date = start + timedelta(days=i)
+            tasks, occupied = _make_day(rng, plan_date, n_tasks)
+            greedy, searched = {}, {}
+            schedule_day(
+                tasks, "worker", plan_date, occupied_intervals=occupied, model=model,
+                slot_minutes=args.slot_minutes, search_budget_ms=0, search_stats=greedy,
+                exact=True, exact_budget_ms=args.budget_ms,
+            )
+            started = time.perf_counter()
+            schedule_day(
+                tasks, "worker", plan_date, occupied_intervals=occupied, model=model,
+                slot_minutes=args.slot_minutes, search_stats=searched,
+                exact=True, exact_budget_ms=args.budget_ms,
+            )
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            best_cost = min(greedy["exact"]["final_cost"], searched["exact"]["final_cost"])
+            greedy_gaps.append(greedy["initial_cost"] - best_cost)
+            search_gaps.append(searched["final_cost"] - best_cost)
+            proven += searched["exact"]["optimal"]
+        print(
+            f"{n_tasks:>2} tasks: greedy gap {statistics.mean(greedy_gaps):.2f}, "
+            f"local search gap {statistics.mean(search_gaps):.2f}, "
+            f"proven optimal {proven}/{args.days}, "
+            f"best-quality latency median {statistics.median(latencies):.1f} ms / max {max(latencies):.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()